@@ -0,0 +1,74 @@
+import asyncio
+import logging
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from time import monotonic
+
+from redis.asyncio import Redis
+
+logger = logging.getLogger(__name__)
+
+
+class LocalCache[KeyType: Hashable, ValueType]:
+    """Bounded in-process cache with LRU eviction and per-entry ttl."""
+
+    def __init__(self, max_size: int, ttl: float) -> None:
+        self._max_size = max_size
+        self._ttl = ttl
+        self._data: OrderedDict[KeyType, tuple[float, ValueType]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        """Get number of cached entries."""
+        return len(self._data)
+
+    def get(self, key: KeyType) -> ValueType | None:
+        """Get value or none if missing or expired."""
+        item = self._data.get(key)
+
+        if item is None or item[0] < monotonic():
+            if item is not None:
+                del self._data[key]
+            self.misses += 1
+            return None
+
+        self._data.move_to_end(key)
+        self.hits += 1
+        return item[1]
+
+    def set(self, key: KeyType, value: ValueType) -> None:
+        """Set value evicting least recently used entries over the size limit."""
+        if self._max_size <= 0:
+            return None
+
+        self._data[key] = (monotonic() + self._ttl, value)
+        self._data.move_to_end(key)
+
+        while len(self._data) > self._max_size:
+            self._data.popitem(last=False)
+
+    def invalidate(self, key: KeyType) -> None:
+        """Remove value."""
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all values."""
+        self._data.clear()
+
+
+async def listen_invalidations(
+    client: Redis, channel: str, invalidate: Callable[[str], None]
+) -> None:
+    """Invalidate local state, like cache entries, on messages published to redis channel."""
+    while True:
+        try:
+            async with client.pubsub(ignore_subscribe_messages=True) as pubsub:
+                await pubsub.subscribe(channel)
+                async for message in pubsub.listen():
+                    invalidate(message["data"])
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.exception("Invalidation listener on '%s' failed, reconnecting", channel)
+            await asyncio.sleep(1)
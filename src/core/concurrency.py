@@ -0,0 +1,195 @@
+import asyncio
+import logging
+from collections.abc import AsyncIterator, Hashable
+from contextlib import asynccontextmanager
+from typing import Literal
+from uuid import uuid4
+
+from redis.asyncio import Redis
+from redis.exceptions import LockError
+
+logger = logging.getLogger(__name__)
+
+type CancelPolicy = Literal["none", "pending", "all"]
+
+
+class UserBusyError(Exception):
+    """User turn lock is not acquired in time, turn should be retried later."""
+
+
+class KeyedLock:
+    """In-process lock per key, released locks are dropped."""
+
+    def __init__(self) -> None:
+        self._locks: dict[Hashable, asyncio.Lock] = {}
+        self._waiters: dict[Hashable, int] = {}
+
+    @asynccontextmanager
+    async def acquire(self, key: Hashable) -> AsyncIterator[None]:
+        """Hold lock for key."""
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        self._waiters[key] = self._waiters.get(key, 0) + 1
+
+        try:
+            async with lock:
+                yield
+        finally:
+            self._waiters[key] -= 1
+            if not self._waiters[key]:
+                del self._waiters[key]
+                del self._locks[key]
+
+
+class UserLock:
+    """Per-user lock serializing turns within process and across workers."""
+
+    def __init__(self, client: Redis, timeout: float, blocking_timeout: float) -> None:
+        self._client = client
+        self._timeout = timeout
+        self._blocking_timeout = blocking_timeout
+        self._local_lock = KeyedLock()
+
+    @asynccontextmanager
+    async def hold(self, user_tg_id: int) -> AsyncIterator[None]:
+        """Hold user lock, raise busy error if redis lock is not acquired in time."""
+        async with self._local_lock.acquire(user_tg_id):
+            lock = self._client.lock(
+                name=f"user_lock:{user_tg_id}",
+                timeout=self._timeout,
+                blocking_timeout=self._blocking_timeout,
+            )
+
+            try:
+                acquired = await lock.acquire()
+            except LockError:
+                acquired = False
+
+            # Running unlocked would let turns of other workers overwrite each other's history
+            if not acquired:
+                raise UserBusyError(f"User '{user_tg_id}' lock not acquired")
+
+            try:
+                yield
+            finally:
+                try:
+                    await lock.release()
+                except LockError:
+                    logger.warning("User '%d' lock expired before release", user_tg_id)
+
+
+class MessageCoalescer:
+    """Merge messages of one user arriving within debounce window into one turn."""
+
+    def __init__(self, window: float) -> None:
+        self._window = window
+        self._pending: dict[int, list[str]] = {}
+
+    async def collect(self, user_tg_id: int, message: str) -> str | None:
+        """Return merged messages to the first caller, none to the ones merged into it."""
+        if self._window <= 0:
+            return message
+
+        if (pending := self._pending.get(user_tg_id)) is not None:
+            pending.append(message)
+            return None
+
+        self._pending[user_tg_id] = [message]
+        try:
+            await asyncio.sleep(self._window)
+        finally:
+            messages = self._pending.pop(user_tg_id)
+
+        if len(messages) > 1:
+            logger.info("User '%d' messages coalesced: %d", user_tg_id, len(messages))
+
+        return "\n".join(messages)
+
+
+class Generation:
+    """Assistant turn in flight."""
+
+    def __init__(self, task: asyncio.Task[object]) -> None:
+        self.task = task
+        self.streaming = False  # Part of response already shown to user
+        self.cancelled = False
+
+
+class GenerationRegistry:
+    """Per-user registry of assistant turns in flight, cancelled when superseded.
+
+    User actions invalidating the turn context, like /start or new CEFR level, cancel
+    turns by action policy: "pending" spares turns already streaming to the user, "all"
+    cancels them too and "none" keeps every turn. Cancelling the turn task aborts its
+    queued or running inference request. Turns of the user running in other workers are
+    cancelled by request published to redis channel every worker listens to.
+    """
+
+    def __init__(self, policies: dict[str, CancelPolicy], client: Redis, channel: str) -> None:
+        self._policies = policies
+        self._client = client
+        self._channel = channel
+        self._id = uuid4().hex  # Skips requests published by this worker
+        self._generations: dict[int, set[Generation]] = {}
+        self.cancelled: dict[str, int] = {}
+
+    @asynccontextmanager
+    async def track(self, user_tg_id: int) -> AsyncIterator[Generation]:
+        """Register current task as user turn, ending it quietly if it gets superseded."""
+        task = asyncio.current_task()
+        if task is None:
+            raise RuntimeError("Generation must run in a task")
+
+        generation = Generation(task)
+        self._generations.setdefault(user_tg_id, set()).add(generation)
+
+        try:
+            yield generation
+        except asyncio.CancelledError:
+            if not generation.cancelled:
+                raise
+            task.uncancel()
+            logger.info("User '%d' turn cancelled", user_tg_id)
+        finally:
+            generations = self._generations[user_tg_id]
+            generations.discard(generation)
+            if not generations:
+                del self._generations[user_tg_id]
+
+    async def publish_cancel(self, user_tg_id: int, action: str) -> int:
+        """Cancel user turns superseded by action here and request other workers to do so."""
+        count = self.cancel(user_tg_id=user_tg_id, action=action)
+        if self._policies.get(action, "none") != "none":
+            await self._client.publish(self._channel, f"{self._id}:{user_tg_id}:{action}")
+        return count
+
+    def receive_cancel(self, message: str) -> None:
+        """Cancel user turns on request published by another worker."""
+        sender, user_tg_id, action = message.split(":", 2)
+        if sender != self._id:
+            self.cancel(user_tg_id=int(user_tg_id), action=action)
+
+    def cancel(self, user_tg_id: int, action: str) -> int:
+        """Cancel user turns of this worker superseded by action according to its policy."""
+        policy = self._policies.get(action, "none")
+        if policy == "none":
+            return 0
+
+        count = 0
+        for generation in self._generations.get(user_tg_id, ()):
+            if generation.cancelled or (policy == "pending" and generation.streaming):
+                continue
+
+            generation.cancelled = True
+            generation.task.cancel()
+            count += 1
+
+        if count:
+            self.cancelled[action] = self.cancelled.get(action, 0) + count
+            logger.info(
+                "User '%d' %s cancelled %d turns, %d in total",
+                user_tg_id,
+                action,
+                count,
+                self.cancelled[action],
+            )
+        return count
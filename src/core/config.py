@@ -1,14 +1,34 @@
 from pathlib import Path
-from typing import Self
+from typing import Literal, Self
 
 import yaml
-from pydantic import BaseModel, SecretStr
+from pydantic import BaseModel, Field, SecretStr, model_validator
+
+
+class WebhookSettings(BaseModel):
+    """Telegram webhook settings."""
+
+    url: str  # Public base url Telegram sends updates to
+    path: str = "/webhook"
+    host: str = "127.0.0.1"
+    port: int = 8080
+    secret_token: SecretStr
+    workers: int = Field(default=1, ge=1)  # Processes sharing the port behind reverse proxy
 
 
 class BotSettings(BaseModel):
     """Base bot settings."""
 
     token: SecretStr
+    mode: Literal["polling", "webhook"] = "polling"
+    webhook: WebhookSettings | None = None
+
+    @model_validator(mode="after")
+    def check_webhook(self) -> Self:
+        """Require webhook settings in webhook mode."""
+        if self.mode == "webhook" and self.webhook is None:
+            raise ValueError("Webhook settings are required in webhook mode")
+        return self
 
 
 class LoggerSettings(BaseModel):
@@ -47,6 +67,12 @@ class ContextSettings(BaseModel):
     port: int
     ttl: int
     max_history_length: int  # Number of messages
+    max_connections: int = 50
+    pool_timeout: float = 5.0  # Seconds to wait for free connection in exhausted pool
+    socket_timeout: float = 5.0  # Seconds
+    socket_connect_timeout: float = 5.0  # Seconds
+    health_check_interval: int = 30  # Seconds
+    known_users_filter: bool = True  # Skip database on repeated /start
 
     @property
     def url(self) -> str:
@@ -54,6 +80,135 @@ class ContextSettings(BaseModel):
         return f"redis://{self.user}:{self.password.get_secret_value()}@{self.host}:{self.port}"
 
 
+class CacheSettings(BaseModel):
+    """In-process cache settings."""
+
+    enabled: bool = True
+    max_size: int = 10000  # Number of entries
+    ttl: float = 300.0  # Seconds
+    invalidation_channel: str = "cache_invalidation"
+
+
+class ResponseCacheSettings(BaseModel):
+    """Assistant response cache settings."""
+
+    enabled: bool = False
+    ttl: int = 86400  # Seconds
+    max_entries: int = 10000
+    max_temperature: float = 0.3  # Responses sampled at higher temperature are not cached
+    max_history_length: int = 1  # Messages after system prompts, 1 caches conversation openers
+
+
+class GatewaySettings(BaseModel):
+    """Inference gateway settings."""
+
+    max_concurrency: int = 32  # Inference calls in flight per process
+    max_queue_size: int = 256  # Requests waiting for a slot before busy answer
+    queue_timeout: float = 30.0  # Seconds to wait for a slot and rate budget
+    requests_per_minute: int = 0  # Shared across workers, 0 disables the limit
+    tokens_per_minute: int = 0  # Shared across workers, 0 disables the limit
+    max_user_queue_size: int = 4  # Requests one user may have waiting
+    quantum: int = Field(default=1024, gt=0)  # Tokens credited to user per scheduling round
+    default_weight: int = Field(default=1, gt=0)
+    premium_weight: int = Field(default=2, gt=0)
+    admin_weight: int = Field(default=4, gt=0)
+    premium_users: set[int] = set()  # Telegram ids
+    stats_size: int = Field(default=10000, gt=0)  # Users with tracked wait statistics
+
+
+class BackendSettings(BaseModel):
+    """Inference backend settings."""
+
+    name: str
+    model: str
+    kind: Literal["remote", "local"] = "remote"
+    base_url: str | None = None  # Hugging Face router if not set
+    token: SecretStr | None = None  # Assistant token if not set
+    weight: float = 1.0  # Higher weight makes backend preferred at equal latency
+    cost: float = 0.0  # Seconds added to backend latency score
+    model_path: str | None = None  # Quantized GGUF model file of local backend
+    server_path: str = "llama-server"  # llama.cpp server executable of local backend
+    port: int = 8081  # Local server port
+    parallel: int = Field(default=4, ge=1)  # Requests decoded together in one local batch
+    threads: int = 4  # CPU threads of local server
+    start_timeout: float = 120.0  # Seconds for local server to load model
+
+
+class RouterSettings(BaseModel):
+    """Inference router settings."""
+
+    ewma_alpha: float = 0.3  # Weight of the latest call in latency and error rate averages
+    failure_threshold: int = 5  # Failures in a row ejecting backend
+    open_timeout: float = 30.0  # Seconds before ejected backend is probed
+
+
+class RouteSettings(BaseModel):
+    """Assistant route settings."""
+
+    name: str
+    model: str
+    max_tokens: int
+    temperature: float
+    cefr_levels: set[str] = set()  # Lowercase levels like "a1", any level if empty
+    max_message_length: int | None = None  # User message characters, any length if not set
+
+
+class OutboundSettings(BaseModel):
+    """Outgoing Telegram requests settings."""
+
+    enabled: bool = True
+    global_rate: float = 30.0  # Requests per second across all chats
+    chat_rate: float = 1.0  # Messages per second to one chat
+    chat_burst: int = 1  # Messages sent to idle chat without waiting
+    typing_interval: float = 4.0  # Seconds repeated typing action is skipped
+    max_retry_after: float = 30.0  # Longest flood wait in seconds requests are retried after
+    chats_size: int = 10000  # Chats with tracked limits
+    chat_ttl: float = 60.0  # Seconds idle chat limits are kept, above max retry after
+
+
+class BroadcastSettings(BaseModel):
+    """Admin broadcast settings."""
+
+    rate: float = 20.0  # Messages per second, below global limit to leave room for replies
+    batch_size: int = 500  # Users fetched per cursor batch and checkpointed together
+    report_interval: float = 5.0  # Seconds between progress reports
+    lock_timeout: float = 60.0  # Seconds before lock of crashed broadcast expires
+    max_attempts: int = 3  # Sends to one user before transient error stops broadcast
+    retry_delay: float = 1.0  # Seconds before second send, doubled every retry
+
+
+class ReminderSettings(BaseModel):
+    """Practice reminder settings."""
+
+    enabled: bool = True
+    workers: int = 2  # Worker coroutines per process claiming due reminders
+    batch_size: int = 100  # Reminders claimed at once
+    poll_interval: float = 1.0  # Seconds between checks when no reminder is due
+    lease: float = 300.0  # Seconds before reminder claimed by crashed worker is claimed again
+    inactivity: int = 72000  # Seconds since last practice before learner is reminded
+    default_timezone: str = "Europe/Moscow"  # Used when user gives reminder time only
+
+
+class ArchiveSettings(BaseModel):
+    """Chat message archive settings."""
+
+    enabled: bool = True
+    batch_size: int = 500  # Messages written per insert
+    flush_interval: float = 5.0  # Seconds between writes of partial batch
+    max_buffer_size: int = 50000  # Messages kept while database is down, oldest dropped beyond
+    rehydrate: bool = True  # Load history expired in redis back from archive
+
+
+class CancelSettings(BaseModel):
+    """Superseded assistant turn cancellation settings."""
+
+    # "pending" spares turns already streaming to user, "all" cancels them too
+    start: Literal["none", "pending", "all"] = "all"
+    language: Literal["none", "pending", "all"] = "all"
+    cefr_level: Literal["none", "pending", "all"] = "all"
+    channel: str = "turn_cancellation"  # Redis channel of cancel requests between workers
+
+
 class AssistantSettings(BaseModel):
     """AI assistant settings."""
 
@@ -61,6 +216,38 @@ class AssistantSettings(BaseModel):
     token: SecretStr
     max_tokens: int
     temperature: float
+    context_budget: int = 4096  # Tokens for system prompt, history and response
+    max_connections: int = 100
+    keepalive_timeout: float = 60.0  # Seconds
+    connect_timeout: float = 10.0  # Seconds
+    read_timeout: float = 60.0  # Seconds
+    stream: bool = False
+    stream_edit_interval: float = 1.0  # Seconds between message edits
+    stream_edit_min_chars: int = 40  # New characters required for message edit
+    debounce_window: float = 0.0  # Seconds to merge user messages into one turn
+    turn_lock_timeout: float = 120.0  # Seconds before user lock expires
+    turn_lock_wait: float = 60.0  # Seconds to wait for previous user turn
+    attempt_timeout: float = 30.0  # Seconds per inference attempt
+    max_attempts: int = 3
+    backoff_base: float = 0.5  # Seconds, doubled every retry
+    backoff_max: float = 8.0  # Seconds
+    hedge: bool = False  # Duplicate slow request to the next best backend
+    hedge_min_samples: int = 20  # Observed calls before p90 latency is trusted
+    latency_window: int = 200  # Latest calls p90 latency is computed from
+    backends: list[BackendSettings] = []  # Assistant model alone if empty
+    routes: list[RouteSettings] = []  # First matching route wins, assistant defaults otherwise
+    summary_threshold: int = 0  # History messages starting summarization, 0 disables it
+    summary_keep: int = 6  # Latest messages kept verbatim when history is summarized
+    summary_max_tokens: int = 256
+
+    @model_validator(mode="after")
+    def check_route_models(self) -> Self:
+        """Require every route model to be served by a backend."""
+        served = {backend.model for backend in self.backends} or {self.model}
+        missing = {self.model, *(route.model for route in self.routes)} - served
+        if missing:
+            raise ValueError(f"No inference backend serves models {sorted(missing)}")
+        return self
 
 
 class Settings(BaseModel):
@@ -70,8 +257,36 @@ class Settings(BaseModel):
     logger: LoggerSettings
     database: DatabaseSettings
     context: ContextSettings
+    cache: CacheSettings = CacheSettings()
+    response_cache: ResponseCacheSettings = ResponseCacheSettings()
+    gateway: GatewaySettings = GatewaySettings()
+    router: RouterSettings = RouterSettings()
+    cancel: CancelSettings = CancelSettings()
+    outbound: OutboundSettings = OutboundSettings()
+    broadcast: BroadcastSettings = BroadcastSettings()
+    reminders: ReminderSettings = ReminderSettings()
+    archive: ArchiveSettings = ArchiveSettings()
     assistant: AssistantSettings
 
+    @model_validator(mode="after")
+    def check_summary_threshold(self) -> Self:
+        """Require summarization to start before history is trimmed."""
+        if self.assistant.summary_threshold >= self.context.max_history_length:
+            raise ValueError("Summary threshold must be below max history length")
+        return self
+
+    @model_validator(mode="after")
+    def check_local_backends(self) -> Self:
+        """Require single process when it starts local inference servers."""
+        webhook = self.bot.webhook if self.bot.mode == "webhook" else None
+        workers = webhook.workers if webhook else 1
+        if workers > 1 and any(backend.kind == "local" for backend in self.assistant.backends):
+            raise ValueError(
+                "Local inference backends start server per process, "
+                "serve them as remote backends with multiple webhook workers"
+            )
+        return self
+
     @classmethod
     def from_yaml(cls, path: Path) -> Self:
         """Load settings from yaml file."""
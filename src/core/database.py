@@ -1,4 +1,5 @@
-from collections.abc import AsyncGenerator
+import logging
+from collections.abc import AsyncGenerator, Awaitable, Callable
 
 from sqlalchemy.ext.asyncio import (
     AsyncSession,
@@ -8,6 +9,8 @@ from sqlalchemy.ext.asyncio import (
 
 from src.core.config import settings
 
+logger = logging.getLogger(__name__)
+
 async_engine = create_async_engine(url=settings.database.url)
 
 async_session_maker = async_sessionmaker(
@@ -22,3 +25,46 @@ async def get_async_session() -> AsyncGenerator[AsyncSession]:
     """Get async session."""
     async with async_session_maker() as session:
         yield session
+
+
+class UnitOfWork:
+    """Unit of work sharing one lazily opened session between repositories."""
+
+    def __init__(self, session_factory: async_sessionmaker[AsyncSession]) -> None:
+        self._session_factory = session_factory
+        self._session: AsyncSession | None = None
+        self._after_commit: list[Callable[[], Awaitable[None]]] = []
+
+    def after_commit(self, callback: Callable[[], Awaitable[None]]) -> None:
+        """Run callback once the transaction is committed, drop it on rollback."""
+        self._after_commit.append(callback)
+
+    def get_session(self) -> AsyncSession:
+        """Get session, opening it on first use."""
+        if self._session is None:
+            self._session = self._session_factory()
+        return self._session
+
+    async def commit(self) -> None:
+        """Commit transaction if session was opened."""
+        if self._session is not None:
+            await self._session.commit()
+
+        callbacks, self._after_commit = self._after_commit, []
+        for callback in callbacks:
+            try:
+                await callback()
+            except Exception:
+                logger.exception("Callback after commit failed")
+
+    async def rollback(self) -> None:
+        """Roll back transaction if session was opened."""
+        self._after_commit = []
+        if self._session is not None:
+            await self._session.rollback()
+
+    async def close(self) -> None:
+        """Close session returning connection to pool."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
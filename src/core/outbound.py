@@ -0,0 +1,217 @@
+import asyncio
+import logging
+from collections import deque
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from time import monotonic
+from typing import TYPE_CHECKING, cast
+
+from aiogram.client.session.middlewares.base import BaseRequestMiddleware, NextRequestMiddlewareType
+from aiogram.exceptions import TelegramRetryAfter
+from aiogram.methods import SendChatAction, TelegramMethod
+from aiogram.methods.base import Response, TelegramType
+
+from src.core.cache import LocalCache
+from src.core.config import settings
+
+if TYPE_CHECKING:
+    from aiogram import Bot
+
+logger = logging.getLogger(__name__)
+
+# Requests sent within bulk traffic block wait behind interactive replies
+_bulk: ContextVar[bool] = ContextVar("_bulk", default=False)
+
+
+@contextmanager
+def bulk_traffic() -> Iterator[None]:
+    """Mark Telegram requests made inside the block as bulk traffic."""
+    token = _bulk.set(True)
+    try:
+        yield
+    finally:
+        _bulk.reset(token)
+
+
+class TokenBucket:
+    """Token bucket handing out reservations, so waiters are served in arrival order."""
+
+    def __init__(self, rate: float, capacity: float) -> None:
+        self._rate = rate
+        self._capacity = capacity
+        self._tokens = capacity
+        self._updated_at = monotonic()
+
+    def reserve(self) -> float:
+        """Take token, return seconds to wait before it may be used."""
+        self._refill()
+        self._tokens -= 1
+        return max(0.0, -self._tokens / self._rate)
+
+    def delay(self) -> float:
+        """Get seconds until a token is available without taking it."""
+        self._refill()
+        return max(0.0, (1 - self._tokens) / self._rate)
+
+    def pause(self, seconds: float) -> None:
+        """Hand out no tokens for given seconds."""
+        self._refill()
+        self._tokens = min(self._tokens, -seconds * self._rate)
+
+    def _refill(self) -> None:
+        """Add tokens earned since last update."""
+        now = monotonic()
+        self._tokens = min(self._capacity, self._tokens + (now - self._updated_at) * self._rate)
+        self._updated_at = now
+
+
+class OutboundLimiter(BaseRequestMiddleware):
+    """Bot session middleware keeping outgoing chat requests within Telegram limits.
+
+    Requests to a chat wait for the chat token bucket and then for the global one,
+    where interactive replies are served before bulk traffic. Typing actions repeated
+    while the previous one is still shown are answered locally. Flood wait replies
+    pause the chat, other chats keep going. Requests wait in the paused chat queue and
+    are sent again once the wait is over, so replies already saved to history are still
+    delivered. Flood waits above the retry limit fail right away.
+    """
+
+    INTERACTIVE = 0
+    BULK = 1
+
+    def __init__(
+        self,
+        global_rate: float,
+        chat_rate: float,
+        chat_burst: int,
+        typing_interval: float,
+        max_retry_after: float,
+        chats: LocalCache[int | str, TokenBucket],
+        typing: LocalCache[tuple[int | str, str], float],
+    ) -> None:
+        self._global_bucket = TokenBucket(global_rate, global_rate)
+        self._chat_rate = chat_rate
+        self._chat_burst = chat_burst
+        self._typing_interval = typing_interval
+        self._max_retry_after = max_retry_after
+        self._chats = chats
+        self._typing = typing
+        self._waiters: tuple[deque[asyncio.Future[None]], ...] = (deque(), deque())
+        self._pump: asyncio.Task[None] | None = None
+        self.coalesced = 0
+        self.retried = 0
+
+    async def __call__(
+        self,
+        make_request: NextRequestMiddlewareType[TelegramType],
+        bot: "Bot",
+        method: TelegramMethod[TelegramType],
+    ) -> Response[TelegramType]:
+        """Send request within chat and global limits."""
+        chat_id: int | str | None = getattr(method, "chat_id", None)
+        if chat_id is None:
+            return await make_request(bot, method)
+
+        is_typing = isinstance(method, SendChatAction)
+        if is_typing and self._is_typing_shown(chat_id, cast(SendChatAction, method).action):
+            self.coalesced += 1
+            # Chain returns method result, true for chat action
+            return cast(Response[TelegramType], True)
+
+        is_bulk = _bulk.get()
+        priority = self.BULK if is_bulk else self.INTERACTIVE
+        while True:
+            # Chat actions do not count towards chat message limit
+            if not is_typing:
+                await asyncio.sleep(self._get_chat_bucket(chat_id).reserve())
+            await self._acquire(priority)
+
+            try:
+                return await make_request(bot, method)
+            except TelegramRetryAfter as e:
+                self._get_chat_bucket(chat_id).pause(e.retry_after)
+                logger.warning(
+                    "Flood wait %ds for chat '%s' on %s",
+                    e.retry_after,
+                    chat_id,
+                    type(method).__name__,
+                )
+
+                # Typing is cosmetic and a long wait would make reply latency unbounded
+                if is_typing:
+                    return cast(Response[TelegramType], True)
+                if e.retry_after > self._max_retry_after:
+                    raise
+                self.retried += 1
+
+    def _is_typing_shown(self, chat_id: int | str, action: str) -> bool:
+        """Check whether chat action was sent recently, recording it otherwise."""
+        now = monotonic()
+        sent_at = self._typing.get((chat_id, action))
+        if sent_at is not None and now - sent_at < self._typing_interval:
+            return True
+
+        self._typing.set((chat_id, action), now)
+        return False
+
+    def _get_chat_bucket(self, chat_id: int | str) -> TokenBucket:
+        """Get token bucket of chat."""
+        bucket = self._chats.get(chat_id)
+        if bucket is None:
+            bucket = TokenBucket(self._chat_rate, self._chat_burst)
+            self._chats.set(chat_id, bucket)
+        return bucket
+
+    async def _acquire(self, priority: int) -> None:
+        """Wait for global token, interactive waiters first."""
+        if not any(self._waiters) and not self._global_bucket.delay():
+            self._global_bucket.reserve()
+            return
+
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._waiters[priority].append(future)
+        if self._pump is None or self._pump.done():
+            self._pump = asyncio.create_task(self._serve_waiters())
+
+        try:
+            await future
+        finally:
+            if not future.done():
+                future.cancel()
+
+    async def _serve_waiters(self) -> None:
+        """Hand out global tokens to waiters as they become available."""
+        while any(self._waiters):
+            if delay := self._global_bucket.delay():
+                await asyncio.sleep(delay)
+                continue
+
+            for waiters in self._waiters:
+                # Skip waiters cancelled by their callers
+                while waiters and waiters[0].done():
+                    waiters.popleft()
+                if waiters:
+                    self._global_bucket.reserve()
+                    waiters.popleft().set_result(None)
+                    break
+
+
+def create_outbound_limiter() -> OutboundLimiter:
+    """Create outbound limiter, global rate shared by webhook worker processes."""
+    webhook = settings.bot.webhook
+    workers = webhook.workers if settings.bot.mode == "webhook" and webhook else 1
+
+    return OutboundLimiter(
+        global_rate=settings.outbound.global_rate / workers,
+        chat_rate=settings.outbound.chat_rate,
+        chat_burst=settings.outbound.chat_burst,
+        typing_interval=settings.outbound.typing_interval,
+        max_retry_after=settings.outbound.max_retry_after,
+        chats=LocalCache[int | str, TokenBucket](
+            max_size=settings.outbound.chats_size, ttl=settings.outbound.chat_ttl
+        ),
+        typing=LocalCache[tuple[int | str, str], float](
+            max_size=settings.outbound.chats_size, ttl=settings.outbound.typing_interval
+        ),
+    )
@@ -1,9 +1,39 @@
+import asyncio
+from collections.abc import AsyncGenerator, AsyncIterable
+from contextlib import suppress
+
 from dishka import Provider, Scope, provide
+from redis.asyncio import Redis
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
-from src.core.database import async_session_maker
+from src.core.cache import LocalCache, listen_invalidations
+from src.core.concurrency import GenerationRegistry, MessageCoalescer, UserLock
+from src.core.config import settings
+from src.core.database import UnitOfWork, async_session_maker
+from src.core.redis import create_redis_pool
+from src.inference.gateway import InferenceGateway, create_inference_gateway
+from src.inference.resilience import ResilientCompletions, create_completions
+from src.inference.router import InferenceRouter, create_inference_router
+from src.inference.routes import RouteTable, create_route_table
+from src.inference.tokens import TokenCounter, load_token_counter
 from src.repositories.user import UserRepository
-from src.services import AssistantService, ContextService, LanguageService, StartService
+from src.schemas.user import UserProfileSchema
+from src.services import (
+    AssistantService,
+    BroadcastService,
+    ContextService,
+    HistoryService,
+    LanguageService,
+    MessageArchive,
+    ProfileService,
+    ReminderScheduler,
+    ReminderService,
+    ResponseCacheService,
+    StartService,
+    SummaryService,
+)
+from src.services.archive import create_message_archive
+from src.services.reminder import create_reminder_scheduler
 
 
 class DatabaseProvider(Provider):
@@ -14,25 +44,147 @@ class DatabaseProvider(Provider):
         """Provide session factory."""
         return async_session_maker
 
+    @provide(scope=Scope.REQUEST)
+    async def provide_unit_of_work(
+        self, session_factory: async_sessionmaker[AsyncSession]
+    ) -> AsyncGenerator[UnitOfWork, BaseException | None]:
+        """Provide unit of work committed once the update is handled."""
+        unit_of_work = UnitOfWork(session_factory)
+        exception = yield unit_of_work
+
+        try:
+            if exception is None:
+                await unit_of_work.commit()
+            else:
+                await unit_of_work.rollback()
+        finally:
+            await unit_of_work.close()
+
+
+class RedisProvider(Provider):
+    """Redis provider."""
+
+    @provide(scope=Scope.APP)
+    async def provide_redis_client(self) -> AsyncIterable[Redis]:
+        """Provide redis client backed by shared connection pool."""
+        client = Redis(connection_pool=create_redis_pool())
+        yield client
+        await client.aclose(close_connection_pool=True)
+
+
+class CacheProvider(Provider):
+    """In-process cache provider."""
+
+    @provide(scope=Scope.APP)
+    async def provide_profile_cache(
+        self, client: Redis
+    ) -> AsyncIterable[LocalCache[int, UserProfileSchema]]:
+        """Provide profile cache invalidated across processes via redis pub/sub."""
+        cache = LocalCache[int, UserProfileSchema](
+            max_size=settings.cache.max_size if settings.cache.enabled else 0,
+            ttl=settings.cache.ttl,
+        )
+        listener = asyncio.create_task(
+            listen_invalidations(
+                client=client,
+                channel=settings.cache.invalidation_channel,
+                invalidate=lambda user_tg_id: cache.invalidate(int(user_tg_id)),
+            )
+        )
+        yield cache
+        listener.cancel()
+        with suppress(asyncio.CancelledError):
+            await listener
+
+
+class ConcurrencyProvider(Provider):
+    """Concurrency provider."""
+
+    @provide(scope=Scope.APP)
+    def provide_user_lock(self, client: Redis) -> UserLock:
+        """Provide per-user turn lock."""
+        return UserLock(
+            client=client,
+            timeout=settings.assistant.turn_lock_timeout,
+            blocking_timeout=settings.assistant.turn_lock_wait,
+        )
+
+    @provide(scope=Scope.APP)
+    def provide_message_coalescer(self) -> MessageCoalescer:
+        """Provide message coalescer."""
+        return MessageCoalescer(window=settings.assistant.debounce_window)
+
+    @provide(scope=Scope.APP)
+    async def provide_generation_registry(self, client: Redis) -> AsyncIterable[GenerationRegistry]:
+        """Provide registry of assistant turns in flight cancelled across workers."""
+        registry = GenerationRegistry(
+            policies=settings.cancel.model_dump(exclude={"channel"}),
+            client=client,
+            channel=settings.cancel.channel,
+        )
+        listener = asyncio.create_task(
+            listen_invalidations(
+                client=client, channel=settings.cancel.channel, invalidate=registry.receive_cancel
+            )
+        )
+        yield registry
+        listener.cancel()
+        with suppress(asyncio.CancelledError):
+            await listener
+
+
+class InferenceProvider(Provider):
+    """Inference provider."""
+
+    @provide(scope=Scope.APP)
+    async def provide_inference_router(self) -> AsyncIterable[InferenceRouter]:
+        """Provide router over inference backends with pooled keep-alive connections."""
+        router = create_inference_router()
+        yield router
+        await router.close()
+
+    @provide(scope=Scope.APP)
+    def provide_completions(self, router: InferenceRouter) -> ResilientCompletions:
+        """Provide chat completions with timeouts, retries and hedging."""
+        return create_completions(router)
+
+    @provide(scope=Scope.APP)
+    def provide_inference_gateway(self, client: Redis) -> InferenceGateway:
+        """Provide inference gateway limiting concurrency and rate of inference calls."""
+        return create_inference_gateway(client)
+
+    @provide(scope=Scope.APP)
+    def provide_route_table(self) -> RouteTable:
+        """Provide assistant route table keyed by CEFR level and message length."""
+        return create_route_table()
+
+    @provide(scope=Scope.APP)
+    async def provide_token_counter(self) -> TokenCounter:
+        """Provide token counter for configured model."""
+        return await asyncio.to_thread(load_token_counter, settings.assistant.model)
+
 
 class RepositoryProvider(Provider):
     """Repository provider."""
 
     @provide(scope=Scope.REQUEST)
-    def provide_user_repository(
-        self, session_factory: async_sessionmaker[AsyncSession]
-    ) -> UserRepository:
+    def provide_user_repository(self, unit_of_work: UnitOfWork) -> UserRepository:
         """Provide user repository."""
-        return UserRepository(session_factory=session_factory)
+        return UserRepository(unit_of_work=unit_of_work)
 
 
 class ServiceProvider(Provider):
     """Service provider."""
 
     @provide(scope=Scope.REQUEST)
-    def provide_start_service(self, repository: UserRepository) -> StartService:
+    def provide_start_service(
+        self,
+        repository: UserRepository,
+        context_service: ContextService,
+        unit_of_work: UnitOfWork,
+    ) -> StartService:
         """Provide start service."""
-        return StartService(repository)
+        return StartService(repository, context_service, unit_of_work)
 
     @provide(scope=Scope.REQUEST)
     def provide_language_service(self, repository: UserRepository) -> LanguageService:
@@ -40,11 +192,92 @@ class ServiceProvider(Provider):
         return LanguageService(repository)
 
     @provide(scope=Scope.REQUEST)
-    def provide_context_service(self) -> ContextService:
+    def provide_context_service(self, client: Redis) -> ContextService:
         """Provide context service."""
-        return ContextService()
+        return ContextService(client)
+
+    @provide(scope=Scope.REQUEST)
+    def provide_profile_service(
+        self,
+        repository: UserRepository,
+        context_service: ContextService,
+        cache: LocalCache[int, UserProfileSchema],
+    ) -> ProfileService:
+        """Provide profile service."""
+        return ProfileService(repository, context_service, cache)
+
+    @provide(scope=Scope.APP)
+    async def provide_broadcast_service(
+        self, session_factory: async_sessionmaker[AsyncSession], client: Redis
+    ) -> AsyncIterable[BroadcastService]:
+        """Provide broadcast service stopping running broadcast on shutdown."""
+        service = BroadcastService(session_factory, client)
+        yield service
+        await service.close()
+
+    @provide(scope=Scope.APP)
+    async def provide_reminder_scheduler(self, client: Redis) -> AsyncIterable[ReminderScheduler]:
+        """Provide reminder scheduler stopping its workers on shutdown."""
+        scheduler = create_reminder_scheduler(client)
+        yield scheduler
+        await scheduler.close()
+
+    @provide(scope=Scope.REQUEST)
+    def provide_reminder_service(
+        self, repository: UserRepository, scheduler: ReminderScheduler, unit_of_work: UnitOfWork
+    ) -> ReminderService:
+        """Provide reminder service."""
+        return ReminderService(repository, scheduler, unit_of_work)
+
+    @provide(scope=Scope.REQUEST)
+    def provide_history_service(self, client: Redis, archive: MessageArchive) -> HistoryService:
+        """Provide history service loading expired history back from archive."""
+        return HistoryService(client, archive if settings.archive.rehydrate else None)
+
+    @provide(scope=Scope.APP)
+    async def provide_summary_service(
+        self, completions: ResilientCompletions, client: Redis, gateway: InferenceGateway
+    ) -> AsyncIterable[SummaryService]:
+        """Provide summary service owning background summarizations."""
+        service = SummaryService(completions, HistoryService(client), gateway)
+        yield service
+        await service.close()
+
+    @provide(scope=Scope.APP)
+    def provide_response_cache(self, client: Redis) -> ResponseCacheService:
+        """Provide response cache counting hits across requests."""
+        return ResponseCacheService(client)
+
+    @provide(scope=Scope.APP)
+    async def provide_message_archive(
+        self, session_factory: async_sessionmaker[AsyncSession]
+    ) -> AsyncIterable[MessageArchive]:
+        """Provide message archive writing pending messages on shutdown."""
+        archive = create_message_archive(session_factory)
+        archive.start()
+        yield archive
+        await archive.close()
 
     @provide(scope=Scope.REQUEST)
-    def provide_assistant_service(self) -> AssistantService:
+    def provide_assistant_service(
+        self,
+        completions: ResilientCompletions,
+        history_service: HistoryService,
+        token_counter: TokenCounter,
+        summary_service: SummaryService,
+        response_cache: ResponseCacheService,
+        gateway: InferenceGateway,
+        route_table: RouteTable,
+        archive: MessageArchive,
+    ) -> AssistantService:
         """Provide assistant service."""
-        return AssistantService()
+        return AssistantService(
+            completions,
+            history_service,
+            token_counter,
+            summary_service,
+            response_cache,
+            gateway,
+            route_table,
+            archive,
+        )
@@ -0,0 +1,20 @@
+from redis.asyncio import BlockingConnectionPool
+
+from src.core.config import settings
+
+
+def create_redis_pool() -> BlockingConnectionPool:
+    """Create redis connection pool shared by the whole application.
+
+    Exhausted pool makes callers wait for a free connection up to the pool timeout,
+    so bursts are slowed down instead of failing right away.
+    """
+    return BlockingConnectionPool.from_url(
+        url=settings.context.url,
+        decode_responses=True,
+        max_connections=settings.context.max_connections,
+        timeout=settings.context.pool_timeout,
+        socket_timeout=settings.context.socket_timeout,
+        socket_connect_timeout=settings.context.socket_connect_timeout,
+        health_check_interval=settings.context.health_check_interval,
+    )
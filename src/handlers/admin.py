@@ -0,0 +1,110 @@
+import logging
+import re
+
+from aiogram import Router
+from aiogram.filters import Command, CommandObject
+from aiogram.types import Message
+from dishka.integrations.aiogram import FromDishka, inject
+
+from src.core.outbound import bulk_traffic
+from src.schemas.broadcast import BroadcastSchema
+from src.services import BroadcastService, ProfileService
+from src.services.broadcast import BroadcastProgress
+from src.texts import messages
+
+router = Router()
+logger = logging.getLogger(__name__)
+
+# Optional user filters followed by broadcast text
+BROADCAST_ARGS_PATTERN = re.compile(r"((?:(?:language|cefr_level)=\S+\s+)*)(.+)", re.DOTALL)
+
+
+@router.message(Command("broadcast"))
+@inject
+async def handle_broadcast_command(
+    message: Message,
+    command: CommandObject,
+    profile_service: FromDishka[ProfileService],
+    broadcast_service: FromDishka[BroadcastService],
+) -> None:
+    """Handle /broadcast admin command."""
+    if not message.from_user or not message.bot:
+        logger.warning("User or bot not found in message '%s'", message)
+        return None
+
+    user_tg_id = message.from_user.id
+    profile = await profile_service.get_user_profile(user_tg_id=user_tg_id)
+    if not profile or not profile.is_admin:
+        logger.warning("User '%d' is not allowed to broadcast", user_tg_id)
+        return None
+
+    args = (command.args or "").strip()
+
+    if args == "cancel":
+        cancelled = await broadcast_service.cancel()
+        await message.answer(
+            messages.BROADCAST_CANCELLED if cancelled else messages.BROADCAST_NOT_FOUND
+        )
+        return None
+
+    if args == "resume":
+        if await broadcast_service.get() is None:
+            await message.answer(messages.BROADCAST_NOT_FOUND)
+            return None
+    else:
+        broadcast = parse_broadcast(args)
+        if broadcast is None:
+            await message.answer(messages.BROADCAST_USAGE)
+            return None
+        if not await broadcast_service.create(broadcast):
+            await message.answer(messages.BROADCAST_ACTIVE)
+            return None
+
+    bot = message.bot
+    status = await message.answer(messages.BROADCAST_STARTED)
+
+    async def send(chat_id: int, text: str) -> None:
+        # Broadcast waits behind interactive replies for Telegram rate budget, text is sent
+        # as typed, since markup it happens to contain would fail for every user
+        with bulk_traffic():
+            await bot.send_message(chat_id=chat_id, text=text, parse_mode=None)
+
+    async def report(progress: BroadcastProgress) -> None:
+        await status.edit_text(format_progress(progress))
+
+    async def finish(progress: BroadcastProgress, stopped: bool) -> None:
+        text = messages.BROADCAST_STOPPED if stopped else messages.BROADCAST_FINISHED
+        await message.answer(text.format(sent=progress.sent, failed=progress.failed))
+
+    # Broadcast runs in background, so the update is not held for hours
+    if not await broadcast_service.start(send=send, report=report, finish=finish):
+        await status.edit_text(messages.BROADCAST_RUNNING)
+        return None
+
+    logger.info("User '%d' started broadcast", user_tg_id)
+
+
+def parse_broadcast(args: str) -> BroadcastSchema | None:
+    """Parse broadcast filters and text from command arguments."""
+    match = BROADCAST_ARGS_PATTERN.fullmatch(args)
+    if not match:
+        return None
+
+    data = {"text": match.group(2)}
+    for option in match.group(1).split():
+        field, value = option.split("=", 1)
+        data[field] = value.lower()
+
+    return BroadcastSchema.model_validate(data)
+
+
+def format_progress(progress: BroadcastProgress) -> str:
+    """Format broadcast progress report."""
+    return messages.BROADCAST_PROGRESS.format(
+        done=progress.done,
+        total=progress.total,
+        sent=progress.sent,
+        failed=progress.failed,
+        rate=progress.rate,
+        eta="—" if progress.eta is None else f"{progress.eta:.0f} с",
+    )
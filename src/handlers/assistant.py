@@ -1,23 +1,43 @@
 import logging
+from collections.abc import AsyncIterator
+from time import monotonic
 
-from aiogram import F, Router
+from aiogram import Bot, F, Router
 from aiogram.types import Message
+from aiogram.utils.chat_action import ChatActionSender
 from dishka.integrations.aiogram import FromDishka, inject
 
-from src.services import AssistantService, ContextService, LanguageService
+from src.core.concurrency import (
+    Generation,
+    GenerationRegistry,
+    MessageCoalescer,
+    UserBusyError,
+    UserLock,
+)
+from src.core.config import settings
+from src.core.database import UnitOfWork
+from src.inference.gateway import InferenceBusyError
+from src.inference.scheduler import get_user_weight
+from src.services import AssistantService, ProfileService, ReminderScheduler
 from src.texts import messages
 
 router = Router()
 logger = logging.getLogger(__name__)
 
+TELEGRAM_MESSAGE_LENGTH = 4096
+
 
 @router.message(F.text)
 @inject
 async def handle_chat_message(
     message: Message,
     assistant_service: FromDishka[AssistantService],
-    context_service: FromDishka[ContextService],
-    language_service: FromDishka[LanguageService],
+    profile_service: FromDishka[ProfileService],
+    user_lock: FromDishka[UserLock],
+    message_coalescer: FromDishka[MessageCoalescer],
+    generation_registry: FromDishka[GenerationRegistry],
+    unit_of_work: FromDishka[UnitOfWork],
+    reminder_scheduler: FromDishka[ReminderScheduler],
 ) -> None:
     """Handle user messages for AI assistant."""
     if not message.from_user:
@@ -31,37 +51,166 @@ async def handle_chat_message(
         logger.warning("User '%s' message is empty", user_tg_id)
         return None
 
-    # Get user language from context or database
-    language = await context_service.get_context(prefix="user_language", user_tg_id=user_tg_id)
+    # Get user language and CEFR level from context or database
+    profile = await profile_service.get_user_profile(user_tg_id=user_tg_id)
+
+    language = profile.language if profile else None
     if not language:
-        language = await language_service.get_user_language(user_tg_id=user_tg_id)
-        if not language:
-            await message.answer(messages.SELECT_LANGUAGE_SKILLS.format(skill="язык"))
-            return None
+        await message.answer(messages.SELECT_LANGUAGE_SKILLS.format(skill="язык"))
+        return None
 
-    # Get CEFR level from context or database
-    cefr_level = await context_service.get_context(prefix="user_cefr_level", user_tg_id=user_tg_id)
+    cefr_level = profile.cefr_level if profile else None
     if not cefr_level:
-        cefr_level = await language_service.get_user_cefr_level(user_tg_id=user_tg_id)
-        if not cefr_level:
-            await message.answer(
-                messages.SELECT_LANGUAGE_SKILLS.format(skill="уровень владения языком")
-            )
-            return None
+        await message.answer(
+            messages.SELECT_LANGUAGE_SKILLS.format(skill="уровень владения языком")
+        )
+        return None
 
     if not message.bot:
         logger.warning("Bot not found in message '%s'", message)
         return None
 
+    # Learner practising today is not reminded
+    if settings.reminders.enabled:
+        await reminder_scheduler.touch(user_tg_id=user_tg_id)
+
+    # Release database connection before waiting for other turns and assistant
+    await unit_of_work.commit()
+
+    # Track turn so user actions changing its context can cancel it
+    async with generation_registry.track(user_tg_id=user_tg_id) as generation:
+        # Merge messages sent in quick succession into one turn
+        user_message = await message_coalescer.collect(user_tg_id=user_tg_id, message=user_message)
+        if user_message is None:
+            return None
+
+        try:
+            # Serialize user turns so concurrent messages do not overwrite each other's history
+            async with user_lock.hold(user_tg_id=user_tg_id):
+                await answer_assistant(
+                    message=message,
+                    bot=message.bot,
+                    assistant_service=assistant_service,
+                    user_tg_id=user_tg_id,
+                    user_message=user_message,
+                    language=language,
+                    cefr_level=cefr_level,
+                    weight=get_user_weight(
+                        user_tg_id=user_tg_id, is_admin=bool(profile and profile.is_admin)
+                    ),
+                    generation=generation,
+                )
+        except (InferenceBusyError, UserBusyError) as e:
+            logger.warning("Assistant busy for user '%d': %s", user_tg_id, e)
+            await message.answer(getattr(messages, f"{language.upper()}_BUSY_MESSAGE"))
+
+
+async def answer_assistant(
+    message: Message,
+    bot: Bot,
+    assistant_service: AssistantService,
+    user_tg_id: int,
+    user_message: str,
+    language: str,
+    cefr_level: str,
+    weight: int = 1,
+    generation: Generation | None = None,
+) -> None:
+    """Answer message with assistant response."""
+    if settings.assistant.stream:
+        # Keep typing action while response is streamed
+        async with ChatActionSender.typing(bot=bot, chat_id=message.chat.id):
+            stream = assistant_service.stream_chat(
+                user_tg_id=user_tg_id,
+                message=user_message,
+                language=language,
+                cefr_level=cefr_level,
+                weight=weight,
+            )
+            if not await answer_stream(message, stream, generation):
+                await message.answer(getattr(messages, f"{language.upper()}_ERROR_MESSAGE"))
+        return None
+
     # Show typing action
-    await message.bot.send_chat_action(chat_id=message.chat.id, action="typing")
+    await bot.send_chat_action(chat_id=message.chat.id, action="typing")
 
     # Get response from assistant
     response = await assistant_service.chat(
-        user_tg_id=user_tg_id, message=user_message, language=language, cefr_level=cefr_level
+        user_tg_id=user_tg_id,
+        message=user_message,
+        language=language,
+        cefr_level=cefr_level,
+        weight=weight,
     )
 
     if response:
         await message.answer(response)
     else:
         await message.answer(getattr(messages, f"{language.upper()}_ERROR_MESSAGE"))
+
+
+async def answer_stream(
+    message: Message, stream: AsyncIterator[str], generation: Generation | None = None
+) -> str:
+    """Answer message with streamed text using throttled progressive edits, return sent text.
+
+    Partial text may contain unbalanced markup, so streamed messages are sent without parse mode.
+    Text exceeding Telegram message length is continued in next messages.
+    """
+    text = ""
+    part = ""
+    shown_text = ""
+    sent_message: Message | None = None
+    sent = False
+    last_edit = 0.0
+
+    async for chunk in stream:
+        text += chunk
+        part += chunk
+
+        # Complete full message and continue reply in next one
+        while len(part) > TELEGRAM_MESSAGE_LENGTH:
+            head, part = split_message(part)
+            if sent_message is None:
+                await message.answer(head, parse_mode=None)
+            elif head != shown_text:
+                await sent_message.edit_text(head, parse_mode=None)
+            sent_message = None
+            shown_text = ""
+            sent = True
+            if generation is not None:
+                generation.streaming = True
+
+        if sent_message is None:
+            if part.strip():
+                shown_text = part
+                sent_message = await message.answer(shown_text, parse_mode=None)
+                sent = True
+                last_edit = monotonic()
+                if generation is not None:
+                    generation.streaming = True
+            continue
+
+        # Respect Telegram edit limits
+        if (
+            monotonic() - last_edit >= settings.assistant.stream_edit_interval
+            and len(part) - len(shown_text) >= settings.assistant.stream_edit_min_chars
+        ):
+            shown_text = part
+            await sent_message.edit_text(shown_text, parse_mode=None)
+            last_edit = monotonic()
+
+    if sent_message is not None and part != shown_text:
+        await sent_message.edit_text(part, parse_mode=None)
+
+    return text if sent else ""
+
+
+def split_message(text: str) -> tuple[str, str]:
+    """Split text into message fitting Telegram length and rest, preferring line or word break."""
+    cut = text.rfind("\n", 0, TELEGRAM_MESSAGE_LENGTH + 1)
+    if cut < TELEGRAM_MESSAGE_LENGTH // 2:
+        cut = text.rfind(" ", 0, TELEGRAM_MESSAGE_LENGTH + 1)
+    if cut <= 0:
+        cut = TELEGRAM_MESSAGE_LENGTH
+    return text[:cut], text[cut:].lstrip()
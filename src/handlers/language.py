@@ -5,8 +5,10 @@ from aiogram import F, Router
 from aiogram.types import CallbackQuery
 from dishka.integrations.aiogram import FromDishka, inject
 
+from src.core.concurrency import GenerationRegistry
+from src.core.database import UnitOfWork
 from src.keyboards.language import get_cefr_keyboard
-from src.services import ContextService, LanguageService
+from src.services import ContextService, LanguageService, ProfileService
 from src.texts import messages
 
 router = Router()
@@ -19,6 +21,9 @@ async def handle_language_selection(
     callback: CallbackQuery,
     language_service: FromDishka[LanguageService],
     context_service: FromDishka[ContextService],
+    profile_service: FromDishka[ProfileService],
+    generation_registry: FromDishka[GenerationRegistry],
+    unit_of_work: FromDishka[UnitOfWork],
 ) -> None:
     """Handle language selection."""
     callback_data = callback.data
@@ -35,6 +40,13 @@ async def handle_language_selection(
         language_service.set_user_language(user_tg_id=user_tg_id, language=language),
         context_service.set_context(prefix="user_language", user_tg_id=user_tg_id, data=language),
     )
+    # Invalidate once saved, otherwise other processes could cache profile being replaced
+    unit_of_work.after_commit(
+        lambda: profile_service.invalidate_user_profile(user_tg_id=user_tg_id)
+    )
+
+    # Turns in flight were built for previous language
+    await generation_registry.publish_cancel(user_tg_id=user_tg_id, action="language")
 
     await callback.answer()
 
@@ -54,6 +66,9 @@ async def handle_cefr_level_selection(
     callback: CallbackQuery,
     language_service: FromDishka[LanguageService],
     context_service: FromDishka[ContextService],
+    profile_service: FromDishka[ProfileService],
+    generation_registry: FromDishka[GenerationRegistry],
+    unit_of_work: FromDishka[UnitOfWork],
 ) -> None:
     """Handle CEFR level selection."""
     callback_data = callback.data
@@ -80,6 +95,13 @@ async def handle_cefr_level_selection(
             prefix="user_cefr_level", user_tg_id=user_tg_id, data=cerf_level
         ),
     )
+    # Invalidate once saved, otherwise other processes could cache profile being replaced
+    unit_of_work.after_commit(
+        lambda: profile_service.invalidate_user_profile(user_tg_id=user_tg_id)
+    )
+
+    # Turns in flight were built for previous CEFR level
+    await generation_registry.publish_cancel(user_tg_id=user_tg_id, action="cefr_level")
 
     await callback.answer()
 
@@ -0,0 +1,84 @@
+import logging
+import re
+from datetime import datetime, time
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+from aiogram import Bot, Router
+from aiogram.exceptions import TelegramForbiddenError
+from aiogram.filters import Command, CommandObject
+from aiogram.types import Message
+from dishka.integrations.aiogram import FromDishka, inject
+
+from src.core.config import settings
+from src.core.outbound import bulk_traffic
+from src.services import ReminderService
+from src.texts import messages
+
+router = Router()
+logger = logging.getLogger(__name__)
+
+# Local time optionally followed by IANA timezone
+REMINDER_ARGS_PATTERN = re.compile(r"(\d{1,2}:\d{2})(?:\s+(\S+))?")
+
+
+@router.message(Command("remind"))
+@inject
+async def handle_remind_command(
+    message: Message, command: CommandObject, reminder_service: FromDishka[ReminderService]
+) -> None:
+    """Handle /remind command."""
+    if not message.from_user:
+        logger.warning("User not found in message '%s'", message)
+        return None
+
+    user_tg_id = message.from_user.id
+    args = (command.args or "").strip()
+
+    if args == "off":
+        await reminder_service.disable_reminder(user_tg_id=user_tg_id)
+        await message.answer(messages.REMINDER_DISABLED)
+        return None
+
+    reminder = parse_reminder(args)
+    if reminder is None:
+        await message.answer(messages.REMINDER_USAGE)
+        return None
+
+    reminder_time, timezone = reminder
+    if not await reminder_service.set_reminder(
+        user_tg_id=user_tg_id, reminder_time=reminder_time, timezone=timezone
+    ):
+        await message.answer(messages.REMINDER_NOT_STARTED)
+        return None
+
+    await message.answer(
+        messages.REMINDER_SET.format(time=f"{reminder_time:%H:%M}", timezone=timezone)
+    )
+
+
+def parse_reminder(args: str) -> tuple[time, str] | None:
+    """Parse reminder local time and timezone from command arguments."""
+    match = REMINDER_ARGS_PATTERN.fullmatch(args)
+    if not match:
+        return None
+
+    timezone = match.group(2) or settings.reminders.default_timezone
+    try:
+        reminder_time = datetime.strptime(match.group(1), "%H:%M").time()
+        ZoneInfo(timezone)
+    except (ValueError, ZoneInfoNotFoundError):
+        return None
+
+    return reminder_time, timezone
+
+
+async def send_reminder(bot: Bot, user_tg_id: int) -> bool:
+    """Send practice reminder, return false if user blocked bot."""
+    # Reminders wait behind interactive replies for Telegram rate budget
+    with bulk_traffic():
+        try:
+            await bot.send_message(chat_id=user_tg_id, text=messages.REMINDER)
+        except TelegramForbiddenError:
+            logger.info("User '%d' blocked bot, reminder dropped", user_tg_id)
+            return False
+    return True
@@ -5,6 +5,7 @@ from aiogram.filters import CommandStart
 from aiogram.types import Message
 from dishka.integrations.aiogram import FromDishka, inject
 
+from src.core.concurrency import GenerationRegistry
 from src.keyboards.language import get_language_keyboard
 from src.schemas.user import UserSchema
 from src.services import StartService
@@ -16,12 +17,19 @@ logger = logging.getLogger(__name__)
 
 @router.message(CommandStart())
 @inject
-async def handle_start_command(message: Message, start_service: FromDishka[StartService]) -> None:
+async def handle_start_command(
+    message: Message,
+    start_service: FromDishka[StartService],
+    generation_registry: FromDishka[GenerationRegistry],
+) -> None:
     """Handle /start command."""
     if not message.from_user:
         logger.warning("User not found in message '%s'", message)
         return None
 
+    # Restart supersedes assistant turns in flight
+    await generation_registry.publish_cancel(user_tg_id=message.from_user.id, action="start")
+
     # Create user object
     user = UserSchema(
         tg_id=message.from_user.id,
@@ -0,0 +1,152 @@
+import asyncio
+import inspect
+from contextvars import ContextVar
+from typing import Any, Protocol
+
+from aiohttp import ClientResponse, ClientSession, ClientTimeout, TCPConnector
+from huggingface_hub import AsyncInferenceClient
+
+from src.core.config import settings
+
+# Sessions opened by the current inference call
+_call_sessions: ContextVar[list[ClientSession] | None] = ContextVar("_call_sessions", default=None)
+
+# Private hooks of the base client overridden below with the parameters they must accept
+OVERRIDDEN_METHODS = {
+    "_get_client_session": ["self", "headers"],
+    "_inner_post": ["self", "request_parameters", "stream"],
+}
+
+
+def check_base_client() -> None:
+    """Fail if the installed huggingface_hub no longer has the overridden private hooks."""
+    for name, parameters in OVERRIDDEN_METHODS.items():
+        method = getattr(AsyncInferenceClient, name, None)
+        if method is None or list(inspect.signature(method).parameters) != parameters:
+            raise ImportError(
+                f"AsyncInferenceClient.{name} changed in huggingface_hub, "
+                "PooledInferenceClient must be updated"
+            )
+
+
+class CompletionClientProtocol(Protocol):
+    """Protocol for inference backend client."""
+
+    async def create(self, messages: list[dict[str, str]], model: str, **kwargs: Any) -> Any:
+        """Create chat completion, or open completion stream if stream is set."""
+        ...
+
+    async def close(self) -> None:
+        """Release client resources."""
+        ...
+
+
+check_base_client()
+
+
+class PooledInferenceClient(AsyncInferenceClient):
+    """Inference client reusing one pooled keep-alive connector for all requests.
+
+    The base client opens a new aiohttp session with its own connector for every call,
+    so each completion pays connection setup and TLS handshake again. Here every
+    session borrows the shared connector and closing it only releases connections back
+    to the pool.
+    """
+
+    def __init__(self, connector: TCPConnector, timeout: ClientTimeout, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        if not isinstance(getattr(self, "_sessions", None), dict):
+            raise RuntimeError("AsyncInferenceClient no longer tracks sessions in '_sessions'")
+        self._connector = connector
+        self._client_timeout = timeout
+
+    def _get_client_session(self, headers: dict[str, str] | None = None) -> ClientSession:
+        """Get session bound to the shared connector."""
+        session = ClientSession(
+            headers={**self.headers, **(headers or {})},
+            cookies=self.cookies,
+            timeout=self._client_timeout,
+            trust_env=self.trust_env,
+            connector=self._connector,
+            connector_owner=False,
+        )
+        responses: set[ClientResponse] = set()
+        self._sessions[session] = responses
+
+        # Track responses to close unfinished streams together with the session
+        request = session._request
+
+        async def _request(*args: Any, **kwargs: Any) -> ClientResponse:
+            response = await request(*args, **kwargs)
+            responses.add(response)
+            return response
+
+        close = session.close
+
+        async def _close() -> None:
+            for response in responses:
+                response.close()
+            await close()
+            self._sessions.pop(session, None)
+
+        session._request = _request  # type: ignore[method-assign]
+        session.close = _close  # type: ignore[method-assign]
+
+        if (call_sessions := _call_sessions.get()) is not None:
+            call_sessions.append(session)
+        return session
+
+    async def _inner_post(self, *args: Any, **kwargs: Any) -> Any:
+        """Make request, closing its session if the call is cancelled.
+
+        The base client only closes the session on errors, so a cancelled call, like a
+        losing hedged request, would keep its pooled connection checked out.
+        """
+        call_sessions: list[ClientSession] = []
+        token = _call_sessions.set(call_sessions)
+
+        try:
+            return await super()._inner_post(*args, **kwargs)
+        except asyncio.CancelledError:
+            for session in call_sessions:
+                await asyncio.shield(session.close())
+            raise
+        finally:
+            _call_sessions.reset(token)
+
+    async def close(self) -> None:
+        """Close open sessions and the shared connector."""
+        await super().close()  # type: ignore[no-untyped-call]
+        await self._connector.close()
+
+
+class RemoteCompletionClient:
+    """Completion client calling remote inference endpoint over HTTP."""
+
+    def __init__(self, client: AsyncInferenceClient) -> None:
+        self._client = client
+
+    async def create(self, messages: list[dict[str, str]], model: str, **kwargs: Any) -> Any:
+        """Create chat completion, or open completion stream if stream is set."""
+        return await self._client.chat.completions.create(model=model, messages=messages, **kwargs)
+
+    async def close(self) -> None:
+        """Close client sessions and connections."""
+        await self._client.close()  # type: ignore[no-untyped-call]
+
+
+def create_inference_client(base_url: str | None, token: str) -> PooledInferenceClient:
+    """Create inference client for backend, Hugging Face router if base url is not set."""
+    return PooledInferenceClient(
+        connector=TCPConnector(
+            limit=settings.assistant.max_connections,
+            keepalive_timeout=settings.assistant.keepalive_timeout,
+            enable_cleanup_closed=True,
+        ),
+        timeout=ClientTimeout(
+            connect=settings.assistant.connect_timeout,
+            sock_read=settings.assistant.read_timeout,
+        ),
+        token=token,
+        base_url=base_url,
+    )
@@ -0,0 +1,204 @@
+import asyncio
+import logging
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from src.core.config import settings
+from src.inference.scheduler import FairScheduler
+
+logger = logging.getLogger(__name__)
+
+# Take tokens from every bucket only if all of them have enough, otherwise return wait seconds
+TOKEN_BUCKET_SCRIPT = """
+local time = redis.call('TIME')
+local now = tonumber(time[1]) + tonumber(time[2]) / 1000000
+local wait = 0
+local levels = {}
+
+for i, key in ipairs(KEYS) do
+    local capacity = tonumber(ARGV[i * 2 - 1])
+    local requested = math.min(tonumber(ARGV[i * 2]), capacity)
+    local rate = capacity / 60
+    local state = redis.call('HMGET', key, 'tokens', 'updated_at')
+    local tokens = tonumber(state[1]) or capacity
+    local updated_at = tonumber(state[2]) or now
+
+    tokens = math.min(capacity, tokens + math.max(0, now - updated_at) * rate)
+    if tokens < requested then
+        wait = math.max(wait, (requested - tokens) / rate)
+    end
+    levels[i] = tokens - requested
+end
+
+if wait > 0 then
+    return tostring(wait)
+end
+
+for i, key in ipairs(KEYS) do
+    redis.call('HSET', key, 'tokens', tostring(levels[i]), 'updated_at', tostring(now))
+    redis.call('EXPIRE', key, 120)
+end
+return '0'
+"""
+
+
+class InferenceBusyError(Exception):
+    """Inference capacity is exhausted, request should be retried later."""
+
+
+class RateLimiter:
+    """Requests and tokens per minute buckets shared across workers via redis."""
+
+    REQUESTS_KEY = "rate_limit:requests"
+    TOKENS_KEY = "rate_limit:tokens"
+
+    def __init__(self, client: Redis, requests_per_minute: int, tokens_per_minute: int) -> None:
+        self._script = client.register_script(TOKEN_BUCKET_SCRIPT)
+        self._buckets = {
+            key: capacity
+            for key, capacity in (
+                (self.REQUESTS_KEY, requests_per_minute),
+                (self.TOKENS_KEY, tokens_per_minute),
+            )
+            if capacity > 0
+        }
+
+    async def acquire(self, tokens: int, deadline: float) -> None:
+        """Wait for bucket budget until loop time deadline, fail open if redis is down."""
+        if not self._buckets:
+            return
+
+        loop = asyncio.get_running_loop()
+        args: list[int] = []
+        for key, capacity in self._buckets.items():
+            args.extend((capacity, 1 if key == self.REQUESTS_KEY else tokens))
+
+        while True:
+            try:
+                wait = float(await self._script(keys=list(self._buckets), args=args))
+            except RedisError:
+                logger.warning("Rate limiter unavailable, continuing without it")
+                return
+
+            if wait <= 0:
+                return
+
+            if loop.time() + wait > deadline:
+                raise InferenceBusyError("Inference rate limit exceeded")
+
+            await asyncio.sleep(wait)
+
+
+class InferenceGateway:
+    """Bounded concurrency and rate limit in front of inference calls.
+
+    Requests over the concurrency limit wait in bounded per-user queues served fairly by
+    the scheduler. Requests that find the queue full, or do not get a slot and rate
+    budget within the queue timeout, fail fast with InferenceBusyError instead of
+    piling up on the provider.
+    """
+
+    def __init__(
+        self,
+        rate_limiter: RateLimiter,
+        scheduler: FairScheduler,
+        max_concurrency: int,
+        max_queue_size: int,
+        max_user_queue_size: int,
+        queue_timeout: float,
+    ) -> None:
+        self._rate_limiter = rate_limiter
+        self.scheduler = scheduler
+        self._max_concurrency = max_concurrency
+        self._max_queue_size = max_queue_size
+        self._max_user_queue_size = max_user_queue_size
+        self._queue_timeout = queue_timeout
+        self.active = 0
+        self.rejected = 0
+
+    @property
+    def queued(self) -> int:
+        """Get number of requests waiting for a slot."""
+        return len(self.scheduler)
+
+    @asynccontextmanager
+    async def slot(self, tokens: int, user_tg_id: int, weight: int = 1) -> AsyncIterator[None]:
+        """Hold inference slot for user request estimated at tokens."""
+        loop = asyncio.get_running_loop()
+        started_at = loop.time()
+        deadline = started_at + self._queue_timeout
+
+        await self._acquire(deadline, tokens, user_tg_id, weight)
+        self.scheduler.record_wait(user_tg_id, loop.time() - started_at)
+
+        try:
+            try:
+                await self._rate_limiter.acquire(tokens, deadline)
+            except InferenceBusyError:
+                self.rejected += 1
+                raise
+            yield
+        finally:
+            self._release()
+
+    async def _acquire(self, deadline: float, tokens: int, user_tg_id: int, weight: int) -> None:
+        """Take free slot or wait in queue for released one."""
+        if self.active < self._max_concurrency and not self.scheduler:
+            self.active += 1
+            return
+
+        if len(self.scheduler) >= self._max_queue_size:
+            self.rejected += 1
+            logger.warning("Inference queue is full, %d requests waiting", len(self.scheduler))
+            raise InferenceBusyError("Inference queue is full")
+
+        if self.scheduler.depth(user_tg_id) >= self._max_user_queue_size:
+            self.rejected += 1
+            raise InferenceBusyError("Inference queue of user is full")
+
+        waiter = self.scheduler.push(user_tg_id, weight, tokens)
+
+        try:
+            async with asyncio.timeout_at(deadline):
+                await waiter
+        except BaseException as e:
+            if waiter.done() and not waiter.cancelled():
+                # Slot was handed over right before cancellation, pass it on
+                self._release()
+            else:
+                self.scheduler.remove(user_tg_id, waiter)
+
+            if isinstance(e, TimeoutError):
+                self.rejected += 1
+                raise InferenceBusyError("Inference queue timeout") from None
+            raise
+
+    def _release(self) -> None:
+        """Hand slot over to the next scheduled waiter or free it."""
+        if waiter := self.scheduler.pop():
+            waiter.set_result(None)
+            return
+
+        self.active -= 1
+
+
+def create_inference_gateway(client: Redis) -> InferenceGateway:
+    """Create inference gateway shared by the whole application."""
+    return InferenceGateway(
+        rate_limiter=RateLimiter(
+            client=client,
+            requests_per_minute=settings.gateway.requests_per_minute,
+            tokens_per_minute=settings.gateway.tokens_per_minute,
+        ),
+        scheduler=FairScheduler(
+            quantum=settings.gateway.quantum,
+            stats_size=settings.gateway.stats_size,
+        ),
+        max_concurrency=settings.gateway.max_concurrency,
+        max_queue_size=settings.gateway.max_queue_size,
+        max_user_queue_size=settings.gateway.max_user_queue_size,
+        queue_timeout=settings.gateway.queue_timeout,
+    )
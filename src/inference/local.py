@@ -0,0 +1,141 @@
+import asyncio
+import logging
+import subprocess
+from time import monotonic
+from typing import Any
+
+from aiohttp import ClientError, ClientSession, ClientTimeout
+
+from src.core.config import BackendSettings, settings
+from src.inference.client import (
+    CompletionClientProtocol,
+    RemoteCompletionClient,
+    create_inference_client,
+)
+
+logger = logging.getLogger(__name__)
+
+LOCAL_HOST = "127.0.0.1"
+HEALTH_INTERVAL = 0.5  # Seconds between readiness checks of starting server
+STOP_TIMEOUT = 10.0  # Seconds for server to finish before it is killed
+
+
+class LocalCompletionClient:
+    """Completion client of small quantized model served by local llama.cpp server.
+
+    The server decodes requests of all its parallel slots together in one continuous
+    batch, a request joins the running batch as soon as a slot is free and leaves it once
+    finished. Throughput per core grows with the number of concurrent requests, while a
+    short reply never waits for a long one. Tokens are streamed over the server's OpenAI
+    compatible API as they are sampled, a cancelled request frees its slot.
+    """
+
+    def __init__(
+        self,
+        process: subprocess.Popen[bytes],
+        client: CompletionClientProtocol,
+        health_url: str,
+        start_timeout: float,
+    ) -> None:
+        self._process = process
+        self._client = client
+        self._health_url = health_url
+        self._deadline = monotonic() + start_timeout
+        self._ready = False
+        self._start_lock = asyncio.Lock()
+
+    async def create(self, messages: list[dict[str, str]], model: str, **kwargs: Any) -> Any:
+        """Create chat completion, or open completion stream if stream is set."""
+        await self._wait_ready()
+        return await self._client.create(messages=messages, model=model, **kwargs)
+
+    async def close(self) -> None:
+        """Close client connections and stop server."""
+        await self._client.close()
+
+        if self._process.poll() is None:
+            self._process.terminate()
+            try:
+                await asyncio.to_thread(self._process.wait, STOP_TIMEOUT)
+            except subprocess.TimeoutExpired:
+                logger.warning("Local inference server did not stop in time, killing it")
+                self._process.kill()
+                await asyncio.to_thread(self._process.wait)
+
+    async def _wait_ready(self) -> None:
+        """Wait until server has loaded model, fail if it exited or took too long."""
+        self._check_running()
+        if self._ready:
+            return None
+
+        async with (
+            self._start_lock,
+            ClientSession(timeout=ClientTimeout(total=HEALTH_INTERVAL)) as session,
+        ):
+            while not self._ready:
+                self._check_running()
+                try:
+                    async with session.get(self._health_url) as response:
+                        # Server answers 503 while model is loading
+                        self._ready = response.status == 200
+                except (ClientError, TimeoutError):
+                    pass
+
+                if self._ready:
+                    logger.info("Local inference server is ready")
+                elif monotonic() >= self._deadline:
+                    raise TimeoutError("Local inference server did not load model in time")
+                else:
+                    await asyncio.sleep(HEALTH_INTERVAL)
+
+    def _check_running(self) -> None:
+        """Fail if server process has exited."""
+        if (code := self._process.poll()) is not None:
+            raise RuntimeError(f"Local inference server exited with code {code}")
+
+
+def create_local_client(backend_settings: BackendSettings) -> LocalCompletionClient:
+    """Start llama.cpp server for backend model and create client of it."""
+    if backend_settings.model_path is None:
+        raise ValueError(f"Local inference backend '{backend_settings.name}' has no model path")
+
+    base_url = f"http://{LOCAL_HOST}:{backend_settings.port}"
+    command = [
+        backend_settings.server_path,
+        "--model",
+        backend_settings.model_path,
+        "--host",
+        LOCAL_HOST,
+        "--port",
+        str(backend_settings.port),
+        "--threads",
+        str(backend_settings.threads),
+        "--parallel",
+        str(backend_settings.parallel),
+        "--cont-batching",
+        # Context is split between slots, each gets the whole assistant budget
+        "--ctx-size",
+        str(settings.assistant.context_budget * backend_settings.parallel),
+    ]
+
+    logger.info(
+        "Starting local inference server for '%s' with %d parallel slots",
+        backend_settings.name,
+        backend_settings.parallel,
+    )
+    try:
+        process = subprocess.Popen(command)
+    except FileNotFoundError as e:
+        raise RuntimeError(
+            f"Local inference backend requires llama.cpp server '{backend_settings.server_path}'"
+        ) from e
+
+    return LocalCompletionClient(
+        process=process,
+        # Server checks no token unless started with api key
+        client=RemoteCompletionClient(
+            create_inference_client(base_url=f"{base_url}/v1", token="local")
+        ),
+        health_url=f"{base_url}/health",
+        start_timeout=backend_settings.start_timeout,
+    )
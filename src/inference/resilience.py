@@ -0,0 +1,255 @@
+import asyncio
+import logging
+import random
+from collections import deque
+from collections.abc import AsyncIterable, AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
+from time import monotonic
+from typing import Any
+
+from aiohttp import ClientConnectionError, ClientResponseError
+from huggingface_hub import ChatCompletionOutput, ChatCompletionStreamOutput
+
+from src.core.config import settings
+from src.inference.router import Backend, InferenceRouter
+
+logger = logging.getLogger(__name__)
+
+RETRYABLE_STATUSES = {408, 425, 429, 500, 502, 503, 504}
+
+
+def is_retryable(error: BaseException) -> bool:
+    """Check whether failed inference call may succeed when repeated."""
+    if isinstance(error, ClientResponseError):
+        return error.status in RETRYABLE_STATUSES
+
+    return isinstance(error, TimeoutError | ClientConnectionError)
+
+
+class LatencyTracker:
+    """Rolling window of successful inference call latencies."""
+
+    def __init__(self, window: int, min_samples: int) -> None:
+        self._latencies: deque[float] = deque(maxlen=window)
+        self._min_samples = min_samples
+
+    def record(self, latency: float) -> None:
+        """Record latency in seconds."""
+        self._latencies.append(latency)
+
+    def percentile(self, quantile: float) -> float | None:
+        """Get latency quantile or none until enough calls are observed."""
+        if len(self._latencies) < self._min_samples:
+            return None
+
+        latencies = sorted(self._latencies)
+        return latencies[min(len(latencies) - 1, int(quantile * len(latencies)))]
+
+
+class ResilientCompletions:
+    """Chat completions with per-attempt timeout, jittered retries and hedging.
+
+    Every attempt goes to the backend picked by the router, retries avoid backends that
+    already failed the request. When hedging is on and the primary call has not answered
+    within the observed p90 latency, a duplicate request goes to the next best backend.
+    The first successful response wins and the other call is cancelled. Streams are
+    retried only until the stream is opened and are never hedged.
+    """
+
+    HEDGE_QUANTILE = 0.9
+
+    def __init__(
+        self,
+        router: InferenceRouter,
+        tracker: LatencyTracker,
+        attempt_timeout: float,
+        max_attempts: int,
+        backoff_base: float,
+        backoff_max: float,
+        hedge: bool = False,
+    ) -> None:
+        self._router = router
+        self._tracker = tracker
+        self._attempt_timeout = attempt_timeout
+        self._max_attempts = max_attempts
+        self._backoff_base = backoff_base
+        self._backoff_max = backoff_max
+        self._hedge = hedge
+        self.hedged = 0
+        self.hedge_wins = 0
+
+    async def create(
+        self, messages: list[dict[str, str]], model: str | None = None, **kwargs: Any
+    ) -> ChatCompletionOutput:
+        """Create chat completion, preferring backends serving model."""
+        failed_backends: set[Backend] = set()
+
+        async def attempt() -> ChatCompletionOutput:
+            return await self._hedged_call(messages, model, failed_backends, **kwargs)
+
+        return await self._retry(attempt)
+
+    async def create_stream(
+        self, messages: list[dict[str, str]], model: str | None = None, **kwargs: Any
+    ) -> AsyncIterable[ChatCompletionStreamOutput]:
+        """Open chat completion stream, preferring backends serving model."""
+        failed_backends: set[Backend] = set()
+
+        async def attempt() -> AsyncIterable[ChatCompletionStreamOutput]:
+            backend = self._router.select(model=model, exclude=failed_backends)
+            async with self._deadline(backend, failed_backends):
+                stream: AsyncIterable[ChatCompletionStreamOutput] = await self._call(
+                    backend, messages, failed_backends, stream=True, **kwargs
+                )
+                return stream
+
+        return await self._retry(attempt)
+
+    async def _retry[ResultType](self, attempt: Callable[[], Awaitable[ResultType]]) -> ResultType:
+        """Run attempts with full jitter exponential backoff between retryable failures."""
+        for attempt_number in range(1, self._max_attempts + 1):
+            try:
+                return await attempt()
+            except Exception as e:
+                if not is_retryable(e) or attempt_number == self._max_attempts:
+                    raise
+
+                delay = random.uniform(
+                    0, min(self._backoff_max, self._backoff_base * 2 ** (attempt_number - 1))
+                )
+                logger.warning(
+                    "Inference attempt %d failed with %r, retrying in %.2fs",
+                    attempt_number,
+                    e,
+                    delay,
+                )
+                await asyncio.sleep(delay)
+
+        raise RuntimeError("Inference attempts must be positive")
+
+    async def _hedged_call(
+        self,
+        messages: list[dict[str, str]],
+        model: str | None,
+        failed_backends: set[Backend],
+        **kwargs: Any,
+    ) -> ChatCompletionOutput:
+        """Call best backend, hedging to the next one once the call is slower than p90."""
+        primary_backend = self._router.select(model=model, exclude=failed_backends)
+        hedge_delay = self._tracker.percentile(self.HEDGE_QUANTILE) if self._hedge else None
+
+        async with self._deadline(primary_backend, failed_backends):
+            if hedge_delay is None:
+                response: ChatCompletionOutput = await self._call(
+                    primary_backend, messages, failed_backends, record=True, **kwargs
+                )
+                return response
+
+            primary = asyncio.create_task(
+                self._call(primary_backend, messages, failed_backends, record=True, **kwargs)
+            )
+            tasks = {primary}
+            try:
+                done, _ = await asyncio.wait(tasks, timeout=hedge_delay)
+                if not done:
+                    self._start_hedge(
+                        primary_backend, tasks, messages, model, failed_backends, **kwargs
+                    )
+
+                # First successful response wins, error only if every call failed
+                error: BaseException | None = None
+                while tasks:
+                    done, tasks = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+                    for task in done:
+                        if task.exception() is None:
+                            if task is not primary:
+                                self.hedge_wins += 1
+                            result: ChatCompletionOutput = task.result()
+                            return result
+                        error = task.exception()
+
+                raise error or RuntimeError("Hedged inference finished without result")
+            finally:
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+
+    def _start_hedge(
+        self,
+        primary_backend: Backend,
+        tasks: set[asyncio.Task[Any]],
+        messages: list[dict[str, str]],
+        model: str | None,
+        failed_backends: set[Backend],
+        **kwargs: Any,
+    ) -> None:
+        """Send duplicate of slow request to the next best backend if there is one."""
+        hedge_backend = self._router.select(
+            model=model, exclude=failed_backends | {primary_backend}
+        )
+        if hedge_backend is primary_backend:
+            return
+
+        self.hedged += 1
+        logger.info("Inference slow, hedging request to '%s'", hedge_backend.name)
+        tasks.add(
+            asyncio.create_task(self._call(hedge_backend, messages, failed_backends, **kwargs))
+        )
+
+    @asynccontextmanager
+    async def _deadline(
+        self, backend: Backend, failed_backends: set[Backend]
+    ) -> AsyncIterator[None]:
+        """Bound attempt by timeout, counting expired attempt as backend failure."""
+        timeout = asyncio.timeout(self._attempt_timeout)
+
+        try:
+            async with timeout:
+                yield
+        except TimeoutError:
+            if timeout.expired():
+                self._router.record_failure(backend)
+                failed_backends.add(backend)
+            raise
+
+    async def _call(
+        self,
+        backend: Backend,
+        messages: list[dict[str, str]],
+        failed_backends: set[Backend],
+        record: bool = False,
+        **kwargs: Any,
+    ) -> Any:
+        """Call backend once, reporting its health to the router."""
+        started_at = monotonic()
+
+        try:
+            response = await backend.client.create(messages=messages, model=backend.model, **kwargs)
+        except Exception as e:
+            # Bad requests say nothing about backend health
+            if is_retryable(e):
+                self._router.record_failure(backend)
+                failed_backends.add(backend)
+            raise
+
+        latency = monotonic() - started_at
+        self._router.record_success(backend, latency)
+        if record:
+            self._tracker.record(latency)
+        return response
+
+
+def create_completions(router: InferenceRouter) -> ResilientCompletions:
+    """Create completions client shared by the whole application."""
+    return ResilientCompletions(
+        router=router,
+        tracker=LatencyTracker(
+            window=settings.assistant.latency_window,
+            min_samples=settings.assistant.hedge_min_samples,
+        ),
+        attempt_timeout=settings.assistant.attempt_timeout,
+        max_attempts=settings.assistant.max_attempts,
+        backoff_base=settings.assistant.backoff_base,
+        backoff_max=settings.assistant.backoff_max,
+        hedge=settings.assistant.hedge,
+    )
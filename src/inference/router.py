@@ -0,0 +1,181 @@
+import logging
+from collections.abc import Collection
+from enum import StrEnum
+from time import monotonic
+
+from src.core.config import BackendSettings, settings
+from src.inference.client import (
+    CompletionClientProtocol,
+    RemoteCompletionClient,
+    create_inference_client,
+)
+from src.inference.local import create_local_client
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitState(StrEnum):
+    """Backend circuit breaker state."""
+
+    CLOSED = "closed"  # Serving traffic
+    OPEN = "open"  # Ejected after failures
+    HALF_OPEN = "half_open"  # One probe request in flight
+
+
+class Backend:
+    """Inference backend with its latency, error rate and circuit breaker state."""
+
+    def __init__(
+        self,
+        name: str,
+        model: str,
+        client: CompletionClientProtocol,
+        weight: float = 1.0,
+        cost: float = 0.0,
+    ) -> None:
+        self.name = name
+        self.model = model
+        self.client = client
+        self.weight = weight
+        self.cost = cost
+        self.latency: float | None = None  # EWMA seconds
+        self.error_rate = 0.0  # EWMA of failed calls share
+        self.consecutive_failures = 0
+        self.state = CircuitState.CLOSED
+        self.opened_at = 0.0
+
+    @property
+    def score(self) -> float:
+        """Get routing score, lower is better, unmeasured backends are tried first."""
+        return (self.latency or 0.0) * (1 + self.error_rate) / self.weight + self.cost
+
+
+class InferenceRouter:
+    """Latency-aware router over inference backends.
+
+    Requests go to the healthy backend with the lowest score built from EWMA latency,
+    error rate, weight and cost. A backend failing several times in a row is ejected by
+    its circuit breaker and, once the open timeout passes, gets a single probe request
+    deciding whether it is taken back.
+    """
+
+    def __init__(
+        self,
+        backends: list[Backend],
+        ewma_alpha: float,
+        failure_threshold: int,
+        open_timeout: float,
+    ) -> None:
+        if not backends:
+            raise ValueError("At least one inference backend is required")
+
+        self.backends = backends
+        self._ewma_alpha = ewma_alpha
+        self._failure_threshold = failure_threshold
+        self._open_timeout = open_timeout
+
+    def select(self, model: str | None = None, exclude: Collection[Backend] = ()) -> Backend:
+        """Select best available backend, preferring ones serving model if given."""
+        candidates = [backend for backend in self.backends if backend not in exclude]
+        if model:
+            if serving := [backend for backend in candidates if backend.model == model]:
+                candidates = serving
+            else:
+                # Settings guarantee a backend per model, so all of them have failed
+                logger.warning("No backend of model '%s' left, failing over to others", model)
+
+        now = monotonic()
+        available = [
+            backend
+            for backend in candidates
+            if backend.state == CircuitState.CLOSED or now - backend.opened_at >= self._open_timeout
+        ]
+
+        if not available:
+            # Every circuit is open, trying the least recently ejected beats failing outright
+            if not candidates:
+                candidates = self.backends
+            return min(candidates, key=lambda backend: backend.opened_at)
+
+        backend = min(available, key=lambda backend: backend.score)
+        if backend.state != CircuitState.CLOSED:
+            # Probe that never reports back, like a cancelled one, is retried after timeout
+            backend.state = CircuitState.HALF_OPEN
+            backend.opened_at = now
+            logger.info("Probing inference backend '%s'", backend.name)
+
+        return backend
+
+    def record_success(self, backend: Backend, latency: float) -> None:
+        """Record successful call latency in seconds."""
+        backend.latency = self._ewma(backend.latency, latency)
+        backend.error_rate = self._ewma(backend.error_rate, 0.0)
+        backend.consecutive_failures = 0
+
+        if backend.state != CircuitState.CLOSED:
+            backend.state = CircuitState.CLOSED
+            logger.info("Inference backend '%s' is back", backend.name)
+
+    def record_failure(self, backend: Backend) -> None:
+        """Record failed call, ejecting backend when it keeps failing."""
+        backend.error_rate = self._ewma(backend.error_rate, 1.0)
+        backend.consecutive_failures += 1
+
+        if backend.state == CircuitState.HALF_OPEN or (
+            backend.state == CircuitState.CLOSED
+            and backend.consecutive_failures >= self._failure_threshold
+        ):
+            backend.state = CircuitState.OPEN
+            backend.opened_at = monotonic()
+            logger.warning(
+                "Inference backend '%s' ejected, error rate %.2f",
+                backend.name,
+                backend.error_rate,
+            )
+
+    async def close(self) -> None:
+        """Close backend clients."""
+        for backend in self.backends:
+            await backend.client.close()
+
+    def _ewma(self, average: float | None, value: float) -> float:
+        """Update exponentially weighted moving average."""
+        if average is None:
+            return value
+        return self._ewma_alpha * value + (1 - self._ewma_alpha) * average
+
+
+def create_backend_client(backend_settings: BackendSettings) -> CompletionClientProtocol:
+    """Create client of local or remote backend."""
+    if backend_settings.kind == "local":
+        return create_local_client(backend_settings)
+
+    return RemoteCompletionClient(
+        create_inference_client(
+            base_url=backend_settings.base_url,
+            token=(backend_settings.token or settings.assistant.token).get_secret_value(),
+        )
+    )
+
+
+def create_inference_router() -> InferenceRouter:
+    """Create router over configured backends, the assistant model if none are set."""
+    backends_settings = settings.assistant.backends or [
+        BackendSettings(name="default", model=settings.assistant.model)
+    ]
+
+    return InferenceRouter(
+        backends=[
+            Backend(
+                name=backend_settings.name,
+                model=backend_settings.model,
+                client=create_backend_client(backend_settings),
+                weight=backend_settings.weight,
+                cost=backend_settings.cost,
+            )
+            for backend_settings in backends_settings
+        ],
+        ewma_alpha=settings.router.ewma_alpha,
+        failure_threshold=settings.router.failure_threshold,
+        open_timeout=settings.router.open_timeout,
+    )
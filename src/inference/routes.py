@@ -0,0 +1,91 @@
+import logging
+
+from src.core.config import RouteSettings, settings
+
+logger = logging.getLogger(__name__)
+
+
+class RouteStats:
+    """Latency and token statistics of one assistant route."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.total_latency = 0.0
+        self.max_latency = 0.0
+        self.prompt_tokens = 0
+        self.completion_tokens = 0
+
+    @property
+    def average_latency(self) -> float:
+        """Get average seconds per inference call."""
+        return self.total_latency / self.calls if self.calls else 0.0
+
+    @property
+    def average_completion_tokens(self) -> float:
+        """Get average response tokens per inference call."""
+        return self.completion_tokens / self.calls if self.calls else 0.0
+
+    def record(self, latency: float, prompt_tokens: int, completion_tokens: int) -> None:
+        """Record inference call."""
+        self.calls += 1
+        self.total_latency += latency
+        self.max_latency = max(self.max_latency, latency)
+        self.prompt_tokens += prompt_tokens
+        self.completion_tokens += completion_tokens
+
+
+class RouteTable:
+    """Table picking model, response length and temperature for assistant turn.
+
+    Routes are matched in order by user CEFR level and message length, the default
+    route serves turns no route matches. Beginner turns can go to a small fast model
+    with a tight token cap while advanced learners get the large model.
+    """
+
+    def __init__(self, routes: list[RouteSettings], default: RouteSettings) -> None:
+        self.routes = routes
+        self.default = default
+        self._stats = {route.name: RouteStats() for route in [*routes, default]}
+
+    def select(self, cefr_level: str, message_length: int) -> RouteSettings:
+        """Select first route matching CEFR level and message length in characters."""
+        for route in self.routes:
+            if route.cefr_levels and cefr_level.lower() not in route.cefr_levels:
+                continue
+            if route.max_message_length is not None and message_length > route.max_message_length:
+                continue
+            return route
+
+        return self.default
+
+    def get_stats(self, route: RouteSettings) -> RouteStats:
+        """Get statistics of route."""
+        return self._stats.setdefault(route.name, RouteStats())
+
+    def record(
+        self, route: RouteSettings, latency: float, prompt_tokens: int, completion_tokens: int
+    ) -> None:
+        """Record inference call served by route."""
+        stats = self.get_stats(route)
+        stats.record(latency, prompt_tokens, completion_tokens)
+        logger.info(
+            "Route '%s' answered in %.2fs with %d tokens, average %.2fs and %.1f tokens",
+            route.name,
+            latency,
+            completion_tokens,
+            stats.average_latency,
+            stats.average_completion_tokens,
+        )
+
+
+def create_route_table() -> RouteTable:
+    """Create route table from settings, assistant defaults serving unmatched turns."""
+    return RouteTable(
+        routes=settings.assistant.routes,
+        default=RouteSettings(
+            name="default",
+            model=settings.assistant.model,
+            max_tokens=settings.assistant.max_tokens,
+            temperature=settings.assistant.temperature,
+        ),
+    )
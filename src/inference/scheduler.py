@@ -0,0 +1,142 @@
+import asyncio
+from collections import OrderedDict, deque
+from time import monotonic
+
+from src.core.config import settings
+
+
+class WaitStats:
+    """Inference queue wait statistics of one user."""
+
+    def __init__(self) -> None:
+        self.served = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    @property
+    def average_wait(self) -> float:
+        """Get average seconds waited for inference slot."""
+        return self.total_wait / self.served if self.served else 0.0
+
+    def record(self, wait: float) -> None:
+        """Record seconds one request waited."""
+        self.served += 1
+        self.total_wait += wait
+        self.max_wait = max(self.max_wait, wait)
+
+
+class FairScheduler:
+    """Deficit round-robin over per-user queues of requests waiting for inference.
+
+    Every round a backlogged user earns quantum times its weight in token credit, and
+    its requests are served while their estimated tokens fit the credit. A heavy user
+    gets no more than its weighted share, so other users' requests keep moving.
+    """
+
+    def __init__(self, quantum: int, stats_size: int) -> None:
+        self._quantum = quantum
+        self._stats_size = stats_size
+        self._stats: OrderedDict[int, WaitStats] = OrderedDict()
+        self._queues: dict[int, deque[tuple[asyncio.Future[None], int, float]]] = {}
+        self._weights: dict[int, int] = {}
+        self._deficits: dict[int, int] = {}
+        self._round: deque[int] = deque()
+        self._size = 0
+
+    def __len__(self) -> int:
+        """Get number of waiting requests."""
+        return self._size
+
+    def depth(self, user_tg_id: int) -> int:
+        """Get number of waiting requests of user."""
+        return len(self._queues.get(user_tg_id, ()))
+
+    def get_stats(self, user_tg_id: int) -> WaitStats | None:
+        """Get wait statistics of user."""
+        return self._stats.get(user_tg_id)
+
+    def record_wait(self, user_tg_id: int, wait: float) -> None:
+        """Record seconds user request waited, forgetting least recently served users."""
+        stats = self._stats.pop(user_tg_id, None) or WaitStats()
+        stats.record(wait)
+        self._stats[user_tg_id] = stats
+        if len(self._stats) > self._stats_size:
+            self._stats.popitem(last=False)
+
+    def push(self, user_tg_id: int, weight: int, cost: int) -> asyncio.Future[None]:
+        """Queue request costing estimated tokens, return future resolved when it is served."""
+        future = asyncio.get_running_loop().create_future()
+
+        if user_tg_id not in self._queues:
+            self._queues[user_tg_id] = deque()
+            self._deficits[user_tg_id] = self._quantum * weight
+            self._round.append(user_tg_id)
+
+        self._weights[user_tg_id] = weight
+        self._queues[user_tg_id].append((future, cost, monotonic()))
+        self._size += 1
+        return future
+
+    def pop(self) -> asyncio.Future[None] | None:
+        """Take next request to serve or none if nothing is waiting."""
+        while self._round:
+            user_tg_id = self._round[0]
+            queue = self._queues[user_tg_id]
+
+            # Skip requests abandoned while waiting
+            while queue and queue[0][0].done():
+                queue.popleft()
+                self._size -= 1
+
+            if not queue:
+                self._drop(user_tg_id)
+                continue
+
+            future, cost, _ = queue[0]
+            if self._deficits[user_tg_id] >= cost:
+                queue.popleft()
+                self._size -= 1
+                self._deficits[user_tg_id] -= cost
+                if not queue:
+                    self._drop(user_tg_id)
+                return future
+
+            # Credit spent, next user gets its quantum
+            self._round.rotate(-1)
+            next_user_tg_id = self._round[0]
+            self._deficits[next_user_tg_id] += self._quantum * self._weights[next_user_tg_id]
+
+        return None
+
+    def remove(self, user_tg_id: int, future: asyncio.Future[None]) -> None:
+        """Remove abandoned request from queue."""
+        queue = self._queues.get(user_tg_id)
+        if queue is None:
+            return
+
+        for index, (queued_future, _, _) in enumerate(queue):
+            if queued_future is future:
+                del queue[index]
+                self._size -= 1
+                break
+
+        if not queue:
+            self._drop(user_tg_id)
+
+    def _drop(self, user_tg_id: int) -> None:
+        """Forget user with empty queue, unused credit does not carry over."""
+        del self._queues[user_tg_id]
+        del self._weights[user_tg_id]
+        del self._deficits[user_tg_id]
+        self._round.remove(user_tg_id)
+
+
+def get_user_weight(user_tg_id: int, is_admin: bool) -> int:
+    """Get scheduling weight of user."""
+    if is_admin:
+        return settings.gateway.admin_weight
+
+    if user_tg_id in settings.gateway.premium_users:
+        return settings.gateway.premium_weight
+
+    return settings.gateway.default_weight
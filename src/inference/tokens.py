@@ -0,0 +1,44 @@
+import logging
+
+try:
+    from tokenizers import Tokenizer
+except ImportError:
+    Tokenizer = None  # type: ignore[assignment,misc]
+
+logger = logging.getLogger(__name__)
+
+
+class TokenCounter:
+    """Token counter using model tokenizer or fast character-based estimate."""
+
+    CHARS_PER_TOKEN = 4
+    MESSAGE_OVERHEAD = 4  # Role and separator tokens of chat template
+
+    def __init__(self, tokenizer: "Tokenizer | None" = None) -> None:
+        self._tokenizer = tokenizer
+
+    def count(self, text: str) -> int:
+        """Count text tokens."""
+        if self._tokenizer is None:
+            return -(-len(text) // self.CHARS_PER_TOKEN)
+        return len(self._tokenizer.encode(text, add_special_tokens=False).ids)
+
+    def count_message(self, content: str) -> int:
+        """Count chat message tokens including template overhead."""
+        return self.count(content) + self.MESSAGE_OVERHEAD
+
+
+def load_token_counter(model: str) -> TokenCounter:
+    """Load model tokenizer from local cache or hub, fall back to estimate."""
+    if Tokenizer is None:
+        logger.info("Tokenizers not installed, estimating tokens by characters")
+        return TokenCounter()
+
+    try:
+        tokenizer = Tokenizer.from_pretrained(model)
+    except Exception:
+        logger.warning("Tokenizer for '%s' not loaded, estimating tokens by characters", model)
+        return TokenCounter()
+
+    logger.info("Tokenizer for '%s' loaded", model)
+    return TokenCounter(tokenizer)
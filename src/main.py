@@ -1,19 +1,37 @@
 import asyncio
 import logging
+from functools import partial
+from multiprocessing import get_context
 
 from aiogram import Bot, Dispatcher
 from aiogram.client.default import DefaultBotProperties
 from aiogram.enums import ParseMode
+from aiogram.webhook.aiohttp_server import SimpleRequestHandler, setup_application
+from aiohttp import web
 from dishka import make_async_container
 from dishka.integrations.aiogram import AiogramProvider, setup_dishka
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
-from src.core.config import settings
-from src.core.providers import DatabaseProvider, RepositoryProvider, ServiceProvider
-from src.handlers import assistant, language, start
+from src.core.config import WebhookSettings, settings
+from src.core.outbound import create_outbound_limiter
+from src.core.providers import (
+    CacheProvider,
+    ConcurrencyProvider,
+    DatabaseProvider,
+    InferenceProvider,
+    RedisProvider,
+    RepositoryProvider,
+    ServiceProvider,
+)
+from src.handlers import admin, assistant, language, reminder, start
+from src.services import ReminderScheduler
+from src.services.reminder import restore_reminders
 
+logger = logging.getLogger(__name__)
 
-async def main() -> None:
-    """Configure and start bot."""
+
+def setup_logging() -> None:
+    """Configure logging."""
     logging.basicConfig(
         level=settings.logger.level,
         format=settings.logger.format,
@@ -22,24 +40,145 @@ async def main() -> None:
             logging.StreamHandler(),
         ],
     )
-    logger = logging.getLogger(__name__)
 
+
+def create_bot() -> Bot:
+    """Create bot with outgoing requests kept within Telegram limits."""
     bot = Bot(
         token=settings.bot.token.get_secret_value(),
         default=DefaultBotProperties(parse_mode=ParseMode.HTML),
     )
+    if settings.outbound.enabled:
+        bot.session.middleware(create_outbound_limiter())
+    return bot
+
+
+def create_dispatcher() -> Dispatcher:
+    """Create dispatcher with routers and dependency container."""
     dp = Dispatcher()
-    dp.include_routers(start.router, language.router, assistant.router)
+    dp.include_routers(start.router, admin.router)
+    if settings.reminders.enabled:
+        dp.include_router(reminder.router)
+    dp.include_routers(language.router, assistant.router)
 
     container = make_async_container(
-        DatabaseProvider(), RepositoryProvider(), ServiceProvider(), AiogramProvider()
+        DatabaseProvider(),
+        RedisProvider(),
+        CacheProvider(),
+        ConcurrencyProvider(),
+        InferenceProvider(),
+        RepositoryProvider(),
+        ServiceProvider(),
+        AiogramProvider(),
     )
     setup_dishka(container=container, router=dp, auto_inject=True)
 
-    logger.info("LinguAI Pro started")
+    if settings.reminders.enabled:
+
+        async def start_reminders(bot: Bot) -> None:
+            scheduler = await container.get(ReminderScheduler)
+            try:
+                await restore_reminders(
+                    scheduler,
+                    await container.get(async_sessionmaker[AsyncSession]),
+                    settings.reminders.batch_size,
+                )
+            except Exception:
+                logger.exception("Reminders not restored from database")
+
+            # Every process runs workers, due reminders are claimed atomically in redis
+            scheduler.start(
+                send=partial(reminder.send_reminder, bot), workers=settings.reminders.workers
+            )
+
+        dp.startup.register(start_reminders)
 
+    async def close_container() -> None:
+        await container.close()
+        logger.info("LinguAI Pro stopped")
+
+    dp.shutdown.register(close_container)
+    return dp
+
+
+async def run_polling() -> None:
+    """Start bot with long polling."""
+    bot = create_bot()
+    dp = create_dispatcher()
+
+    logger.info("LinguAI Pro started with polling")
+
+    await bot.delete_webhook()
     await dp.start_polling(bot)
 
 
+def run_webhook_worker(webhook: WebhookSettings, register_webhook: bool) -> None:
+    """Start aiohttp server handling webhook updates."""
+    setup_logging()
+
+    bot = create_bot()
+    dp = create_dispatcher()
+
+    if register_webhook:
+
+        async def set_webhook(bot: Bot) -> None:
+            # Receive only update types used by handlers
+            await bot.set_webhook(
+                url=webhook.url + webhook.path,
+                secret_token=webhook.secret_token.get_secret_value(),
+                allowed_updates=dp.resolve_used_update_types(),
+            )
+
+        dp.startup.register(set_webhook)
+
+    app = web.Application()
+    # Answer Telegram right away and process update in background task
+    SimpleRequestHandler(
+        dispatcher=dp,
+        bot=bot,
+        handle_in_background=True,
+        secret_token=webhook.secret_token.get_secret_value(),
+    ).register(app, path=webhook.path)
+    setup_application(app, dp, bot=bot)
+
+    logger.info("LinguAI Pro started with webhook on %s:%d", webhook.host, webhook.port)
+
+    web.run_app(
+        app,
+        host=webhook.host,
+        port=webhook.port,
+        reuse_port=webhook.workers > 1,
+        print=None,
+    )
+
+
+def run_webhook(webhook: WebhookSettings) -> None:
+    """Start webhook worker processes sharing one port."""
+    if webhook.workers == 1:
+        return run_webhook_worker(webhook, register_webhook=True)
+
+    # Spawn fresh interpreters, routers can be attached to one dispatcher only
+    context = get_context("spawn")
+    workers = [
+        context.Process(target=run_webhook_worker, args=(webhook, index == 0))
+        for index in range(webhook.workers)
+    ]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+
+def main() -> None:
+    """Configure and start bot."""
+    setup_logging()
+
+    # Settings validation guarantees webhook settings in webhook mode
+    if settings.bot.mode == "webhook" and settings.bot.webhook is not None:
+        return run_webhook(settings.bot.webhook)
+
+    asyncio.run(run_polling())
+
+
 if __name__ == "__main__":
-    asyncio.run(main())
+    main()
@@ -8,6 +8,7 @@ from sqlalchemy.ext.asyncio import async_engine_from_config
 
 from src.core.config import settings
 from src.models.base import Base
+from src.models.message import Message  # noqa: F401
 from src.models.user import User  # noqa: F401
 
 # this is the Alembic Config object, which provides
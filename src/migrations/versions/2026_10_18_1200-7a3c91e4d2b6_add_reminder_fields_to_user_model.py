@@ -0,0 +1,30 @@
+"""Add reminder fields to user model
+
+Revision ID: 7a3c91e4d2b6
+Revises: 40c6ff79ca20
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "7a3c91e4d2b6"
+down_revision: str | Sequence[str] | None = "40c6ff79ca20"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column("users", sa.Column("reminder_time", sa.Time(), nullable=True))
+    op.add_column("users", sa.Column("timezone", sa.String(length=64), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("users", "timezone")
+    op.drop_column("users", "reminder_time")
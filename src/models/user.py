@@ -1,4 +1,6 @@
-from sqlalchemy import BigInteger, Boolean, String
+from datetime import time
+
+from sqlalchemy import BigInteger, Boolean, String, Time
 from sqlalchemy.orm import Mapped, mapped_column
 
 from src.models.base import Base
@@ -14,3 +16,5 @@ class User(Base):
     is_admin: Mapped[bool] = mapped_column(Boolean, default=False)
     language: Mapped[str | None] = mapped_column(String(length=10), nullable=True)
     cefr_level: Mapped[str | None] = mapped_column(String(length=2), nullable=True)
+    reminder_time: Mapped[time | None] = mapped_column(Time, nullable=True)  # Local time
+    timezone: Mapped[str | None] = mapped_column(String(length=64), nullable=True)
@@ -3,9 +3,10 @@ from abc import ABC, abstractmethod
 from typing import Any
 
 from pydantic import BaseModel
-from sqlalchemy import select, update
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy import func, or_, select, update
+from sqlalchemy.dialects.postgresql import insert
 
+from src.core.database import UnitOfWork
 from src.models.base import Base
 
 logger = logging.getLogger(__name__)
@@ -19,16 +20,52 @@ class AbstractRepository[ModelType: Base, SchemaType: BaseModel](ABC):
         """Find one object or none."""
         raise NotImplementedError
 
+    @abstractmethod
+    async def find_fields_or_none(
+        self, field_names: list[str], **filter_by_data: Any
+    ) -> dict[str, Any] | None:
+        """Find selected fields of one object or none."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def count(self, after_id: int = 0, **filter_by_data: Any) -> int:
+        """Count objects with id above after id."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def find_fields_page(
+        self, field_names: list[str], limit: int, after_id: int = 0, **filter_by_data: Any
+    ) -> list[dict[str, Any]]:
+        """Find id and selected fields of objects with id above after id."""
+        raise NotImplementedError
+
     @abstractmethod
     async def add_one(self, data: SchemaType) -> int:
         """Add one new object."""
         raise NotImplementedError
 
+    @abstractmethod
+    async def add_many(self, data: list[SchemaType]) -> None:
+        """Add new objects in one multi-row insert."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def upsert_one(
+        self, data: SchemaType, index_elements: list[str], update_fields: list[str] | None = None
+    ) -> int | None:
+        """Insert one object or update it on conflict, return id if row was written."""
+        raise NotImplementedError
+
     @abstractmethod
     async def update_one(self, field_name: str, update_data: str, **filter_by_data: Any) -> None:
         """Update one object."""
         raise NotImplementedError
 
+    @abstractmethod
+    async def update_fields(self, update_data: dict[str, Any], **filter_by_data: Any) -> int:
+        """Update several fields of one object, return number of updated rows."""
+        raise NotImplementedError
+
 
 class BaseRepository[ModelType: Base, SchemaType: BaseModel](
     AbstractRepository[ModelType, SchemaType]
@@ -37,8 +74,8 @@ class BaseRepository[ModelType: Base, SchemaType: BaseModel](
 
     model: type[ModelType] | None = None
 
-    def __init__(self, session_factory: async_sessionmaker[AsyncSession]):
-        self.session_factory = session_factory
+    def __init__(self, unit_of_work: UnitOfWork):
+        self.unit_of_work = unit_of_work
 
     def _get_model(self) -> type[ModelType]:
         """Get model."""
@@ -50,26 +87,122 @@ class BaseRepository[ModelType: Base, SchemaType: BaseModel](
         """Find one object or none."""
         model = self._get_model()
 
-        async with self.session_factory() as session:
-            query = select(model).filter_by(**filter_by_data)
-            result = await session.execute(query)
-            return result.scalar_one_or_none()
+        session = self.unit_of_work.get_session()
+        query = select(model).filter_by(**filter_by_data)
+        result = await session.execute(query)
+        return result.scalar_one_or_none()
+
+    async def find_fields_or_none(
+        self, field_names: list[str], **filter_by_data: Any
+    ) -> dict[str, Any] | None:
+        """Find selected fields of one object or none."""
+        model = self._get_model()
+
+        session = self.unit_of_work.get_session()
+        columns = [getattr(model, field_name) for field_name in field_names]
+        query = select(*columns).filter_by(**filter_by_data)
+        result = await session.execute(query)
+        row = result.one_or_none()
+        return dict(row._mapping) if row else None
+
+    async def count(self, after_id: int = 0, **filter_by_data: Any) -> int:
+        """Count objects with id above after id."""
+        model = self._get_model()
+
+        session = self.unit_of_work.get_session()
+        query = (
+            select(func.count())
+            .select_from(model)
+            .filter_by(**filter_by_data)
+            .where(model.id > after_id)
+        )
+        result = await session.execute(query)
+        return result.scalar_one()
+
+    async def find_fields_page(
+        self, field_names: list[str], limit: int, after_id: int = 0, **filter_by_data: Any
+    ) -> list[dict[str, Any]]:
+        """Find id and selected fields of objects with id above after id in id order.
+
+        Callers page through the table by last seen id, each page is a short query of its
+        own, so no cursor stays open between pages and an interrupted scan resumes from
+        the last seen id.
+        """
+        model = self._get_model()
+
+        session = self.unit_of_work.get_session()
+        columns = [model.id, *(getattr(model, field_name) for field_name in field_names)]
+        query = (
+            select(*columns)
+            .filter_by(**filter_by_data)
+            .where(model.id > after_id)
+            .order_by(model.id)
+            .limit(limit)
+        )
+        result = await session.execute(query)
+        return [dict(row._mapping) for row in result]
 
     async def add_one(self, data: SchemaType) -> int:
         """Add one new object."""
         model = self._get_model()
 
-        async with self.session_factory() as session:
-            instance = model(**data.model_dump())
-            session.add(instance)
-            await session.commit()
-            return instance.id
+        session = self.unit_of_work.get_session()
+        instance = model(**data.model_dump())
+        session.add(instance)
+        await session.flush()
+        return instance.id
+
+    async def add_many(self, data: list[SchemaType]) -> None:
+        """Add new objects in one multi-row insert."""
+        model = self._get_model()
+
+        session = self.unit_of_work.get_session()
+        query = insert(model).values([item.model_dump() for item in data])
+        await session.execute(query)
+
+    async def upsert_one(
+        self, data: SchemaType, index_elements: list[str], update_fields: list[str] | None = None
+    ) -> int | None:
+        """Insert one object or update it on conflict, return id if row was written."""
+        model = self._get_model()
+
+        session = self.unit_of_work.get_session()
+        query = insert(model).values(**data.model_dump())
+
+        if update_fields:
+            # Skip rewriting rows when nothing changed
+            query = query.on_conflict_do_update(
+                index_elements=index_elements,
+                set_={
+                    **{field: query.excluded[field] for field in update_fields},
+                    "updated_at": func.now(),
+                },
+                where=or_(
+                    *[
+                        getattr(model, field).is_distinct_from(query.excluded[field])
+                        for field in update_fields
+                    ]
+                ),
+            )
+        else:
+            query = query.on_conflict_do_nothing(index_elements=index_elements)
+
+        result = await session.execute(query.returning(model.id))
+        return result.scalar_one_or_none()
 
     async def update_one(self, field_name: str, update_data: str, **filter_by_data: Any) -> None:
         """Update one object."""
         model = self._get_model()
 
-        async with self.session_factory() as session:
-            query = update(model).filter_by(**filter_by_data).values(**{field_name: update_data})
-            await session.execute(query)
-            await session.commit()
+        session = self.unit_of_work.get_session()
+        query = update(model).filter_by(**filter_by_data).values(**{field_name: update_data})
+        await session.execute(query)
+
+    async def update_fields(self, update_data: dict[str, Any], **filter_by_data: Any) -> int:
+        """Update several fields of one object, return number of updated rows."""
+        model = self._get_model()
+
+        session = self.unit_of_work.get_session()
+        query = update(model).filter_by(**filter_by_data).values(**update_data)
+        result = await session.execute(query)
+        return result.rowcount
@@ -0,0 +1,73 @@
+from datetime import date
+from typing import Protocol
+
+from sqlalchemy import select, text
+
+from src.models.message import Message
+from src.repositories.base import BaseRepository
+from src.schemas.message import MessageSchema
+
+
+class MessageRepositoryProtocol(Protocol):
+    """Protocol for message repository."""
+
+    async def add_messages(self, messages: list[MessageSchema]) -> None:
+        """Add messages in one multi-row insert."""
+        ...
+
+    async def create_month_partition(self, month: date) -> None:
+        """Create partition for messages of month starting at given date if missing."""
+        ...
+
+    async def get_last_messages(self, user_tg_id: int, limit: int) -> list[MessageSchema]:
+        """Get latest messages of user in chronological order."""
+        ...
+
+
+class MessageRepository(BaseRepository[Message, MessageSchema], MessageRepositoryProtocol):
+    """Message repository."""
+
+    model = Message
+
+    async def add_messages(self, messages: list[MessageSchema]) -> None:
+        """Add messages in one multi-row insert."""
+        await self.add_many(messages)
+
+    async def create_month_partition(self, month: date) -> None:
+        """Create partition for messages of month starting at given date if missing."""
+        next_month = date(month.year + month.month // 12, month.month % 12 + 1, 1)
+        table_name = self._get_model().__tablename__
+
+        session = self.unit_of_work.get_session()
+        await session.execute(
+            text(
+                f"CREATE TABLE IF NOT EXISTS {table_name}_{month:%Y_%m} "
+                f"PARTITION OF {table_name} "
+                f"FOR VALUES FROM ('{month:%Y-%m-%d} 00:00:00+00') "
+                f"TO ('{next_month:%Y-%m-%d} 00:00:00+00')"
+            )
+        )
+
+    async def get_last_messages(self, user_tg_id: int, limit: int) -> list[MessageSchema]:
+        """Get latest messages of user in chronological order."""
+        model = self._get_model()
+
+        # Served by user and creation time index, id orders messages of one turn
+        session = self.unit_of_work.get_session()
+        query = (
+            select(model)
+            .where(model.user_tg_id == user_tg_id)
+            .order_by(model.created_at.desc(), model.id.desc())
+            .limit(limit)
+        )
+        result = await session.execute(query)
+        return [
+            MessageSchema(
+                user_tg_id=message.user_tg_id,
+                role=message.role,
+                content=message.content,
+                tokens=message.tokens,
+                created_at=message.created_at,
+            )
+            for message in reversed(result.scalars().all())
+        ]
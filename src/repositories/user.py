@@ -1,8 +1,11 @@
-from typing import Protocol
+from datetime import time
+from typing import Any, Protocol
+
+from sqlalchemy import select
 
 from src.models.user import User
 from src.repositories.base import BaseRepository
-from src.schemas.user import UserSchema
+from src.schemas.user import UserProfileSchema, UserSchema
 
 
 class UserRepositoryProtocol(Protocol):
@@ -16,6 +19,10 @@ class UserRepositoryProtocol(Protocol):
         """Add new user."""
         ...
 
+    async def upsert_user(self, user: UserSchema) -> int | None:
+        """Add new user or update changed names, return id if row was written."""
+        ...
+
     async def set_user_language(self, language: str, user_tg_id: int) -> None:
         """Set user language by telegram id."""
         ...
@@ -32,6 +39,41 @@ class UserRepositoryProtocol(Protocol):
         """Get user language by telegram id or none."""
         ...
 
+    async def get_user_profile(self, user_tg_id: int) -> UserProfileSchema | None:
+        """Get user language profile by telegram id or none."""
+        ...
+
+    async def set_user_reminder(
+        self, reminder_time: time | None, timezone: str | None, user_tg_id: int
+    ) -> bool:
+        """Set user reminder local time and timezone by telegram id, none disables it.
+
+        Return false if user does not exist.
+        """
+        ...
+
+    async def get_user_reminders(
+        self, after_id: int, limit: int
+    ) -> list[tuple[int, int, time, str | None]]:
+        """Get ids, telegram ids, reminder times and timezones of users with reminder."""
+        ...
+
+    async def count_users(
+        self, after_id: int = 0, language: str | None = None, cefr_level: str | None = None
+    ) -> int:
+        """Count users with id above after id, optionally by language and CEFR level."""
+        ...
+
+    async def get_user_tg_ids(
+        self,
+        limit: int,
+        after_id: int = 0,
+        language: str | None = None,
+        cefr_level: str | None = None,
+    ) -> list[tuple[int, int]]:
+        """Get ids and telegram ids of users with id above after id in id order."""
+        ...
+
 
 class UserRepository(BaseRepository[User, UserSchema], UserRepositoryProtocol):
     """User repository."""
@@ -55,6 +97,14 @@ class UserRepository(BaseRepository[User, UserSchema], UserRepositoryProtocol):
         user_id = await self.add_one(data)
         return user_id
 
+    async def upsert_user(self, data: UserSchema) -> int | None:
+        """Add new user or update changed names, return id if row was written."""
+        return await self.upsert_one(
+            data,
+            index_elements=["tg_id"],
+            update_fields=["username", "first_name", "last_name"],
+        )
+
     async def set_user_language(self, language: str, user_tg_id: int) -> None:
         """Set user language by telegram id."""
         await self.update_one(field_name="language", update_data=language, tg_id=user_tg_id)
@@ -72,3 +122,70 @@ class UserRepository(BaseRepository[User, UserSchema], UserRepositoryProtocol):
         """Get user language by telegram id or none."""
         user = await self.find_one_or_none(tg_id=user_tg_id)
         return user.cefr_level if user else None
+
+    async def get_user_profile(self, user_tg_id: int) -> UserProfileSchema | None:
+        """Get user language profile by telegram id or none."""
+        fields = await self.find_fields_or_none(
+            ["language", "cefr_level", "is_admin"], tg_id=user_tg_id
+        )
+        if fields is None:
+            return None
+
+        # Column is nullable, missing role means regular user
+        return UserProfileSchema(**{**fields, "is_admin": bool(fields["is_admin"])})
+
+    async def set_user_reminder(
+        self, reminder_time: time | None, timezone: str | None, user_tg_id: int
+    ) -> bool:
+        """Set user reminder local time and timezone by telegram id, none disables it.
+
+        Return false if user does not exist.
+        """
+        updated = await self.update_fields(
+            {"reminder_time": reminder_time, "timezone": timezone}, tg_id=user_tg_id
+        )
+        return updated > 0
+
+    async def get_user_reminders(
+        self, after_id: int, limit: int
+    ) -> list[tuple[int, int, time, str | None]]:
+        """Get ids, telegram ids, reminder times and timezones of users with reminder.
+
+        Users with id above after id are returned in id order, so the caller pages
+        through the table by last seen id without holding a cursor open.
+        """
+        model = self._get_model()
+
+        session = self.unit_of_work.get_session()
+        query = (
+            select(model.id, model.tg_id, model.reminder_time, model.timezone)
+            .where(model.id > after_id, model.reminder_time.is_not(None))
+            .order_by(model.id)
+            .limit(limit)
+        )
+        result = await session.execute(query)
+        return [(row.id, row.tg_id, row.reminder_time, row.timezone) for row in result]
+
+    async def count_users(
+        self, after_id: int = 0, language: str | None = None, cefr_level: str | None = None
+    ) -> int:
+        """Count users with id above after id, optionally by language and CEFR level."""
+        return await self.count(after_id, **self._get_filters(language, cefr_level))
+
+    async def get_user_tg_ids(
+        self,
+        limit: int,
+        after_id: int = 0,
+        language: str | None = None,
+        cefr_level: str | None = None,
+    ) -> list[tuple[int, int]]:
+        """Get ids and telegram ids of users with id above after id in id order."""
+        rows = await self.find_fields_page(
+            ["tg_id"], limit, after_id, **self._get_filters(language, cefr_level)
+        )
+        return [(fields["id"], fields["tg_id"]) for fields in rows]
+
+    def _get_filters(self, language: str | None, cefr_level: str | None) -> dict[str, Any]:
+        """Get user filters that are set."""
+        filters = {"language": language, "cefr_level": cefr_level}
+        return {field: value for field, value in filters.items() if value is not None}
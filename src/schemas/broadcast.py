@@ -0,0 +1,12 @@
+from pydantic import BaseModel
+
+
+class BroadcastSchema(BaseModel):
+    """Broadcast with its delivery checkpoint."""
+
+    text: str
+    language: str | None = None
+    cefr_level: str | None = None
+    last_id: int = 0  # Users up to this id are done
+    sent: int = 0
+    failed: int = 0
@@ -0,0 +1,13 @@
+from datetime import datetime
+
+from pydantic import BaseModel, Field
+
+
+class MessageSchema(BaseModel):
+    """Archived chat message schema."""
+
+    user_tg_id: int
+    role: str = Field(max_length=16)
+    content: str
+    tokens: int | None = None
+    created_at: datetime
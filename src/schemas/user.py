@@ -8,3 +8,11 @@ class UserSchema(BaseModel):
     username: str | None = Field(None, max_length=32)
     first_name: str | None = Field(None, max_length=64)
     last_name: str | None = Field(None, max_length=64)
+
+
+class UserProfileSchema(BaseModel):
+    """User language profile schema."""
+
+    language: str | None = None
+    cefr_level: str | None = None
+    is_admin: bool = False
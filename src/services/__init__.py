@@ -1,6 +1,26 @@
+from .archive import MessageArchive
 from .assistant import AssistantService
+from .broadcast import BroadcastService
 from .context import ContextService
+from .history import HistoryService
 from .language import LanguageService
+from .profile import ProfileService
+from .reminder import ReminderScheduler, ReminderService
+from .response_cache import ResponseCacheService
 from .start import StartService
+from .summary import SummaryService
 
-__all__ = ["StartService", "LanguageService", "ContextService", "AssistantService"]
+__all__ = [
+    "StartService",
+    "LanguageService",
+    "ProfileService",
+    "ContextService",
+    "HistoryService",
+    "AssistantService",
+    "SummaryService",
+    "ResponseCacheService",
+    "BroadcastService",
+    "ReminderScheduler",
+    "ReminderService",
+    "MessageArchive",
+]
@@ -0,0 +1,177 @@
+import asyncio
+import logging
+from collections import deque
+from contextlib import suppress
+from datetime import UTC, date, datetime
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.core.config import settings
+from src.core.database import UnitOfWork
+from src.repositories.message import MessageRepository
+from src.schemas.message import MessageSchema
+from src.services.history import ChatMessage
+
+logger = logging.getLogger(__name__)
+
+
+class MessageArchive:
+    """Write-behind archive of chat messages in database.
+
+    Messages are buffered in memory and written by a background task in multi-row
+    inserts once a batch fills up or the flush interval passes, so replies never wait
+    for the database. While the database is down the buffer is bounded and its oldest
+    messages are dropped. Pending messages are written on close. History expired in
+    redis is loaded back from the archive, one query per user however many turns ask.
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        batch_size: int,
+        flush_interval: float,
+        max_buffer_size: int,
+    ) -> None:
+        self._session_factory = session_factory
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval
+        self._buffer: deque[MessageSchema] = deque(maxlen=max_buffer_size)
+        self._batch_ready = asyncio.Event()
+        self._partitions: set[date] = set()
+        self._task: asyncio.Task[None] | None = None
+        self._closed = False
+        self._loads: dict[int, asyncio.Task[list[ChatMessage]]] = {}
+        self.written = 0
+        self.dropped = 0
+        self.loaded = 0
+
+    def add(self, user_tg_id: int, *messages: ChatMessage) -> None:
+        """Buffer messages of one turn for writing."""
+        created_at = datetime.now(UTC)
+        for message in messages:
+            if len(self._buffer) == self._buffer.maxlen:
+                self.dropped += 1
+            self._buffer.append(
+                MessageSchema(
+                    user_tg_id=user_tg_id,
+                    role=message["role"],
+                    content=message["content"],
+                    tokens=message.get("tokens"),
+                    created_at=created_at,
+                )
+            )
+
+        if len(self._buffer) >= self._batch_size:
+            self._batch_ready.set()
+
+    async def load_history(self, user_tg_id: int, limit: int) -> list[ChatMessage]:
+        """Load latest archived messages of user, concurrent callers share one query."""
+        task = self._loads.get(user_tg_id)
+        if task is None:
+            task = asyncio.create_task(self._load_history(user_tg_id, limit))
+            self._loads[user_tg_id] = task
+            task.add_done_callback(lambda _: self._loads.pop(user_tg_id, None))
+
+        # Cancelled caller must not cancel the query other callers wait for
+        return list(await asyncio.shield(task))
+
+    def start(self) -> None:
+        """Start background writer."""
+        self._task = asyncio.create_task(self._run())
+
+    async def close(self) -> None:
+        """Stop background writer and write pending messages."""
+        # Writer is not cancelled, so batch being written is not lost
+        self._closed = True
+        if self._task is not None:
+            self._batch_ready.set()
+            await self._task
+            self._task = None
+
+        await self.flush()
+        if self._buffer:
+            logger.warning("Archive closed with %d messages not written", len(self._buffer))
+
+    async def flush(self) -> None:
+        """Write buffered messages batch by batch, stop at first failed batch."""
+        while self._buffer:
+            batch = [
+                self._buffer.popleft() for _ in range(min(self._batch_size, len(self._buffer)))
+            ]
+            try:
+                await self._write(batch)
+            except Exception:
+                logger.exception("Archive write of %d messages failed", len(batch))
+                self._requeue(batch)
+                return
+
+            self.written += len(batch)
+            logger.debug("Archived %d messages, %d in total", len(batch), self.written)
+
+    async def _write(self, batch: list[MessageSchema]) -> None:
+        """Write batch in one transaction, creating missing month partitions first."""
+        months = {message.created_at.date().replace(day=1) for message in batch}
+        unit_of_work = UnitOfWork(self._session_factory)
+        repository = MessageRepository(unit_of_work=unit_of_work)
+
+        try:
+            for month in sorted(months - self._partitions):
+                await repository.create_month_partition(month)
+            await repository.add_messages(batch)
+            await unit_of_work.commit()
+        except Exception:
+            await unit_of_work.rollback()
+            raise
+        finally:
+            await unit_of_work.close()
+
+        self._partitions |= months
+
+    async def _load_history(self, user_tg_id: int, limit: int) -> list[ChatMessage]:
+        """Read latest messages of user, empty history if database is unavailable."""
+        unit_of_work = UnitOfWork(self._session_factory)
+        repository = MessageRepository(unit_of_work=unit_of_work)
+
+        try:
+            messages = await repository.get_last_messages(user_tg_id=user_tg_id, limit=limit)
+        except Exception:
+            logger.exception("Archived history of user '%d' not loaded", user_tg_id)
+            return []
+        finally:
+            await unit_of_work.close()
+
+        self.loaded += 1
+        history: list[ChatMessage] = []
+        for message in messages:
+            chat_message: ChatMessage = {"role": message.role, "content": message.content}
+            if message.tokens is not None:
+                chat_message["tokens"] = message.tokens
+            history.append(chat_message)
+        return history
+
+    def _requeue(self, batch: list[MessageSchema]) -> None:
+        """Put failed batch back in front of buffer, dropping oldest messages if full."""
+        maxlen = self._buffer.maxlen or 0
+        overflow = max(0, len(self._buffer) + len(batch) - maxlen)
+        self.dropped += overflow
+        self._buffer.extendleft(reversed(batch[overflow:]))
+
+    async def _run(self) -> None:
+        """Write batches when one fills up or flush interval passes until closed."""
+        while not self._closed:
+            with suppress(TimeoutError):
+                await asyncio.wait_for(self._batch_ready.wait(), self._flush_interval)
+            self._batch_ready.clear()
+            await self.flush()
+
+
+def create_message_archive(
+    session_factory: async_sessionmaker[AsyncSession],
+) -> MessageArchive:
+    """Create message archive from settings."""
+    return MessageArchive(
+        session_factory=session_factory,
+        batch_size=settings.archive.batch_size,
+        flush_interval=settings.archive.flush_interval,
+        max_buffer_size=settings.archive.max_buffer_size,
+    )
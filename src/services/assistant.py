@@ -1,11 +1,18 @@
-import json
+import asyncio
 import logging
-
-from huggingface_hub import AsyncInferenceClient
-
-from src.core.config import settings
-from src.services.context import ContextService
-from src.texts.prompts import CHAT_SYSTEM_PROMPT
+from collections.abc import AsyncIterator
+from time import monotonic
+
+from src.core.config import RouteSettings, settings
+from src.inference.gateway import InferenceGateway
+from src.inference.resilience import ResilientCompletions
+from src.inference.routes import RouteTable
+from src.inference.tokens import TokenCounter
+from src.services.archive import MessageArchive
+from src.services.history import ChatMessage, HistoryService
+from src.services.response_cache import ResponseCacheService
+from src.services.summary import SummaryService
+from src.texts.prompts import CHAT_SUMMARY_PROMPT, CHAT_SYSTEM_PROMPT
 
 logger = logging.getLogger(__name__)
 
@@ -13,32 +20,56 @@ logger = logging.getLogger(__name__)
 class AssistantService:
     """AI assistant service."""
 
-    def __init__(self) -> None:
-        self._client = AsyncInferenceClient(token=settings.assistant.token.get_secret_value())
-        self._context_service = ContextService()
-        self._max_history_length = settings.context.max_history_length
+    def __init__(
+        self,
+        completions: ResilientCompletions,
+        history_service: HistoryService,
+        token_counter: TokenCounter,
+        summary_service: SummaryService,
+        response_cache: ResponseCacheService,
+        gateway: InferenceGateway,
+        route_table: RouteTable,
+        archive: MessageArchive,
+    ) -> None:
+        self._completions = completions
+        self._history_service = history_service
+        self._token_counter = token_counter
+        self._summary_service = summary_service
+        self._response_cache = response_cache
+        self._gateway = gateway
+        self._route_table = route_table
+        self._archive = archive
         self._chat_system_prompt = CHAT_SYSTEM_PROMPT
 
     async def chat(
-        self, user_tg_id: int, message: str, language: str, cefr_level: str
+        self, user_tg_id: int, message: str, language: str, cefr_level: str, weight: int = 1
     ) -> str | None:
-        """Chat with AI assistant."""
-        chat_history = await self._get_chat_history(user_tg_id)
-
-        # Add user message to history
-        chat_history.append({"role": "user", "content": message})
-
-        # Build messages
-        messages = self._build_messages(language, cefr_level, chat_history)
-
-        # Get assistant response
-        response = await self._client.chat.completions.create(
-            model=settings.assistant.model,
-            messages=messages,
-            max_tokens=settings.assistant.max_tokens,
-            temperature=settings.assistant.temperature,
+        """Chat with AI assistant, weight sets user share of inference capacity."""
+        route = self._route_table.select(cefr_level, len(message))
+        user_message, messages, history_length = await self._prepare_messages(
+            user_tg_id, message, language, cefr_level, route
         )
 
+        # Serve repeated deterministic turns from cache
+        cache_key = self._response_cache.get_key(route.model, route.temperature, messages)
+        if cache_key and (cached_text := await self._response_cache.get(cache_key)):
+            await self._save_messages(
+                user_tg_id, language, history_length, user_message, cached_text
+            )
+            return cached_text
+
+        # Get assistant response within inference capacity
+        prompt_tokens = self._count_tokens(messages)
+        async with self._gateway.slot(prompt_tokens + route.max_tokens, user_tg_id, weight):
+            started_at = monotonic()
+            response = await self._completions.create(
+                model=route.model,
+                messages=messages,
+                max_tokens=route.max_tokens,
+                temperature=route.temperature,
+            )
+            latency = monotonic() - started_at
+
         if not response.choices or not response.choices[0].message:
             logger.warning("Empty choices or message from assistant")
             return None
@@ -49,38 +80,154 @@ class AssistantService:
             logger.warning("Empty response from assistant")
             return None
 
-        # Add assistant response to history
-        chat_history.append({"role": "assistant", "content": response_text})
-
-        # Trim history if exceeds limit and save
-        if len(chat_history) > self._max_history_length:
-            chat_history = chat_history[-self._max_history_length :]
+        self._route_table.record(
+            route, latency, prompt_tokens, self._token_counter.count(response_text)
+        )
 
-        await self._set_chat_history(user_tg_id, chat_history)
-        logger.info("Chat history updated for user %s", user_tg_id)
+        if cache_key:
+            await self._response_cache.set(cache_key, response_text)
 
+        await self._save_messages(user_tg_id, language, history_length, user_message, response_text)
         return response_text
 
-    async def _get_chat_history(self, user_tg_id: int) -> list[dict[str, str]]:
-        """Get chat history from context."""
-        context_data = await self._context_service.get_context(prefix="chat", user_tg_id=user_tg_id)
+    async def stream_chat(
+        self, user_tg_id: int, message: str, language: str, cefr_level: str, weight: int = 1
+    ) -> AsyncIterator[str]:
+        """Chat with AI assistant yielding response text as it is generated."""
+        route = self._route_table.select(cefr_level, len(message))
+        user_message, messages, history_length = await self._prepare_messages(
+            user_tg_id, message, language, cefr_level, route
+        )
+
+        # Serve repeated deterministic turns from cache in one chunk
+        cache_key = self._response_cache.get_key(route.model, route.temperature, messages)
+        if cache_key and (cached_text := await self._response_cache.get(cache_key)):
+            yield cached_text
+            await self._save_messages(
+                user_tg_id, language, history_length, user_message, cached_text
+            )
+            return
+
+        # Stream assistant response, holding inference slot until stream ends
+        response_text = ""
+        prompt_tokens = self._count_tokens(messages)
+        async with self._gateway.slot(prompt_tokens + route.max_tokens, user_tg_id, weight):
+            started_at = monotonic()
+            stream = await self._completions.create_stream(
+                model=route.model,
+                messages=messages,
+                max_tokens=route.max_tokens,
+                temperature=route.temperature,
+            )
+
+            async for chunk in stream:
+                if not chunk.choices or not chunk.choices[0].delta.content:
+                    continue
+
+                response_text += chunk.choices[0].delta.content
+                yield chunk.choices[0].delta.content
+
+            latency = monotonic() - started_at
+
+        if not response_text:
+            logger.warning("Empty response stream from assistant")
+            return
+
+        self._route_table.record(
+            route, latency, prompt_tokens, self._token_counter.count(response_text)
+        )
 
-        if context_data:
-            parsed_data: list[dict[str, str]] = json.loads(context_data)
-            return parsed_data
+        if cache_key:
+            await self._response_cache.set(cache_key, response_text)
+
+        # Save history only once the response is complete
+        await self._save_messages(user_tg_id, language, history_length, user_message, response_text)
+
+    async def _prepare_messages(
+        self, user_tg_id: int, message: str, language: str, cefr_level: str, route: RouteSettings
+    ) -> tuple[ChatMessage, list[dict[str, str]], int]:
+        """Get history, add user message and build messages for AI."""
+        summary = None
+        if self._summary_service.enabled:
+            chat_history, summary = await asyncio.gather(
+                self._history_service.get_history(user_tg_id),
+                self._history_service.get_summary(user_tg_id),
+            )
+        else:
+            chat_history = await self._history_service.get_history(user_tg_id)
 
-        return []
+        # Add user message to history
+        user_message = self._make_message("user", message)
+        chat_history.append(user_message)
 
-    async def _set_chat_history(self, user_tg_id: int, history: list[dict[str, str]]) -> None:
-        """Set chat history in context."""
-        await self._context_service.set_context(
-            prefix="chat", user_tg_id=user_tg_id, data=json.dumps(history)
+        return (
+            user_message,
+            self._build_messages(language, cefr_level, chat_history, route.max_tokens, summary),
+            len(chat_history),
         )
 
+    async def _save_messages(
+        self,
+        user_tg_id: int,
+        language: str,
+        history_length: int,
+        user_message: ChatMessage,
+        response_text: str,
+    ) -> None:
+        """Save turn to history and archive, summarize it in background when it grows long."""
+        assistant_message = self._make_message("assistant", response_text)
+        await self._history_service.add_messages(user_tg_id, user_message, assistant_message)
+
+        # Archive writes in background batches off the reply path
+        if settings.archive.enabled:
+            self._archive.add(user_tg_id, user_message, assistant_message)
+        self._summary_service.schedule(user_tg_id, language, history_length + 1)
+
+    def _make_message(self, role: str, content: str) -> ChatMessage:
+        """Make history message with its token count."""
+        return {
+            "role": role,
+            "content": content,
+            "tokens": self._token_counter.count_message(content),
+        }
+
+    def _count_tokens(self, messages: list[dict[str, str]]) -> int:
+        """Count prompt tokens of inference call."""
+        return sum(self._token_counter.count_message(message["content"]) for message in messages)
+
+    def _fit_history(
+        self, system_messages: list[dict[str, str]], history: list[ChatMessage], max_tokens: int
+    ) -> list[ChatMessage]:
+        """Keep latest messages fitting context budget next to system prompts and response."""
+        budget = (
+            settings.assistant.context_budget - max_tokens - self._count_tokens(system_messages)
+        )
+
+        fitted_history: list[ChatMessage] = []
+        for message in reversed(history):
+            tokens = message.get("tokens") or self._token_counter.count_message(message["content"])
+
+            # Latest user message is always sent
+            if fitted_history and tokens > budget:
+                break
+
+            budget -= tokens
+            fitted_history.append(message)
+
+        if len(fitted_history) < len(history):
+            logger.info("Chat history trimmed to %d messages by token budget", len(fitted_history))
+
+        return fitted_history[::-1]
+
     def _build_messages(
-        self, language: str, cefr_level: str, history: list[dict[str, str]]
+        self,
+        language: str,
+        cefr_level: str,
+        history: list[ChatMessage],
+        max_tokens: int,
+        summary: str | None = None,
     ) -> list[dict[str, str]]:
-        """Build messages for AI including system prompt and history."""
+        """Build messages for AI including system prompt, history summary and history."""
         # Format system prompt with language and CEFR level
         system_prompt = self._chat_system_prompt.format(
             language=language.title(), cefr_level=cefr_level.title()
@@ -88,6 +235,16 @@ class AssistantService:
 
         # Add system prompt to messages
         messages = [{"role": "system", "content": system_prompt}]
-        messages.extend(history)
+
+        # Add summary of folded history right after system prompt
+        if summary:
+            messages.append(
+                {"role": "system", "content": CHAT_SUMMARY_PROMPT.format(summary=summary)}
+            )
+
+        messages.extend(
+            {"role": message["role"], "content": message["content"]}
+            for message in self._fit_history(messages, history, max_tokens)
+        )
 
         return messages
@@ -0,0 +1,266 @@
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+from contextlib import suppress
+from time import monotonic
+
+from aiogram.exceptions import TelegramBadRequest, TelegramForbiddenError, TelegramRetryAfter
+from redis.asyncio import Redis
+from redis.asyncio.lock import Lock
+from redis.exceptions import LockError, RedisError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.core.config import settings
+from src.core.database import UnitOfWork
+from src.repositories.user import UserRepository, UserRepositoryProtocol
+from src.schemas.broadcast import BroadcastSchema
+
+logger = logging.getLogger(__name__)
+
+
+class BroadcastProgress:
+    """Delivery progress of running broadcast."""
+
+    def __init__(self, total: int, sent: int, failed: int) -> None:
+        self.total = total
+        self.sent = sent
+        self.failed = failed
+        self._started_at = monotonic()
+        self._done_at_start = sent + failed
+
+    @property
+    def done(self) -> int:
+        """Get number of users broadcast was sent or failed to."""
+        return self.sent + self.failed
+
+    @property
+    def rate(self) -> float:
+        """Get users processed per second since start or resume."""
+        elapsed = monotonic() - self._started_at
+        return (self.done - self._done_at_start) / elapsed if elapsed > 0 else 0.0
+
+    @property
+    def eta(self) -> float | None:
+        """Get seconds left at current rate or none until rate is known."""
+        return max(0, self.total - self.done) / self.rate if self.rate else None
+
+
+class BroadcastService:
+    """Admin broadcast to users paged from database.
+
+    A broadcast runs as a background task, so the admin command returns right away. Users
+    are read in id order one batch at a time, each batch by a short query in a session of
+    its own, so no connection or snapshot is held for hours, and sent to at a fixed rate.
+    Progress is checkpointed in redis after every batch, so a broadcast interrupted by a
+    crash resumes from the last finished batch and at most one batch is sent twice. A
+    keepalive task renews the lock while the broadcast runs.
+    """
+
+    KEY = "broadcast"
+    LOCK_KEY = "broadcast_lock"
+
+    def __init__(self, session_factory: async_sessionmaker[AsyncSession], client: Redis) -> None:
+        self._session_factory = session_factory
+        self._client = client
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    async def create(self, broadcast: BroadcastSchema) -> bool:
+        """Save new broadcast unless an unfinished one exists."""
+        return bool(await self._client.set(self.KEY, broadcast.model_dump_json(), nx=True))
+
+    async def get(self) -> BroadcastSchema | None:
+        """Get unfinished broadcast or none."""
+        data = await self._client.get(self.KEY)
+        return BroadcastSchema.model_validate_json(data) if data else None
+
+    async def cancel(self) -> bool:
+        """Drop unfinished broadcast, stopping it after the current batch."""
+        return bool(await self._client.delete(self.KEY))
+
+    async def start(
+        self,
+        send: Callable[[int, str], Awaitable[object]],
+        report: Callable[[BroadcastProgress], Awaitable[None]],
+        finish: Callable[[BroadcastProgress, bool], Awaitable[None]],
+    ) -> bool:
+        """Start delivering unfinished broadcast in background, false if missing or running.
+
+        Finish gets final progress and whether broadcast stopped on error before the end.
+        """
+        lock = self._client.lock(self.LOCK_KEY, timeout=settings.broadcast.lock_timeout)
+        if not await lock.acquire(blocking=False):
+            return False
+
+        if await self.get() is None:
+            with suppress(LockError):
+                await lock.release()
+            return False
+
+        task = asyncio.create_task(self._run(lock, send, report, finish))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return True
+
+    async def close(self) -> None:
+        """Stop running broadcasts, they resume from last checkpoint."""
+        tasks = list(self._tasks)
+        for task in tasks:
+            task.cancel()
+
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _run(
+        self,
+        lock: Lock,
+        send: Callable[[int, str], Awaitable[object]],
+        report: Callable[[BroadcastProgress], Awaitable[None]],
+        finish: Callable[[BroadcastProgress, bool], Awaitable[None]],
+    ) -> None:
+        """Deliver broadcast from its checkpoint while holding lock."""
+        task = asyncio.current_task()
+        keepalive = asyncio.create_task(self._keep_lock(lock, task))
+
+        try:
+            broadcast = await self.get()
+            if broadcast is None:
+                return
+
+            progress = BroadcastProgress(
+                broadcast.sent + broadcast.failed, broadcast.sent, broadcast.failed
+            )
+            reporter = asyncio.create_task(self._report(progress, report))
+            stopped = False
+            try:
+                progress.total += await self._query_users(
+                    lambda repository: repository.count_users(
+                        broadcast.last_id, broadcast.language, broadcast.cefr_level
+                    )
+                )
+                if await self._deliver(broadcast, progress, send):
+                    await self._client.delete(self.KEY)
+            except Exception:
+                logger.exception("Broadcast stopped, it resumes from last checkpoint")
+                stopped = True
+            finally:
+                reporter.cancel()
+
+            logger.info("Broadcast sent to %d users, failed for %d", progress.sent, progress.failed)
+            try:
+                await finish(progress, stopped)
+            except Exception:
+                logger.exception("Broadcast finish report failed")
+        finally:
+            keepalive.cancel()
+            with suppress(LockError):
+                await lock.release()
+
+    async def _deliver(
+        self,
+        broadcast: BroadcastSchema,
+        progress: BroadcastProgress,
+        send: Callable[[int, str], Awaitable[object]],
+    ) -> bool:
+        """Send broadcast batch by batch, return false if it was cancelled."""
+        while True:
+            # Checkpoint moves last id forward after every batch
+            batch = await self._query_users(
+                lambda repository: repository.get_user_tg_ids(
+                    settings.broadcast.batch_size,
+                    broadcast.last_id,
+                    broadcast.language,
+                    broadcast.cefr_level,
+                )
+            )
+            if not batch:
+                return True
+
+            if not await self._send_batch(broadcast, batch, progress, send):
+                return False
+
+    async def _query_users[T](self, query: Callable[[UserRepositoryProtocol], Awaitable[T]]) -> T:
+        """Run users query in a short-lived session of its own."""
+        unit_of_work = UnitOfWork(self._session_factory)
+        try:
+            return await query(UserRepository(unit_of_work=unit_of_work))
+        finally:
+            await unit_of_work.close()
+
+    async def _send_batch(
+        self,
+        broadcast: BroadcastSchema,
+        batch: list[tuple[int, int]],
+        progress: BroadcastProgress,
+        send: Callable[[int, str], Awaitable[object]],
+    ) -> bool:
+        """Send batch at configured rate and checkpoint it, return false if cancelled."""
+        tasks = []
+        for _, user_tg_id in batch:
+            tasks.append(asyncio.create_task(self._send_one(broadcast, user_tg_id, progress, send)))
+            await asyncio.sleep(1 / settings.broadcast.rate)
+
+        # Batch with undelivered users is not checkpointed, resume sends it again
+        for result in await asyncio.gather(*tasks, return_exceptions=True):
+            if isinstance(result, BaseException):
+                raise result
+
+        broadcast.last_id = batch[-1][0]
+        broadcast.sent = progress.sent
+        broadcast.failed = progress.failed
+
+        # Checkpoint only while broadcast still exists, admin may have cancelled it
+        return bool(await self._client.set(self.KEY, broadcast.model_dump_json(), xx=True))
+
+    async def _send_one(
+        self,
+        broadcast: BroadcastSchema,
+        user_tg_id: int,
+        progress: BroadcastProgress,
+        send: Callable[[int, str], Awaitable[object]],
+    ) -> None:
+        """Send broadcast to user, retrying transient errors until attempts run out."""
+        for attempt in range(settings.broadcast.max_attempts):
+            try:
+                await send(user_tg_id, broadcast.text)
+            except (TelegramForbiddenError, TelegramBadRequest) as e:
+                # Blocked bot or deleted account must not stop the broadcast
+                logger.debug("Broadcast to user '%d' failed: %r", user_tg_id, e)
+                progress.failed += 1
+                return
+            except Exception as e:
+                if attempt + 1 == settings.broadcast.max_attempts:
+                    raise
+                delay = (
+                    e.retry_after
+                    if isinstance(e, TelegramRetryAfter)
+                    else settings.broadcast.retry_delay * 2**attempt
+                )
+                logger.warning("Broadcast to user '%d' retried in %ss: %r", user_tg_id, delay, e)
+                await asyncio.sleep(delay)
+            else:
+                progress.sent += 1
+                return
+
+    async def _keep_lock(self, lock: Lock, task: asyncio.Task[None] | None) -> None:
+        """Renew lock until cancelled, stop broadcast if lock was lost."""
+        while True:
+            await asyncio.sleep(settings.broadcast.lock_timeout / 3)
+            try:
+                await lock.reacquire()
+            except LockError:
+                logger.error("Broadcast lock lost, stopping broadcast")
+                if task is not None:
+                    task.cancel()
+                return
+            except RedisError:
+                logger.warning("Broadcast lock renewal failed", exc_info=True)
+
+    async def _report(
+        self, progress: BroadcastProgress, report: Callable[[BroadcastProgress], Awaitable[None]]
+    ) -> None:
+        """Report progress periodically."""
+        while True:
+            await asyncio.sleep(settings.broadcast.report_interval)
+            try:
+                await report(progress)
+            except Exception:
+                logger.exception("Broadcast progress report failed")
@@ -1,6 +1,6 @@
 import logging
 
-from redis.asyncio import Redis as redis
+from redis.asyncio import Redis
 
 from src.core.config import settings
 
@@ -10,13 +10,9 @@ logger = logging.getLogger(__name__)
 class ContextService:
     """Redis context service."""
 
-    def __init__(self) -> None:
-        self._url = settings.context.url
+    def __init__(self, client: Redis) -> None:
+        self._client = client
         self._ttl = settings.context.ttl
-        self._client = redis.from_url(
-            url=self._url,
-            decode_responses=True,
-        )
 
     async def set_context(self, prefix: str, user_tg_id: int, data: str) -> None:
         """Set data in redis context."""
@@ -35,3 +31,33 @@ class ContextService:
 
         logger.info("Received context '%s' with data '%s' for user '%d'", prefix, data, user_tg_id)
         return data
+
+    async def set_contexts(self, user_tg_id: int, data: dict[str, str]) -> None:
+        """Set several prefixes in redis context in one round trip."""
+        async with self._client.pipeline(transaction=False) as pipe:
+            for prefix, value in data.items():
+                pipe.setex(name=f"{prefix}:{user_tg_id}", time=self._ttl, value=value)
+            await pipe.execute()
+
+        logger.info("Set contexts '%s' for user '%d'", ", ".join(data), user_tg_id)
+
+    async def get_contexts(self, prefixes: list[str], user_tg_id: int) -> list[str | None]:
+        """Get several prefixes from redis context in one round trip."""
+        data: list[str | None] = await self._client.mget(
+            [f"{prefix}:{user_tg_id}" for prefix in prefixes]
+        )
+
+        logger.info("Received contexts '%s' for user '%d'", ", ".join(prefixes), user_tg_id)
+        return data
+
+    async def publish(self, channel: str, message: str) -> None:
+        """Publish message to redis channel."""
+        await self._client.publish(channel, message)
+
+    async def add_member(self, key: str, member: str) -> None:
+        """Add member to redis set."""
+        await self._client.sadd(key, member)  # type: ignore[misc]
+
+    async def is_member(self, key: str, member: str) -> bool:
+        """Check member of redis set."""
+        return bool(await self._client.sismember(key, member))  # type: ignore[misc]
@@ -0,0 +1,162 @@
+import json
+import logging
+from typing import TYPE_CHECKING, NotRequired, TypedDict
+
+from redis.asyncio import Redis
+from redis.exceptions import WatchError
+
+from src.core.config import settings
+
+if TYPE_CHECKING:
+    from src.services.archive import MessageArchive
+
+logger = logging.getLogger(__name__)
+
+# Write loaded history back only if no turn created the list meanwhile
+REHYDRATE_SCRIPT = """
+if redis.call('EXISTS', KEYS[1]) == 1 then
+    return 0
+end
+redis.call('RPUSH', KEYS[1], unpack(ARGV, 2))
+redis.call('EXPIRE', KEYS[1], ARGV[1])
+return 1
+"""
+
+
+class ChatMessage(TypedDict):
+    """Chat history message with cached token count."""
+
+    role: str
+    content: str
+    tokens: NotRequired[int]
+
+
+class HistoryService:
+    """Redis chat history service.
+
+    History is stored as a per-user list of JSON encoded messages, so a new turn is
+    appended and trimmed server-side instead of rewriting the whole conversation.
+    Oldest messages may be folded into a running summary stored next to the list.
+    History expired in redis is loaded back from the message archive when one is given,
+    so redis ttl can stay short without the assistant forgetting returning learners.
+    """
+
+    def __init__(self, client: Redis, archive: "MessageArchive | None" = None) -> None:
+        self._client = client
+        self._archive = archive
+        self._rehydrate = client.register_script(REHYDRATE_SCRIPT)
+        self._ttl = settings.context.ttl
+        self._max_history_length = settings.context.max_history_length
+
+    async def get_history(self, user_tg_id: int) -> list[ChatMessage]:
+        """Get chat history."""
+        key = self._get_key(user_tg_id)
+        items: list[str] = await self._client.lrange(key, 0, -1)  # type: ignore[misc]
+
+        if items:
+            return [json.loads(item) for item in items]
+
+        history = await self._migrate_legacy_history(user_tg_id)
+        if not history and self._archive is not None:
+            history = await self._rehydrate_history(user_tg_id, self._archive)
+        return history
+
+    async def add_messages(self, user_tg_id: int, *messages: ChatMessage) -> None:
+        """Append messages to chat history atomically, trim and refresh its ttl."""
+        key = self._get_key(user_tg_id)
+
+        async with self._client.pipeline(transaction=True) as pipe:
+            pipe.rpush(key, *[json.dumps(message) for message in messages])
+            pipe.ltrim(key, -self._max_history_length, -1)
+            pipe.expire(key, self._ttl)
+            pipe.expire(self._get_summary_key(user_tg_id), self._ttl)
+            await pipe.execute()
+
+        logger.info("Chat history updated for user '%d'", user_tg_id)
+
+    async def get_summary(self, user_tg_id: int) -> str | None:
+        """Get running summary of folded history."""
+        summary: str | None = await self._client.get(self._get_summary_key(user_tg_id))
+        return summary
+
+    async def fold_history(
+        self,
+        user_tg_id: int,
+        summary: str,
+        folded_history: list[ChatMessage],
+        previous_summary: str | None,
+    ) -> bool:
+        """Replace oldest messages with summary unless history changed concurrently."""
+        key = self._get_key(user_tg_id)
+        summary_key = self._get_summary_key(user_tg_id)
+        count = len(folded_history)
+
+        async with self._client.pipeline(transaction=True) as pipe:
+            try:
+                # Summary changes on every fold, so it guards against folding twice, and
+                # trimming full list on a new turn shifts its head, so folded messages
+                # must still be the oldest ones
+                await pipe.watch(summary_key, key)
+                if await pipe.get(summary_key) != previous_summary:
+                    return False
+                head: list[str] = await pipe.lrange(key, 0, count - 1)  # type: ignore[misc]
+                if [json.loads(item) for item in head] != folded_history:
+                    return False
+
+                pipe.multi()  # type: ignore[no-untyped-call]
+                pipe.set(summary_key, summary, ex=self._ttl)
+                pipe.ltrim(key, count, -1)
+                await pipe.execute()
+            except WatchError:
+                return False
+
+        logger.info("Chat history folded into summary for user '%d'", user_tg_id)
+        return True
+
+    async def _migrate_legacy_history(self, user_tg_id: int) -> list[ChatMessage]:
+        """Move history stored as single JSON string into the list."""
+        legacy_key = f"chat:{user_tg_id}"
+        data: str | None = await self._client.get(legacy_key)
+
+        if data is None:
+            return []
+
+        history: list[ChatMessage] = json.loads(data)[-self._max_history_length :]
+        key = self._get_key(user_tg_id)
+
+        async with self._client.pipeline(transaction=True) as pipe:
+            # Prepend so messages appended concurrently stay after legacy ones
+            if history:
+                pipe.lpush(key, *[json.dumps(message) for message in reversed(history)])
+                pipe.ltrim(key, -self._max_history_length, -1)
+                pipe.expire(key, self._ttl)
+            pipe.delete(legacy_key)
+            await pipe.execute()
+
+        logger.info("Chat history migrated to list for user '%d'", user_tg_id)
+        return history
+
+    async def _rehydrate_history(
+        self, user_tg_id: int, archive: "MessageArchive"
+    ) -> list[ChatMessage]:
+        """Load latest messages from archive and write them back to redis."""
+        history = await archive.load_history(user_tg_id, self._max_history_length)
+        if not history:
+            return []
+
+        await self._rehydrate(
+            keys=[self._get_key(user_tg_id)],
+            args=[self._ttl, *[json.dumps(message) for message in history]],
+        )
+        logger.info("Chat history of user '%d' loaded from archive", user_tg_id)
+        return history
+
+    @staticmethod
+    def _get_key(user_tg_id: int) -> str:
+        """Get history key."""
+        return f"history:{user_tg_id}"
+
+    @staticmethod
+    def _get_summary_key(user_tg_id: int) -> str:
+        """Get history summary key."""
+        return f"history_summary:{user_tg_id}"
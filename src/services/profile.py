@@ -0,0 +1,80 @@
+import logging
+
+from src.core.cache import LocalCache
+from src.core.config import settings
+from src.repositories.user import UserRepositoryProtocol
+from src.schemas.user import UserProfileSchema
+from src.services.context import ContextService
+
+logger = logging.getLogger(__name__)
+
+
+class ProfileService:
+    """User language profile service.
+
+    Profile is looked up in the in-process cache first, then in redis context and
+    finally in database.
+    """
+
+    PREFIXES = ["user_language", "user_cefr_level", "user_is_admin"]
+
+    def __init__(
+        self,
+        user_repository: UserRepositoryProtocol,
+        context_service: ContextService,
+        cache: LocalCache[int, UserProfileSchema],
+    ) -> None:
+        self._user_repository = user_repository
+        self._context_service = context_service
+        self._cache = cache
+
+    async def get_user_profile(self, user_tg_id: int) -> UserProfileSchema | None:
+        """Get user language, CEFR level and role from cache, context or database."""
+        if profile := self._cache.get(user_tg_id):
+            return profile
+
+        language, cefr_level, is_admin = await self._context_service.get_contexts(
+            prefixes=self.PREFIXES, user_tg_id=user_tg_id
+        )
+        if language and cefr_level and is_admin:
+            profile = UserProfileSchema(
+                language=language, cefr_level=cefr_level, is_admin=is_admin == "1"
+            )
+            self._cache.set(user_tg_id, profile)
+            return profile
+
+        profile = await self._user_repository.get_user_profile(user_tg_id=user_tg_id)
+
+        if profile is None:
+            logger.warning("User '%d' not found in database", user_tg_id)
+            return None
+
+        # Repopulate context with values known in database
+        data = {
+            prefix: value
+            for prefix, value in zip(
+                self.PREFIXES,
+                [profile.language, profile.cefr_level, str(int(profile.is_admin))],
+                strict=True,
+            )
+            if value
+        }
+        if data:
+            await self._context_service.set_contexts(user_tg_id=user_tg_id, data=data)
+
+        self._cache.set(user_tg_id, profile)
+        logger.info("User '%d' profile is '%s'", user_tg_id, profile)
+        return profile
+
+    async def invalidate_user_profile(self, user_tg_id: int) -> None:
+        """Invalidate cached user profile in every process."""
+        self._cache.invalidate(user_tg_id)
+        await self._context_service.publish(
+            channel=settings.cache.invalidation_channel, message=str(user_tg_id)
+        )
+        logger.info(
+            "User '%d' profile invalidated, cache hits %d, misses %d",
+            user_tg_id,
+            self._cache.hits,
+            self._cache.misses,
+        )
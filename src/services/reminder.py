@@ -0,0 +1,283 @@
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+from datetime import datetime, time, timedelta
+from time import time as now
+from zoneinfo import ZoneInfo
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.core.config import settings
+from src.core.database import UnitOfWork
+from src.repositories.user import UserRepository, UserRepositoryProtocol
+
+logger = logging.getLogger(__name__)
+
+# Take due reminders and push them one lease ahead, so reminders of crashed worker come back
+CLAIM_SCRIPT = """
+local due = redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', ARGV[1], 'LIMIT', 0, ARGV[2])
+for _, member in ipairs(due) do
+    redis.call('ZADD', KEYS[1], ARGV[3], member)
+end
+return due
+"""
+
+
+def get_next_due(reminder_time: time, timezone: str, timestamp: float) -> float:
+    """Get epoch seconds of next local reminder time after timestamp."""
+    zone = ZoneInfo(timezone)
+    local_date = datetime.fromtimestamp(timestamp, zone).date()
+
+    due = datetime.combine(local_date, reminder_time, zone)
+    if due.timestamp() <= timestamp:
+        due = datetime.combine(local_date + timedelta(days=1), reminder_time, zone)
+    return due.timestamp()
+
+
+class ReminderScheduler:
+    """Daily practice reminders kept in a redis sorted set by due time.
+
+    Workers in every process claim due reminders with one script call, send them and
+    schedule the next day, so each reminder costs a few O(log n) set operations and the
+    users table is never scanned. It is read once on startup only if redis lost the
+    schedule. Learners who practised within the inactivity window are not reminded
+    that day.
+    """
+
+    KEY = "reminders"
+    SCHEDULES_KEY = "reminder_schedules"
+    ACTIVE_PREFIX = "user_active"
+
+    def __init__(
+        self,
+        client: Redis,
+        batch_size: int,
+        poll_interval: float,
+        lease: float,
+        inactivity: int,
+    ) -> None:
+        self._client = client
+        self._claim = client.register_script(CLAIM_SCRIPT)
+        self._batch_size = batch_size
+        self._poll_interval = poll_interval
+        self._lease = lease
+        self._inactivity = inactivity
+        self._workers: list[asyncio.Task[None]] = []
+        self.sent = 0
+        self.skipped = 0
+
+    async def schedule(self, user_tg_id: int, reminder_time: time, timezone: str) -> float:
+        """Schedule daily reminder at local time, return first due epoch seconds."""
+        due = get_next_due(reminder_time, timezone, now())
+        async with self._client.pipeline(transaction=True) as pipe:
+            pipe.hset(self.SCHEDULES_KEY, str(user_tg_id), f"{reminder_time:%H:%M} {timezone}")
+            pipe.zadd(self.KEY, {str(user_tg_id): due})
+            await pipe.execute()
+        return due
+
+    async def is_empty(self) -> bool:
+        """Check whether no reminder is scheduled, as after redis data was lost."""
+        return not await self._client.exists(self.KEY)
+
+    async def restore(self, reminders: dict[int, tuple[time, str]]) -> None:
+        """Schedule reminders of users keyed by telegram id without overwriting newer ones."""
+        timestamp = now()
+        async with self._client.pipeline(transaction=True) as pipe:
+            for user_tg_id, (reminder_time, timezone) in reminders.items():
+                pipe.hsetnx(
+                    self.SCHEDULES_KEY, str(user_tg_id), f"{reminder_time:%H:%M} {timezone}"
+                )
+            pipe.zadd(
+                self.KEY,
+                {
+                    str(user_tg_id): get_next_due(reminder_time, timezone, timestamp)
+                    for user_tg_id, (reminder_time, timezone) in reminders.items()
+                },
+                nx=True,
+            )
+            await pipe.execute()
+
+    async def unschedule(self, *user_tg_ids: int | str) -> None:
+        """Remove reminders of users."""
+        async with self._client.pipeline(transaction=True) as pipe:
+            pipe.zrem(self.KEY, *user_tg_ids)
+            pipe.hdel(self.SCHEDULES_KEY, *(str(user_tg_id) for user_tg_id in user_tg_ids))
+            await pipe.execute()
+
+    async def touch(self, user_tg_id: int) -> None:
+        """Record user practice, skipping reminders within inactivity window."""
+        await self._client.set(f"{self.ACTIVE_PREFIX}:{user_tg_id}", "1", ex=self._inactivity)
+
+    def start(self, send: Callable[[int], Awaitable[bool]], workers: int) -> None:
+        """Start worker tasks sending reminders, send returns false to stop reminding user."""
+        self._workers = [asyncio.create_task(self._work(send)) for _ in range(workers)]
+
+    async def close(self) -> None:
+        """Stop worker tasks, claimed reminders are claimed again after lease."""
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+    async def process_due(self, send: Callable[[int], Awaitable[bool]]) -> int:
+        """Send one batch of due reminders and schedule next ones, return batch size."""
+        claimed_at = now()
+        user_tg_ids: list[str] = await self._claim(
+            keys=[self.KEY], args=[claimed_at, self._batch_size, claimed_at + self._lease]
+        )
+        if not user_tg_ids:
+            return 0
+
+        schedules = await self._client.hmget(self.SCHEDULES_KEY, user_tg_ids)  # type: ignore[misc]
+        active = await self._client.mget(
+            [f"{self.ACTIVE_PREFIX}:{user_tg_id}" for user_tg_id in user_tg_ids]
+        )
+
+        # Reminder may have been removed after it was claimed
+        pending = {
+            user_tg_id: schedule
+            for user_tg_id, schedule in zip(user_tg_ids, schedules, strict=True)
+            if schedule
+        }
+        inactive = [
+            user_tg_id
+            for user_tg_id, is_active in zip(user_tg_ids, active, strict=True)
+            if user_tg_id in pending and not is_active
+        ]
+        self.skipped += len(pending) - len(inactive)
+
+        results = await asyncio.gather(*(self._send(send, int(user)) for user in inactive))
+        for user_tg_id, keep in zip(inactive, results, strict=True):
+            if not keep:
+                del pending[user_tg_id]
+
+        dropped = [user_tg_id for user_tg_id in user_tg_ids if user_tg_id not in pending]
+        if dropped:
+            await self.unschedule(*dropped)
+
+        if pending:
+            timestamp = now()
+            due = {}
+            for user_tg_id, schedule in pending.items():
+                reminder_time, timezone = schedule.split(" ", 1)
+                due[user_tg_id] = get_next_due(
+                    time.fromisoformat(reminder_time), timezone, timestamp
+                )
+            await self._client.zadd(self.KEY, due)
+
+        return len(user_tg_ids)
+
+    async def _send(self, send: Callable[[int], Awaitable[bool]], user_tg_id: int) -> bool:
+        """Send reminder, keep it scheduled unless send asks to stop."""
+        try:
+            keep = await send(user_tg_id)
+        except Exception:
+            logger.exception("Reminder to user '%d' failed", user_tg_id)
+            return True
+
+        if keep:
+            self.sent += 1
+        return keep
+
+    async def _work(self, send: Callable[[int], Awaitable[bool]]) -> None:
+        """Claim due reminders until cancelled, waiting while none are due."""
+        while True:
+            try:
+                claimed = await self.process_due(send)
+            except RedisError:
+                logger.exception("Reminder batch failed")
+                claimed = 0
+
+            if claimed < self._batch_size:
+                await asyncio.sleep(self._poll_interval)
+
+
+class ReminderService:
+    """Practice reminder preferences service.
+
+    The schedule follows the users table, it is changed only once the new preference is
+    committed, so a rolled back update never leaves a reminder the table does not have.
+    """
+
+    def __init__(
+        self,
+        user_repository: UserRepositoryProtocol,
+        scheduler: ReminderScheduler,
+        unit_of_work: UnitOfWork,
+    ) -> None:
+        self._user_repository = user_repository
+        self._scheduler = scheduler
+        self._unit_of_work = unit_of_work
+
+    async def set_reminder(self, user_tg_id: int, reminder_time: time, timezone: str) -> bool:
+        """Save reminder local time and timezone, return false if user does not exist."""
+        if not await self._user_repository.set_user_reminder(
+            reminder_time=reminder_time, timezone=timezone, user_tg_id=user_tg_id
+        ):
+            logger.warning("User '%d' not found, reminder not set", user_tg_id)
+            return False
+
+        async def schedule() -> None:
+            await self._scheduler.schedule(user_tg_id, reminder_time, timezone)
+
+        self._unit_of_work.after_commit(schedule)
+        logger.info("User '%d' reminder set to %s %s", user_tg_id, reminder_time, timezone)
+        return True
+
+    async def disable_reminder(self, user_tg_id: int) -> None:
+        """Disable user reminder."""
+        if await self._user_repository.set_user_reminder(
+            reminder_time=None, timezone=None, user_tg_id=user_tg_id
+        ):
+            self._unit_of_work.after_commit(lambda: self._scheduler.unschedule(user_tg_id))
+        logger.info("User '%d' reminder disabled", user_tg_id)
+
+
+async def restore_reminders(
+    scheduler: ReminderScheduler,
+    session_factory: async_sessionmaker[AsyncSession],
+    batch_size: int,
+) -> int:
+    """Rebuild reminder schedule from users table if redis lost it, return users restored."""
+    if not await scheduler.is_empty():
+        return 0
+
+    restored = 0
+    after_id = 0
+    while True:
+        # Short query per page, so the scan holds no transaction open
+        unit_of_work = UnitOfWork(session_factory)
+        try:
+            reminders = await UserRepository(unit_of_work=unit_of_work).get_user_reminders(
+                after_id, batch_size
+            )
+        finally:
+            await unit_of_work.close()
+
+        if not reminders:
+            break
+
+        await scheduler.restore(
+            {
+                user_tg_id: (reminder_time, timezone or settings.reminders.default_timezone)
+                for _, user_tg_id, reminder_time, timezone in reminders
+            }
+        )
+        restored += len(reminders)
+        after_id = reminders[-1][0]
+
+    logger.info("Reminders of %d users restored from database", restored)
+    return restored
+
+
+def create_reminder_scheduler(client: Redis) -> ReminderScheduler:
+    """Create reminder scheduler from settings."""
+    return ReminderScheduler(
+        client=client,
+        batch_size=settings.reminders.batch_size,
+        poll_interval=settings.reminders.poll_interval,
+        lease=settings.reminders.lease,
+        inactivity=settings.reminders.inactivity,
+    )
@@ -0,0 +1,93 @@
+import hashlib
+import json
+import logging
+import time
+
+from redis.asyncio import Redis
+
+from src.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class ResponseCacheService:
+    """Redis exact-match assistant response cache.
+
+    Responses are keyed by a hash of model, temperature, system prompts and normalized
+    short history, so identical conversation openers are answered without inference.
+    Entries expire by ttl, and the oldest ones are evicted above the size limit.
+    """
+
+    INDEX_KEY = "response_cache:index"
+
+    def __init__(self, client: Redis) -> None:
+        self._client = client
+        self._enabled = settings.response_cache.enabled
+        self._ttl = settings.response_cache.ttl
+        self._max_entries = settings.response_cache.max_entries
+        self._max_temperature = settings.response_cache.max_temperature
+        self._max_history_length = settings.response_cache.max_history_length
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Get share of lookups served from cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def get_key(self, model: str, temperature: float, messages: list[dict[str, str]]) -> str | None:
+        """Get cache key for messages or None if response must not be cached."""
+        if not self._enabled or temperature > self._max_temperature:
+            return None
+
+        system_prompts = [message["content"] for message in messages if message["role"] == "system"]
+        history = [
+            [message["role"], self._normalize(message["content"])]
+            for message in messages
+            if message["role"] != "system"
+        ]
+
+        if len(history) > self._max_history_length:
+            return None
+
+        payload = json.dumps([model, temperature, system_prompts, history], ensure_ascii=False)
+        return f"response_cache:{hashlib.sha256(payload.encode()).hexdigest()}"
+
+    async def get(self, key: str) -> str | None:
+        """Get cached response."""
+        response: str | None = await self._client.get(key)
+
+        if response is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        logger.info("Response cache hit, hit rate %.2f", self.hit_rate)
+        return response
+
+    async def set(self, key: str, response: str) -> None:
+        """Cache response and evict oldest entries above size limit."""
+        now = time.time()
+
+        async with self._client.pipeline(transaction=True) as pipe:
+            pipe.set(key, response, ex=self._ttl)
+            pipe.zadd(self.INDEX_KEY, {key: now})
+            pipe.zremrangebyscore(self.INDEX_KEY, "-inf", now - self._ttl)
+            pipe.zcard(self.INDEX_KEY)
+            *_, size = await pipe.execute()
+
+        if size <= self._max_entries:
+            return
+
+        evicted: list[tuple[str, float]] = await self._client.zpopmin(
+            self.INDEX_KEY, size - self._max_entries
+        )
+        if evicted:
+            await self._client.delete(*[evicted_key for evicted_key, _ in evicted])
+            logger.info("Evicted %d responses from cache", len(evicted))
+
+    @staticmethod
+    def _normalize(text: str) -> str:
+        """Normalize message case and whitespace."""
+        return " ".join(text.casefold().split())
@@ -1,7 +1,10 @@
 import logging
 
+from src.core.config import settings
+from src.core.database import UnitOfWork
 from src.repositories.user import UserRepositoryProtocol
 from src.schemas.user import UserSchema
+from src.services.context import ContextService
 
 logger = logging.getLogger(__name__)
 
@@ -9,15 +12,40 @@ logger = logging.getLogger(__name__)
 class StartService:
     """Start service."""
 
-    def __init__(self, user_repository: UserRepositoryProtocol) -> None:
+    KNOWN_USERS_KEY = "known_users"
+
+    def __init__(
+        self,
+        user_repository: UserRepositoryProtocol,
+        context_service: ContextService,
+        unit_of_work: UnitOfWork,
+    ) -> None:
         self._user_repository = user_repository
+        self._context_service = context_service
+        self._unit_of_work = unit_of_work
 
     async def register_user(self, user: UserSchema) -> int:
         """Register user if not exists, return user id."""
-        if existing_user := await self._user_repository.find_by_user_tg_id(user.tg_id):
-            logger.info("User '%d' already exists", existing_user.tg_id)
-            return existing_user.tg_id
+        if settings.context.known_users_filter and await self._context_service.is_member(
+            key=self.KNOWN_USERS_KEY, member=str(user.tg_id)
+        ):
+            logger.info("User '%d' already known", user.tg_id)
+            return user.tg_id
+
+        # Single statement, so concurrent registrations do not race on unique tg_id
+        user_id = await self._user_repository.upsert_user(user)
+
+        # Known only once saved, otherwise failed commit would skip the user for good
+        if settings.context.known_users_filter:
+            self._unit_of_work.after_commit(
+                lambda: self._context_service.add_member(
+                    key=self.KNOWN_USERS_KEY, member=str(user.tg_id)
+                )
+            )
+
+        if user_id is None:
+            logger.info("User '%d' already exists", user.tg_id)
+            return user.tg_id
 
-        user_id = await self._user_repository.add_new_user(user)
-        logger.info("User '%d' created with id '%d'", user.tg_id, user_id)
+        logger.info("User '%d' saved with id '%d'", user.tg_id, user_id)
         return user_id
@@ -0,0 +1,123 @@
+import asyncio
+import logging
+
+from src.core.config import settings
+from src.inference.gateway import InferenceGateway
+from src.inference.resilience import ResilientCompletions
+from src.services.history import ChatMessage, HistoryService
+from src.texts.prompts import SUMMARY_SYSTEM_PROMPT, SUMMARY_USER_PROMPT
+
+logger = logging.getLogger(__name__)
+
+
+class SummaryService:
+    """Rolling chat history summarization service.
+
+    Once history grows past the threshold, its oldest messages are folded into a
+    running summary by background tasks, so replies never wait for summarization.
+    """
+
+    ROLE_NAMES = {"user": "Student", "assistant": "Teacher"}
+
+    def __init__(
+        self,
+        completions: ResilientCompletions,
+        history_service: HistoryService,
+        gateway: InferenceGateway,
+    ) -> None:
+        self._completions = completions
+        self._history_service = history_service
+        self._gateway = gateway
+        self._threshold = settings.assistant.summary_threshold
+        self._keep = settings.assistant.summary_keep
+        self._tasks: dict[int, asyncio.Task[None]] = {}
+
+    @property
+    def enabled(self) -> bool:
+        """Check whether summarization is enabled."""
+        return self._threshold > 0
+
+    def schedule(self, user_tg_id: int, language: str, history_length: int) -> None:
+        """Start background summarization when history is over the threshold."""
+        if not self.enabled or history_length <= self._threshold:
+            return
+
+        # One summarization per user at a time
+        if user_tg_id in self._tasks:
+            return
+
+        task = asyncio.create_task(self.summarize(user_tg_id, language))
+        self._tasks[user_tg_id] = task
+        task.add_done_callback(lambda _: self._tasks.pop(user_tg_id, None))
+
+    async def summarize(self, user_tg_id: int, language: str) -> None:
+        """Fold oldest history messages into the running summary."""
+        try:
+            history = await self._history_service.get_history(user_tg_id)
+            if len(history) <= self._threshold:
+                return
+
+            folded_history = history[: len(history) - self._keep]
+            previous_summary = await self._history_service.get_summary(user_tg_id)
+
+            summary = await self._create_summary(
+                user_tg_id, language, previous_summary, folded_history
+            )
+            if summary is None:
+                return
+
+            await self._history_service.fold_history(
+                user_tg_id, summary, folded_history, previous_summary
+            )
+        except Exception:
+            logger.exception("Chat history summarization failed for user '%d'", user_tg_id)
+
+    async def close(self) -> None:
+        """Cancel pending summarizations."""
+        tasks = list(self._tasks.values())
+        for task in tasks:
+            task.cancel()
+
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _create_summary(
+        self,
+        user_tg_id: int,
+        language: str,
+        previous_summary: str | None,
+        history: list[ChatMessage],
+    ) -> str | None:
+        """Ask AI to merge messages into previous summary."""
+        conversation = "\n".join(
+            f"{self.ROLE_NAMES.get(message['role'], message['role'])}: {message['content']}"
+            for message in history
+        )
+
+        tokens = settings.assistant.summary_max_tokens + sum(
+            message.get("tokens", 0) for message in history
+        )
+
+        async with self._gateway.slot(tokens, user_tg_id):
+            response = await self._completions.create(
+                model=settings.assistant.model,
+                messages=[
+                    {
+                        "role": "system",
+                        "content": SUMMARY_SYSTEM_PROMPT.format(language=language.title()),
+                    },
+                    {
+                        "role": "user",
+                        "content": SUMMARY_USER_PROMPT.format(
+                            summary=previous_summary or "-", conversation=conversation
+                        ),
+                    },
+                ],
+                max_tokens=settings.assistant.summary_max_tokens,
+            )
+
+        if not response.choices or not response.choices[0].message.content:
+            logger.warning("Empty summary from assistant")
+            return None
+
+        summary: str = response.choices[0].message.content.strip()
+        return summary
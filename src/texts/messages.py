@@ -27,3 +27,76 @@ Let's start learning English! 📚
 ENGLISH_ERROR_MESSAGE = """
 Sorry, I didn't understand that. Please try again. 😊
 """
+
+ENGLISH_BUSY_MESSAGE = """
+I'm talking to a lot of students right now. Please try again in a minute. ⏳
+"""
+
+BROADCAST_USAGE = """
+Использование:
+/broadcast [language=english] [cefr_level=b1] текст
+/broadcast resume
+/broadcast cancel
+"""
+
+BROADCAST_ACTIVE = """
+Предыдущая рассылка не завершена ⏸
+Продолжи её командой /broadcast resume или отмени командой /broadcast cancel
+"""
+
+BROADCAST_NOT_FOUND = """
+Незавершённых рассылок нет 🤷
+"""
+
+BROADCAST_STARTED = """
+Рассылка запущена 🚀
+"""
+
+BROADCAST_RUNNING = """
+Рассылка уже идёт ⏳
+"""
+
+BROADCAST_CANCELLED = """
+Рассылка отменена 🛑
+"""
+
+BROADCAST_PROGRESS = """
+Рассылка: {done} из {total} 📨
+Отправлено: {sent}, ошибок: {failed}
+Скорость: {rate:.1f} сообщ./с, осталось: {eta}
+"""
+
+BROADCAST_FINISHED = """
+Рассылка завершена ✅
+Отправлено: {sent}, ошибок: {failed}
+"""
+
+BROADCAST_STOPPED = """
+Рассылка остановлена из-за ошибки ⚠️
+Отправлено: {sent}, ошибок: {failed}
+Продолжи её командой /broadcast resume
+"""
+
+REMINDER_USAGE = """
+Использование:
+/remind 19:30 [Europe/Moscow] — напоминать каждый день в это время
+/remind off — отключить напоминания
+"""
+
+REMINDER_SET = """
+Буду напоминать о практике каждый день в {time} ({timezone}) ⏰
+"""
+
+REMINDER_DISABLED = """
+Напоминания отключены 🔕
+"""
+
+REMINDER_NOT_STARTED = """
+Сначала запусти бота командой /start
+"""
+
+REMINDER = """
+Пора попрактиковаться! 📚
+
+Напиши мне пару предложений, и продолжим занятие 💬
+"""
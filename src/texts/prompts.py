@@ -10,3 +10,27 @@ RULES:
 
 Start with a level-appropriate {language} greeting and question.
 """
+
+SUMMARY_SYSTEM_PROMPT = """
+You keep notes about a {language} learner for their teacher.
+
+Update the previous notes with the new conversation. Keep only:
+- Recurring mistakes and how they were corrected
+- Topics discussed and the learner's interests
+- Vocabulary and grammar the learner struggles with
+
+Write at most 8 short bullet points in English. Output only the notes.
+"""
+
+SUMMARY_USER_PROMPT = """
+PREVIOUS NOTES:
+{summary}
+
+NEW CONVERSATION:
+{conversation}
+"""
+
+CHAT_SUMMARY_PROMPT = """
+Notes about the student from earlier conversation:
+{summary}
+"""
@@ -3,12 +3,14 @@ from unittest.mock import MagicMock, create_autospec
 
 import pytest
 from sqlalchemy.engine import Result
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.core.cache import LocalCache
+from src.core.database import UnitOfWork
 from src.models.user import User
 from src.repositories.user import UserRepository, UserRepositoryProtocol
-from src.schemas.user import UserSchema
-from src.services import LanguageService, StartService
+from src.schemas.user import UserProfileSchema, UserSchema
+from src.services import ContextService, LanguageService, ProfileService, StartService
 
 
 @pytest.fixture
@@ -40,9 +42,21 @@ def mock_user_repository_protocol() -> Any:
 
 
 @pytest.fixture
-def start_service(mock_user_repository_protocol: Any) -> StartService:
-    """Create StartService with autospecced repository."""
-    return StartService(user_repository=mock_user_repository_protocol)
+def mock_context_service() -> Any:
+    """Create autospecced context service."""
+    return create_autospec(ContextService, instance=True)
+
+
+@pytest.fixture
+def start_service(
+    mock_user_repository_protocol: Any, mock_context_service: Any, mock_unit_of_work: Any
+) -> StartService:
+    """Create StartService with autospecced repository, context and unit of work."""
+    return StartService(
+        user_repository=mock_user_repository_protocol,
+        context_service=mock_context_service,
+        unit_of_work=mock_unit_of_work,
+    )
 
 
 @pytest.fixture
@@ -51,6 +65,26 @@ def language_service(mock_user_repository_protocol: Any) -> LanguageService:
     return LanguageService(user_repository=mock_user_repository_protocol)
 
 
+@pytest.fixture
+def profile_cache() -> LocalCache[int, UserProfileSchema]:
+    """Create empty profile cache."""
+    return LocalCache[int, UserProfileSchema](max_size=10, ttl=60)
+
+
+@pytest.fixture
+def profile_service(
+    mock_user_repository_protocol: Any,
+    mock_context_service: Any,
+    profile_cache: LocalCache[int, UserProfileSchema],
+) -> ProfileService:
+    """Create ProfileService with autospecced repository, context and cache."""
+    return ProfileService(
+        user_repository=mock_user_repository_protocol,
+        context_service=mock_context_service,
+        cache=profile_cache,
+    )
+
+
 @pytest.fixture
 def mock_async_session() -> Any:
     """Create mock async session."""
@@ -63,18 +97,17 @@ def mock_async_session() -> Any:
 
 
 @pytest.fixture
-def mock_session_factory(mock_async_session: Any) -> Any:
-    """Create mock session factory."""
-    factory = create_autospec(async_sessionmaker[AsyncSession], instance=True)
-    factory.return_value.__aenter__.return_value = mock_async_session
-    factory.return_value.__aexit__.return_value = None
-    return factory
+def mock_unit_of_work(mock_async_session: Any) -> Any:
+    """Create mock unit of work."""
+    unit_of_work = create_autospec(UnitOfWork, instance=True)
+    unit_of_work.get_session.return_value = mock_async_session
+    return unit_of_work
 
 
 @pytest.fixture
-def mock_user_repository(mock_session_factory: Any) -> UserRepository:
-    """Create UserRepository with mocked session factory."""
-    return UserRepository(session_factory=mock_session_factory)
+def mock_user_repository(mock_unit_of_work: Any) -> UserRepository:
+    """Create UserRepository with mocked unit of work."""
+    return UserRepository(unit_of_work=mock_unit_of_work)
 
 
 @pytest.fixture
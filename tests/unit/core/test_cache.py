@@ -0,0 +1,78 @@
+from unittest.mock import patch
+
+from src.core.cache import LocalCache
+
+
+class TestLocalCache:
+    """Test LocalCache class."""
+
+    def test_get_counts_hits_and_misses(self) -> None:
+        """Test hit and miss counters."""
+        # Arrange
+        cache = LocalCache[int, str](max_size=10, ttl=60)
+        cache.set(1, "english")
+
+        # Act
+        hit = cache.get(1)
+        miss = cache.get(2)
+
+        # Assert
+        assert hit == "english"
+        assert miss is None
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_least_recently_used_evicted(self) -> None:
+        """Test size limit evicts least recently used entry."""
+        # Arrange
+        cache = LocalCache[int, str](max_size=2, ttl=60)
+        cache.set(1, "a")
+        cache.set(2, "b")
+        cache.get(1)
+
+        # Act
+        cache.set(3, "c")
+
+        # Assert
+        assert len(cache) == 2
+        assert cache.get(2) is None
+        assert cache.get(1) == "a"
+
+    def test_expired_entry_removed(self) -> None:
+        """Test entries expire after ttl."""
+        # Arrange
+        cache = LocalCache[int, str](max_size=10, ttl=60)
+
+        with patch("src.core.cache.monotonic", return_value=0):
+            cache.set(1, "a")
+
+        # Act
+        with patch("src.core.cache.monotonic", return_value=61):
+            result = cache.get(1)
+
+        # Assert
+        assert result is None
+        assert len(cache) == 0
+
+    def test_disabled_cache_stores_nothing(self) -> None:
+        """Test zero size cache is a no-op."""
+        # Arrange
+        cache = LocalCache[int, str](max_size=0, ttl=60)
+
+        # Act
+        cache.set(1, "a")
+
+        # Assert
+        assert cache.get(1) is None
+
+    def test_invalidate(self) -> None:
+        """Test invalidating entry."""
+        # Arrange
+        cache = LocalCache[int, str](max_size=10, ttl=60)
+        cache.set(1, "a")
+
+        # Act
+        cache.invalidate(1)
+        cache.invalidate(2)
+
+        # Assert
+        assert cache.get(1) is None
@@ -0,0 +1,273 @@
+import asyncio
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from redis.exceptions import LockError
+
+from src.core.concurrency import (
+    GenerationRegistry,
+    KeyedLock,
+    MessageCoalescer,
+    UserBusyError,
+    UserLock,
+)
+
+
+@pytest.fixture
+def mock_redis_lock() -> Any:
+    """Create mocked redis lock."""
+    lock = MagicMock()
+    lock.acquire = AsyncMock(return_value=True)
+    lock.release = AsyncMock()
+    return lock
+
+
+@pytest.fixture
+def mock_redis_client(mock_redis_lock: Any) -> Any:
+    """Create mocked redis client."""
+    client = MagicMock()
+    client.lock.return_value = mock_redis_lock
+    return client
+
+
+class TestKeyedLock:
+    """Test KeyedLock class."""
+
+    @pytest.mark.asyncio
+    async def test_same_key_serialized(self) -> None:
+        """Test holders of one key run one after another."""
+        # Arrange
+        keyed_lock = KeyedLock()
+        events: list[str] = []
+
+        async def hold(name: str) -> None:
+            async with keyed_lock.acquire(1):
+                events.append(f"{name} start")
+                await asyncio.sleep(0.01)
+                events.append(f"{name} end")
+
+        # Act
+        await asyncio.gather(hold("first"), hold("second"))
+
+        # Assert
+        assert events == ["first start", "first end", "second start", "second end"]
+        assert keyed_lock._locks == {}
+
+    @pytest.mark.asyncio
+    async def test_different_keys_concurrent(self) -> None:
+        """Test holders of different keys do not wait for each other."""
+        # Arrange
+        keyed_lock = KeyedLock()
+        events: list[str] = []
+
+        async def hold(key: int) -> None:
+            async with keyed_lock.acquire(key):
+                events.append(f"{key} start")
+                await asyncio.sleep(0.01)
+                events.append(f"{key} end")
+
+        # Act
+        await asyncio.gather(hold(1), hold(2))
+
+        # Assert
+        assert events[:2] == ["1 start", "2 start"]
+
+
+class TestUserLock:
+    """Test UserLock class."""
+
+    USER_TG_ID = 123456789
+
+    @pytest.mark.asyncio
+    async def test_hold_acquires_and_releases_redis_lock(
+        self, mock_redis_client: Any, mock_redis_lock: Any
+    ) -> None:
+        """Test redis lock is taken for the user turn."""
+        # Arrange
+        user_lock = UserLock(client=mock_redis_client, timeout=120, blocking_timeout=60)
+
+        # Act
+        async with user_lock.hold(self.USER_TG_ID):
+            mock_redis_lock.release.assert_not_called()
+
+        # Assert
+        mock_redis_client.lock.assert_called_once_with(
+            name=f"user_lock:{self.USER_TG_ID}", timeout=120, blocking_timeout=60
+        )
+        mock_redis_lock.release.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_hold_raises_busy_when_redis_lock_not_acquired(
+        self, mock_redis_client: Any, mock_redis_lock: Any
+    ) -> None:
+        """Test turn is not run without redis lock after waiting too long."""
+        # Arrange
+        mock_redis_lock.acquire.side_effect = LockError
+        user_lock = UserLock(client=mock_redis_client, timeout=120, blocking_timeout=60)
+        entered = False
+
+        # Act
+        with pytest.raises(UserBusyError):
+            async with user_lock.hold(self.USER_TG_ID):
+                entered = True
+
+        # Assert
+        assert not entered
+        mock_redis_lock.release.assert_not_called()
+
+
+class TestMessageCoalescer:
+    """Test MessageCoalescer class."""
+
+    USER_TG_ID = 123456789
+
+    @pytest.mark.asyncio
+    async def test_messages_within_window_merged(self) -> None:
+        """Test first caller gets all messages, later callers get none."""
+        # Arrange
+        coalescer = MessageCoalescer(window=0.05)
+
+        async def send_later(message: str) -> str | None:
+            await asyncio.sleep(0.01)
+            return await coalescer.collect(self.USER_TG_ID, message)
+
+        # Act
+        results = await asyncio.gather(
+            coalescer.collect(self.USER_TG_ID, "Hi"), send_later("How are you?")
+        )
+
+        # Assert
+        assert list(results) == ["Hi\nHow are you?", None]
+
+    @pytest.mark.asyncio
+    async def test_disabled_window_returns_message(self) -> None:
+        """Test zero window passes message through."""
+        # Arrange
+        coalescer = MessageCoalescer(window=0)
+
+        # Act
+        result = await coalescer.collect(self.USER_TG_ID, "Hi")
+
+        # Assert
+        assert result == "Hi"
+
+
+class TestGenerationRegistry:
+    """Test GenerationRegistry class."""
+
+    USER_TG_ID = 123456789
+    CHANNEL = "turn_cancellation"
+
+    @pytest.mark.asyncio
+    async def test_superseded_turn_cancelled_quietly(self, mock_redis_client: Any) -> None:
+        """Test cancelled turn stops its work and ends without error."""
+        # Arrange
+        registry = GenerationRegistry(
+            policies={"start": "all"}, client=mock_redis_client, channel=self.CHANNEL
+        )
+        finished = False
+
+        async def turn() -> None:
+            nonlocal finished
+            async with registry.track(self.USER_TG_ID):
+                await asyncio.sleep(10)
+                finished = True
+
+        task = asyncio.create_task(turn())
+        await asyncio.sleep(0)
+
+        # Act
+        count = registry.cancel(self.USER_TG_ID, action="start")
+        await task
+
+        # Assert
+        assert count == 1
+        assert not finished
+        assert not task.cancelled()
+        assert registry.cancelled == {"start": 1}
+        assert registry.cancel(self.USER_TG_ID, action="start") == 0
+
+    @pytest.mark.asyncio
+    async def test_policies(self, mock_redis_client: Any) -> None:
+        """Test pending policy spares streaming turns and none policy cancels nothing."""
+        # Arrange
+        registry = GenerationRegistry(
+            policies={"cefr_level": "pending", "language": "none"},
+            client=mock_redis_client,
+            channel=self.CHANNEL,
+        )
+        release = asyncio.Event()
+
+        async def turn(streaming: bool) -> None:
+            async with registry.track(self.USER_TG_ID) as generation:
+                generation.streaming = streaming
+                await release.wait()
+
+        tasks = [asyncio.create_task(turn(streaming)) for streaming in (True, False)]
+        await asyncio.sleep(0)
+
+        # Act
+        counts = [
+            registry.cancel(self.USER_TG_ID, action="language"),
+            registry.cancel(self.USER_TG_ID, action="cefr_level"),
+            registry.cancel(self.USER_TG_ID, action="unknown"),
+        ]
+        release.set()
+        await asyncio.gather(*tasks)
+
+        # Assert
+        assert counts == [0, 1, 0]
+        assert registry.cancelled == {"cefr_level": 1}
+
+    @pytest.mark.asyncio
+    async def test_outside_cancellation_propagates(self, mock_redis_client: Any) -> None:
+        """Test cancellation not requested by registry is not swallowed."""
+        # Arrange
+        registry = GenerationRegistry(policies={}, client=mock_redis_client, channel=self.CHANNEL)
+
+        async def turn() -> None:
+            async with registry.track(self.USER_TG_ID):
+                await asyncio.sleep(10)
+
+        task = asyncio.create_task(turn())
+        await asyncio.sleep(0)
+
+        # Act
+        task.cancel()
+
+        # Assert
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    @pytest.mark.asyncio
+    async def test_cancel_published_to_other_workers(self, mock_redis_client: Any) -> None:
+        """Test turn running in another worker is cancelled by published request."""
+        # Arrange
+        mock_redis_client.publish = AsyncMock()
+        registry, other_registry = (
+            GenerationRegistry(
+                policies={"start": "all"}, client=mock_redis_client, channel=self.CHANNEL
+            )
+            for _ in range(2)
+        )
+
+        async def turn() -> None:
+            async with other_registry.track(self.USER_TG_ID):
+                await asyncio.sleep(10)
+
+        task = asyncio.create_task(turn())
+        await asyncio.sleep(0)
+
+        # Act
+        count = await registry.publish_cancel(self.USER_TG_ID, action="start")
+        channel, message = mock_redis_client.publish.call_args.args
+        registry.receive_cancel(message)
+        other_registry.receive_cancel(message)
+        await task
+
+        # Assert
+        assert count == 0
+        assert channel == self.CHANNEL
+        assert registry.cancelled == {}
+        assert other_registry.cancelled == {"start": 1}
@@ -0,0 +1,155 @@
+import pytest
+from pydantic import SecretStr, ValidationError
+
+from src.core.config import (
+    AssistantSettings,
+    BotSettings,
+    GatewaySettings,
+    Settings,
+    WebhookSettings,
+    settings,
+)
+
+
+@pytest.fixture
+def webhook_settings() -> WebhookSettings:
+    """Create webhook settings."""
+    return WebhookSettings(url="https://bot.example.com", secret_token=SecretStr("secret"))
+
+
+class TestBotSettings:
+    """Test BotSettings class."""
+
+    def test_polling_mode_without_webhook(self) -> None:
+        """Test polling mode needs no webhook settings."""
+        # Act
+        bot_settings = BotSettings(token=SecretStr("token"))
+
+        # Assert
+        assert bot_settings.mode == "polling"
+        assert bot_settings.webhook is None
+
+    def test_webhook_mode_with_webhook(self, webhook_settings: WebhookSettings) -> None:
+        """Test webhook mode accepts webhook settings."""
+        # Act
+        bot_settings = BotSettings(
+            token=SecretStr("token"), mode="webhook", webhook=webhook_settings
+        )
+
+        # Assert
+        assert bot_settings.webhook == webhook_settings
+
+    def test_webhook_mode_requires_webhook(self) -> None:
+        """Test webhook mode without webhook settings is rejected."""
+        # Act & Assert
+        with pytest.raises(ValidationError, match="Webhook settings are required"):
+            BotSettings(token=SecretStr("token"), mode="webhook")
+
+
+class TestWebhookSettings:
+    """Test WebhookSettings class."""
+
+    def test_url_and_secret_required(self) -> None:
+        """Test webhook url and secret token are required."""
+        # Act & Assert
+        with pytest.raises(ValidationError) as error:
+            WebhookSettings.model_validate({})
+        assert {err["loc"][0] for err in error.value.errors()} == {"url", "secret_token"}
+
+    def test_workers_must_be_positive(self) -> None:
+        """Test webhook without worker processes is rejected."""
+        # Act & Assert
+        with pytest.raises(ValidationError):
+            WebhookSettings(url="https://bot.example.com", secret_token=SecretStr("s"), workers=0)
+
+
+class TestGatewaySettings:
+    """Test GatewaySettings class."""
+
+    @pytest.mark.parametrize(
+        "field", ["quantum", "default_weight", "premium_weight", "admin_weight", "stats_size"]
+    )
+    def test_scheduling_values_must_be_positive(self, field: str) -> None:
+        """Test zero quantum or weight, which would stall the scheduler, is rejected."""
+        # Act & Assert
+        with pytest.raises(ValidationError):
+            GatewaySettings.model_validate({field: 0})
+
+
+class TestAssistantSettings:
+    """Test AssistantSettings class."""
+
+    ASSISTANT = {"model": "large", "token": "token", "max_tokens": 256, "temperature": 0.7}
+    ROUTE = {"name": "beginner", "model": "small", "max_tokens": 128, "temperature": 0.5}
+
+    def test_routes_served_by_backends(self) -> None:
+        """Test routes whose models have backends are accepted."""
+        # Act
+        assistant = AssistantSettings.model_validate(
+            {
+                **self.ASSISTANT,
+                "routes": [self.ROUTE],
+                "backends": [{"name": "a", "model": "large"}, {"name": "b", "model": "small"}],
+            }
+        )
+
+        # Assert
+        assert [route.model for route in assistant.routes] == ["small"]
+
+    def test_route_model_without_backend(self) -> None:
+        """Test route model no backend serves is rejected instead of silently replaced."""
+        # Act & Assert
+        with pytest.raises(ValidationError, match="small"):
+            AssistantSettings.model_validate({**self.ASSISTANT, "routes": [self.ROUTE]})
+
+    def test_default_model_without_backend(self) -> None:
+        """Test assistant model serving unmatched turns needs a backend too."""
+        # Act & Assert
+        with pytest.raises(ValidationError, match="large"):
+            AssistantSettings.model_validate(
+                {**self.ASSISTANT, "backends": [{"name": "b", "model": "small"}]}
+            )
+
+
+class TestSettings:
+    """Test Settings class."""
+
+    def test_summary_threshold_below_max_history_length(self) -> None:
+        """Test summarization starting before history is trimmed is accepted."""
+        # Arrange
+        data = settings.model_dump()
+        data["assistant"]["summary_threshold"] = data["context"]["max_history_length"] - 1
+
+        # Act
+        loaded = Settings.model_validate(data)
+
+        # Assert
+        assert loaded.assistant.summary_threshold == settings.context.max_history_length - 1
+
+    def test_summary_threshold_reaching_max_history_length(self) -> None:
+        """Test summarization that would start only after trimming is rejected."""
+        # Arrange
+        data = settings.model_dump()
+        data["assistant"]["summary_threshold"] = data["context"]["max_history_length"]
+
+        # Act & Assert
+        with pytest.raises(ValidationError, match="Summary threshold"):
+            Settings.model_validate(data)
+
+    def test_local_backend_with_multiple_webhook_workers(self) -> None:
+        """Test local backend is rejected when every webhook worker would start its server."""
+        # Arrange
+        data = settings.model_dump()
+        data["bot"]["mode"] = "webhook"
+        data["bot"]["webhook"] = {
+            "url": "https://bot.example.com",
+            "secret_token": "secret",
+            "workers": 2,
+        }
+        data["assistant"]["backends"] = [
+            {"name": "cpu", "model": data["assistant"]["model"], "kind": "local"}
+        ]
+
+        # Act & Assert
+        with pytest.raises(ValidationError, match="Local inference backends"):
+            Settings.model_validate(data)
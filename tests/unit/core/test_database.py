@@ -0,0 +1,101 @@
+from typing import Any
+from unittest.mock import AsyncMock, create_autospec
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.core.database import UnitOfWork
+
+
+@pytest.fixture
+def mock_session_factory(mock_async_session: Any) -> Any:
+    """Create mock session factory."""
+    factory = create_autospec(async_sessionmaker[AsyncSession], instance=True)
+    factory.return_value = mock_async_session
+    return factory
+
+
+class TestUnitOfWork:
+    """Test UnitOfWork class."""
+
+    def test_session_opened_lazily_once(self, mock_session_factory: Any) -> None:
+        """Test one session is shared between calls."""
+        # Arrange
+        unit_of_work = UnitOfWork(mock_session_factory)
+        mock_session_factory.assert_not_called()
+
+        # Act
+        first = unit_of_work.get_session()
+        second = unit_of_work.get_session()
+
+        # Assert
+        assert first is second
+        mock_session_factory.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_commit_and_close(
+        self, mock_session_factory: Any, mock_async_session: Any
+    ) -> None:
+        """Test commit and close act on opened session."""
+        # Arrange
+        unit_of_work = UnitOfWork(mock_session_factory)
+        unit_of_work.get_session()
+
+        # Act
+        await unit_of_work.commit()
+        await unit_of_work.close()
+
+        # Assert
+        mock_async_session.commit.assert_called_once()
+        mock_async_session.close.assert_called_once()
+        assert unit_of_work._session is None
+
+    @pytest.mark.asyncio
+    async def test_unused_unit_of_work_does_nothing(
+        self, mock_session_factory: Any, mock_async_session: Any
+    ) -> None:
+        """Test no session is opened for updates without database access."""
+        # Arrange
+        unit_of_work = UnitOfWork(mock_session_factory)
+
+        # Act
+        await unit_of_work.commit()
+        await unit_of_work.rollback()
+        await unit_of_work.close()
+
+        # Assert
+        mock_session_factory.assert_not_called()
+        mock_async_session.commit.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_after_commit_runs_only_on_commit(self, mock_session_factory: Any) -> None:
+        """Test callbacks run after commit and are dropped on rollback."""
+        # Arrange
+        unit_of_work = UnitOfWork(mock_session_factory)
+        dropped, committed = AsyncMock(), AsyncMock()
+
+        # Act
+        unit_of_work.after_commit(dropped)
+        await unit_of_work.rollback()
+        unit_of_work.after_commit(committed)
+        await unit_of_work.commit()
+        await unit_of_work.commit()
+
+        # Assert
+        dropped.assert_not_called()
+        committed.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_failed_after_commit_callback_logged(self, mock_session_factory: Any) -> None:
+        """Test failed callback does not fail committed unit of work."""
+        # Arrange
+        unit_of_work = UnitOfWork(mock_session_factory)
+        failed, next_callback = AsyncMock(side_effect=RuntimeError("Redis down")), AsyncMock()
+        unit_of_work.after_commit(failed)
+        unit_of_work.after_commit(next_callback)
+
+        # Act
+        await unit_of_work.commit()
+
+        # Assert
+        next_callback.assert_called_once()
@@ -0,0 +1,169 @@
+import asyncio
+from time import monotonic
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from aiogram.exceptions import TelegramRetryAfter
+from aiogram.methods import SendChatAction, SendMessage
+
+from src.core.cache import LocalCache
+from src.core.outbound import OutboundLimiter, TokenBucket, bulk_traffic
+
+CHAT_ID = 123456789
+
+
+@pytest.fixture
+def limiter() -> OutboundLimiter:
+    """Create limiter allowing 20 messages per second to a chat."""
+    return OutboundLimiter(
+        global_rate=100.0,
+        chat_rate=20.0,
+        chat_burst=1,
+        typing_interval=5.0,
+        max_retry_after=1.0,
+        chats=LocalCache[int | str, TokenBucket](max_size=100, ttl=60),
+        typing=LocalCache[tuple[int | str, str], float](max_size=100, ttl=5),
+    )
+
+
+@pytest.fixture
+def mock_make_request() -> Any:
+    """Create mocked request sender."""
+    return AsyncMock(return_value=True)
+
+
+def make_message(chat_id: int = CHAT_ID) -> SendMessage:
+    """Create send message request."""
+    return SendMessage(chat_id=chat_id, text="Hello!")
+
+
+class TestOutboundLimiter:
+    """Test OutboundLimiter class."""
+
+    @pytest.mark.asyncio
+    async def test_chat_rate_limited(
+        self, limiter: OutboundLimiter, mock_make_request: Any
+    ) -> None:
+        """Test messages to one chat are spaced while other chats are not delayed."""
+        # Arrange
+        started_at = monotonic()
+
+        # Act
+        await asyncio.gather(
+            *(limiter(mock_make_request, MagicMock(), make_message()) for _ in range(3))
+        )
+        same_chat_time = monotonic() - started_at
+        await asyncio.gather(
+            *(
+                limiter(mock_make_request, MagicMock(), make_message(chat_id))
+                for chat_id in range(3)
+            )
+        )
+
+        # Assert
+        assert same_chat_time >= 0.09
+        assert monotonic() - started_at - same_chat_time < 0.05
+        assert mock_make_request.call_count == 6
+
+    @pytest.mark.asyncio
+    async def test_typing_coalesced(self, limiter: OutboundLimiter, mock_make_request: Any) -> None:
+        """Test repeated typing action within interval is not sent."""
+        # Arrange
+        typing = SendChatAction(chat_id=CHAT_ID, action="typing")
+
+        # Act
+        results: list[Any] = [
+            await limiter(mock_make_request, MagicMock(), typing) for _ in range(3)
+        ]
+
+        # Assert
+        assert results == [True, True, True]
+        mock_make_request.assert_called_once()
+        assert limiter.coalesced == 2
+
+    @pytest.mark.asyncio
+    async def test_interactive_before_bulk(
+        self, limiter: OutboundLimiter, mock_make_request: Any
+    ) -> None:
+        """Test interactive reply waiting for global budget overtakes bulk messages."""
+        # Arrange
+        order: list[int | str] = []
+        mock_make_request.side_effect = lambda bot, method: order.append(method.chat_id)
+
+        async def send_bulk(chat_id: int) -> None:
+            with bulk_traffic():
+                await limiter(mock_make_request, MagicMock(), make_message(chat_id))
+
+        limiter._global_bucket.pause(0.05)
+        bulk = [asyncio.create_task(send_bulk(chat_id)) for chat_id in range(3)]
+        await asyncio.sleep(0)
+
+        # Act
+        await limiter(mock_make_request, MagicMock(), make_message())
+        await asyncio.gather(*bulk)
+
+        # Assert
+        assert order[0] == CHAT_ID
+        assert sorted(order[1:]) == [0, 1, 2]
+
+    @pytest.mark.asyncio
+    async def test_flood_wait_retried(
+        self, limiter: OutboundLimiter, mock_make_request: Any
+    ) -> None:
+        """Test short flood wait of bulk request pauses chat and request is sent again."""
+        # Arrange
+        method = make_message()
+        mock_make_request.side_effect = [
+            TelegramRetryAfter(method=method, message="Flood", retry_after=0),
+            True,
+        ]
+
+        # Act
+        with bulk_traffic():
+            result: Any = await limiter(mock_make_request, MagicMock(), method)
+
+        # Assert
+        assert result is True
+        assert mock_make_request.call_count == 2
+        assert limiter.retried == 1
+
+    @pytest.mark.asyncio
+    async def test_interactive_flood_wait_delivered(
+        self, limiter: OutboundLimiter, mock_make_request: Any
+    ) -> None:
+        """Test interactive request waits for paused chat and is sent after flood wait."""
+        # Arrange
+        method = make_message()
+        mock_make_request.side_effect = [
+            TelegramRetryAfter(method=method, message="Flood", retry_after=1),
+            True,
+        ]
+        started_at = monotonic()
+
+        # Act
+        result: Any = await limiter(mock_make_request, MagicMock(), method)
+
+        # Assert
+        assert result is True
+        assert mock_make_request.call_count == 2
+        assert monotonic() - started_at >= 0.9
+        assert limiter.retried == 1
+
+    @pytest.mark.asyncio
+    async def test_long_flood_wait_raised(
+        self, limiter: OutboundLimiter, mock_make_request: Any
+    ) -> None:
+        """Test flood wait over limit is raised to caller."""
+        # Arrange
+        method = make_message()
+        mock_make_request.side_effect = TelegramRetryAfter(
+            method=method, message="Flood", retry_after=10
+        )
+
+        # Act
+        with pytest.raises(TelegramRetryAfter):
+            await limiter(mock_make_request, MagicMock(), method)
+
+        # Assert
+        mock_make_request.assert_called_once()
@@ -0,0 +1,18 @@
+from redis.asyncio import BlockingConnectionPool
+
+from src.core.config import settings
+from src.core.redis import create_redis_pool
+
+
+class TestCreateRedisPool:
+    """Test create_redis_pool function."""
+
+    def test_pool_blocks_when_exhausted(self) -> None:
+        """Test pool makes callers wait for free connection up to configured timeout."""
+        # Act
+        pool = create_redis_pool()
+
+        # Assert
+        assert isinstance(pool, BlockingConnectionPool)
+        assert pool.max_connections == settings.context.max_connections
+        assert pool.timeout == settings.context.pool_timeout
@@ -0,0 +1,34 @@
+from src.handlers.admin import parse_broadcast
+
+
+class TestParseBroadcast:
+    """Test parse_broadcast function."""
+
+    def test_filters_and_text_parsed(self) -> None:
+        """Test leading filters are parsed and the rest is kept as text."""
+        # Act
+        broadcast = parse_broadcast("language=English cefr_level=B1 New lessons\nTry them")
+
+        # Assert
+        assert broadcast is not None
+        assert broadcast.language == "english"
+        assert broadcast.cefr_level == "b1"
+        assert broadcast.text == "New lessons\nTry them"
+
+    def test_text_without_filters(self) -> None:
+        """Test text without filters is sent to all users."""
+        # Act
+        broadcast = parse_broadcast("Hello language=english")
+
+        # Assert
+        assert broadcast is not None
+        assert broadcast.language is None
+        assert broadcast.text == "Hello language=english"
+
+    def test_empty_args(self) -> None:
+        """Test empty arguments are rejected."""
+        # Act
+        broadcast = parse_broadcast("")
+
+        # Assert
+        assert broadcast is None
@@ -0,0 +1,122 @@
+from collections.abc import AsyncIterator
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.core.concurrency import Generation
+from src.handlers.assistant import TELEGRAM_MESSAGE_LENGTH, answer_stream, split_message
+
+
+async def make_stream(*chunks: str) -> AsyncIterator[str]:
+    """Create text stream."""
+    for chunk in chunks:
+        yield chunk
+
+
+@pytest.fixture
+def mock_message() -> Any:
+    """Create mocked message."""
+    message = AsyncMock()
+    message.answer.return_value = AsyncMock()
+    return message
+
+
+class TestAnswerStream:
+    """Test answer_stream function."""
+
+    @pytest.mark.asyncio
+    async def test_first_chunk_sent_and_final_text_edited(self, mock_message: Any) -> None:
+        """Test first chunk is sent immediately and final text is edited in."""
+        # Act
+        result = await answer_stream(mock_message, make_stream("Hello", ", ", "world!"))
+
+        # Assert
+        assert result == "Hello, world!"
+        mock_message.answer.assert_called_once_with("Hello", parse_mode=None)
+        mock_message.answer.return_value.edit_text.assert_called_once_with(
+            "Hello, world!", parse_mode=None
+        )
+
+    @pytest.mark.asyncio
+    async def test_generation_marked_streaming(self, mock_message: Any) -> None:
+        """Test turn is marked streaming once first text is shown."""
+        # Arrange
+        generation = Generation(MagicMock())
+
+        # Act
+        await answer_stream(mock_message, make_stream("Hello"), generation)
+
+        # Assert
+        assert generation.streaming
+
+    @pytest.mark.asyncio
+    async def test_edits_throttled(self, mock_message: Any) -> None:
+        """Test intermediate edits respect time and character throttle."""
+        # Arrange
+        chunks = ["a" * 50 for _ in range(5)]
+
+        with patch("src.handlers.assistant.settings") as mock_settings:
+            mock_settings.assistant.stream_edit_interval = 0
+            mock_settings.assistant.stream_edit_min_chars = 100
+
+            # Act
+            await answer_stream(mock_message, make_stream(*chunks))
+
+        # Assert
+        edits = mock_message.answer.return_value.edit_text.call_args_list
+        assert [len(call.args[0]) for call in edits] == [150, 250]
+
+    @pytest.mark.asyncio
+    async def test_empty_stream(self, mock_message: Any) -> None:
+        """Test empty stream sends nothing."""
+        # Act
+        result = await answer_stream(mock_message, make_stream(" "))
+
+        # Assert
+        assert result == ""
+        mock_message.answer.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_long_text_continued_in_next_message(self, mock_message: Any) -> None:
+        """Test text exceeding Telegram message length is split across messages."""
+        # Arrange
+        first = "a" * (TELEGRAM_MESSAGE_LENGTH - 10)
+        second = "b" * 100
+
+        # Act
+        result = await answer_stream(mock_message, make_stream(first, " ", second))
+
+        # Assert
+        assert result == f"{first} {second}"
+        answers = [call.args[0] for call in mock_message.answer.call_args_list]
+        assert answers == [first, second]
+        mock_message.answer.return_value.edit_text.assert_not_called()
+
+
+class TestSplitMessage:
+    """Test split_message function."""
+
+    def test_split_on_line_break(self) -> None:
+        """Test text is split on last line break fitting the message."""
+        # Arrange
+        text = "a" * 3000 + "\n" + "b" * 2000
+
+        # Act
+        head, rest = split_message(text)
+
+        # Assert
+        assert head == "a" * 3000
+        assert rest == "b" * 2000
+
+    def test_split_without_breaks(self) -> None:
+        """Test text without breaks is split at Telegram message length."""
+        # Arrange
+        text = "a" * (TELEGRAM_MESSAGE_LENGTH + 5)
+
+        # Act
+        head, rest = split_message(text)
+
+        # Assert
+        assert len(head) == TELEGRAM_MESSAGE_LENGTH
+        assert rest == "a" * 5
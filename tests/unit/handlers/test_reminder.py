@@ -0,0 +1,31 @@
+from datetime import time
+
+from src.handlers.reminder import parse_reminder
+
+
+class TestParseReminder:
+    """Test parse_reminder function."""
+
+    def test_time_and_timezone(self) -> None:
+        """Test local time and timezone are parsed."""
+        # Act
+        reminder = parse_reminder("9:05 Asia/Tokyo")
+
+        # Assert
+        assert reminder == (time(9, 5), "Asia/Tokyo")
+
+    def test_default_timezone(self) -> None:
+        """Test time without timezone uses default timezone."""
+        # Act
+        reminder = parse_reminder("19:30")
+
+        # Assert
+        assert reminder == (time(19, 30), "Europe/Moscow")
+
+    def test_invalid_args(self) -> None:
+        """Test invalid time or unknown timezone are rejected."""
+        # Act
+        reminders = [parse_reminder(args) for args in ("25:00", "19:30 Mars/Base", "", "soon")]
+
+        # Assert
+        assert reminders == [None, None, None, None]
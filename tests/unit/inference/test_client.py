@@ -0,0 +1,144 @@
+import asyncio
+from collections.abc import AsyncIterator
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+import pytest_asyncio
+from aiohttp import ClientTimeout, TCPConnector, web
+
+from src.inference.client import PooledInferenceClient, check_base_client
+
+COMPLETION = {
+    "id": "completion",
+    "created": 0,
+    "model": "model",
+    "system_fingerprint": "",
+    "object": "chat.completion",
+    "choices": [
+        {
+            "index": 0,
+            "finish_reason": "stop",
+            "message": {"role": "assistant", "content": "Hello!"},
+        }
+    ],
+    "usage": {"prompt_tokens": 1, "completion_tokens": 1, "total_tokens": 2},
+}
+
+
+@pytest_asyncio.fixture
+async def stub_server() -> AsyncIterator[tuple[str, set[Any]]]:
+    """Run local stub inference server and collect client peers."""
+    peers: set[Any] = set()
+
+    async def handle(request: web.Request) -> web.Response:
+        if request.transport:
+            peers.add(request.transport.get_extra_info("peername"))
+        if (await request.json()).get("model") == "slow":
+            await asyncio.sleep(1)
+        return web.json_response(COMPLETION)
+
+    app = web.Application()
+    app.router.add_post("/v1/chat/completions", handle)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = runner.addresses[0][1]
+
+    yield f"http://127.0.0.1:{port}/v1", peers
+
+    await runner.cleanup()
+
+
+class TestPooledInferenceClient:
+    """Test PooledInferenceClient class."""
+
+    MESSAGES = [{"role": "user", "content": "Hi"}]
+
+    @pytest.mark.asyncio
+    async def test_connection_reused_between_requests(
+        self, stub_server: tuple[str, set[Any]]
+    ) -> None:
+        """Test sequential requests reuse one keep-alive connection."""
+        # Arrange
+        base_url, peers = stub_server
+        client = PooledInferenceClient(
+            connector=TCPConnector(limit=10),
+            timeout=ClientTimeout(total=5),
+            token="token",
+            base_url=base_url,
+        )
+
+        # Act
+        for _ in range(3):
+            response = await client.chat.completions.create(messages=self.MESSAGES)
+            assert response.choices[0].message.content == "Hello!"
+
+        # Assert
+        assert len(peers) == 1
+        assert client._sessions == {}
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_cancelled_call_closes_session(self, stub_server: tuple[str, set[Any]]) -> None:
+        """Test cancelled request does not leave its session open."""
+        # Arrange
+        base_url, _ = stub_server
+        client = PooledInferenceClient(
+            connector=TCPConnector(limit=10),
+            timeout=ClientTimeout(total=5),
+            token="token",
+            base_url=base_url,
+        )
+        task = asyncio.create_task(
+            client.chat.completions.create(model="slow", messages=self.MESSAGES)
+        )
+        await asyncio.sleep(0.1)
+
+        # Act
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        # Assert
+        assert client._sessions == {}
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_close_closes_connector(self, stub_server: tuple[str, set[Any]]) -> None:
+        """Test closing client closes shared connector."""
+        # Arrange
+        base_url, _ = stub_server
+        connector = TCPConnector(limit=10)
+        client = PooledInferenceClient(
+            connector=connector, timeout=ClientTimeout(total=5), token="token", base_url=base_url
+        )
+
+        # Act
+        await client.close()
+
+        # Assert
+        assert connector.closed
+
+
+class TestCheckBaseClient:
+    """Test check_base_client function."""
+
+    def test_installed_base_client_passes(self) -> None:
+        """Test installed huggingface_hub has the overridden hooks."""
+        # Act & Assert
+        check_base_client()
+
+    def test_changed_hook_fails(self) -> None:
+        """Test changed private hook signature fails loudly."""
+
+        # Arrange
+        def _inner_post(self: Any, request_parameters: Any) -> None: ...
+
+        # Act & Assert
+        with (
+            patch("src.inference.client.AsyncInferenceClient._inner_post", _inner_post),
+            pytest.raises(ImportError, match="_inner_post"),
+        ):
+            check_base_client()
@@ -0,0 +1,200 @@
+import asyncio
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from redis.exceptions import ConnectionError
+
+from src.inference.gateway import InferenceBusyError, InferenceGateway, RateLimiter
+from src.inference.scheduler import FairScheduler
+
+USER_TG_ID = 123456789
+
+
+@pytest.fixture
+def mock_script() -> Any:
+    """Create mocked token bucket script granting budget."""
+    return AsyncMock(return_value="0")
+
+
+@pytest.fixture
+def rate_limiter(mock_script: Any) -> RateLimiter:
+    """Create RateLimiter with mocked redis script."""
+    client = MagicMock()
+    client.register_script.return_value = mock_script
+    return RateLimiter(client=client, requests_per_minute=60, tokens_per_minute=1000)
+
+
+def make_gateway(
+    rate_limiter: RateLimiter, max_queue_size: int = 1, queue_timeout: float = 1.0
+) -> InferenceGateway:
+    """Create gateway with one slot."""
+    return InferenceGateway(
+        rate_limiter=rate_limiter,
+        scheduler=FairScheduler(quantum=10, stats_size=100),
+        max_concurrency=1,
+        max_queue_size=max_queue_size,
+        max_user_queue_size=max_queue_size,
+        queue_timeout=queue_timeout,
+    )
+
+
+class TestInferenceGateway:
+    """Test InferenceGateway class."""
+
+    @pytest.mark.asyncio
+    async def test_queued_requests_served_in_order(self, rate_limiter: RateLimiter) -> None:
+        """Test requests over concurrency limit wait and get slots in arrival order."""
+        # Arrange
+        gateway = make_gateway(rate_limiter, max_queue_size=2)
+        order: list[int] = []
+
+        async def request(number: int) -> None:
+            async with gateway.slot(tokens=10, user_tg_id=USER_TG_ID):
+                order.append(number)
+                await asyncio.sleep(0.01)
+
+        # Act
+        await asyncio.gather(*(request(number) for number in range(3)))
+
+        # Assert
+        assert order == [0, 1, 2]
+        assert gateway.active == 0
+        assert gateway.queued == 0
+        stats = gateway.scheduler.get_stats(USER_TG_ID)
+        assert stats is not None
+        assert stats.served == 3
+        assert stats.max_wait > 0
+
+    @pytest.mark.asyncio
+    async def test_user_queue_limit(self, rate_limiter: RateLimiter) -> None:
+        """Test user over per-user queue limit is rejected while others still queue."""
+        # Arrange
+        gateway = InferenceGateway(
+            rate_limiter=rate_limiter,
+            scheduler=FairScheduler(quantum=10, stats_size=100),
+            max_concurrency=1,
+            max_queue_size=10,
+            max_user_queue_size=1,
+            queue_timeout=1.0,
+        )
+        release = asyncio.Event()
+
+        async def request(user_tg_id: int) -> None:
+            async with gateway.slot(tokens=10, user_tg_id=user_tg_id):
+                await release.wait()
+
+        tasks = [asyncio.create_task(request(USER_TG_ID)) for _ in range(2)]
+        tasks.append(asyncio.create_task(request(USER_TG_ID + 1)))
+        await asyncio.sleep(0)
+
+        # Act
+        with pytest.raises(InferenceBusyError):
+            async with gateway.slot(tokens=10, user_tg_id=USER_TG_ID):
+                pass
+
+        # Assert
+        assert gateway.queued == 2
+        release.set()
+        await asyncio.gather(*tasks)
+
+    @pytest.mark.asyncio
+    async def test_full_queue_rejected_fast(self, rate_limiter: RateLimiter) -> None:
+        """Test request finding the queue full fails immediately."""
+        # Arrange
+        gateway = make_gateway(rate_limiter)
+        release = asyncio.Event()
+
+        async def request() -> None:
+            async with gateway.slot(tokens=10, user_tg_id=USER_TG_ID):
+                await release.wait()
+
+        tasks = [asyncio.create_task(request()) for _ in range(2)]
+        await asyncio.sleep(0)
+
+        # Act
+        with pytest.raises(InferenceBusyError):
+            async with gateway.slot(tokens=10, user_tg_id=USER_TG_ID):
+                pass
+
+        # Assert
+        assert gateway.rejected == 1
+        release.set()
+        await asyncio.gather(*tasks)
+        assert gateway.active == 0
+
+    @pytest.mark.asyncio
+    async def test_queue_timeout_rejected(self, rate_limiter: RateLimiter) -> None:
+        """Test queued request not getting a slot in time fails and leaves the queue."""
+        # Arrange
+        gateway = make_gateway(rate_limiter, queue_timeout=0.01)
+        release = asyncio.Event()
+
+        async def request() -> None:
+            async with gateway.slot(tokens=10, user_tg_id=USER_TG_ID):
+                await release.wait()
+
+        task = asyncio.create_task(request())
+        await asyncio.sleep(0)
+
+        # Act
+        with pytest.raises(InferenceBusyError):
+            async with gateway.slot(tokens=10, user_tg_id=USER_TG_ID):
+                pass
+
+        # Assert
+        assert gateway.queued == 0
+        release.set()
+        await task
+        assert gateway.active == 0
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_over_deadline_rejected(
+        self, rate_limiter: RateLimiter, mock_script: Any
+    ) -> None:
+        """Test request is rejected when rate budget frees up after the deadline."""
+        # Arrange
+        gateway = make_gateway(rate_limiter)
+        mock_script.return_value = "30"
+
+        # Act
+        with pytest.raises(InferenceBusyError):
+            async with gateway.slot(tokens=10, user_tg_id=USER_TG_ID):
+                pass
+
+        # Assert
+        assert gateway.active == 0
+        assert gateway.rejected == 1
+
+
+class TestRateLimiter:
+    """Test RateLimiter class."""
+
+    @pytest.mark.asyncio
+    async def test_waits_for_budget(self, rate_limiter: RateLimiter, mock_script: Any) -> None:
+        """Test limiter retries after returned wait time with request and token costs."""
+        # Arrange
+        mock_script.side_effect = ["0.01", "0"]
+
+        # Act
+        await rate_limiter.acquire(tokens=100, deadline=asyncio.get_running_loop().time() + 1)
+
+        # Assert
+        assert mock_script.call_count == 2
+        mock_script.assert_called_with(
+            keys=[RateLimiter.REQUESTS_KEY, RateLimiter.TOKENS_KEY], args=[60, 1, 1000, 100]
+        )
+
+    @pytest.mark.asyncio
+    async def test_fails_open_without_redis(
+        self, rate_limiter: RateLimiter, mock_script: Any
+    ) -> None:
+        """Test limiter lets request through when redis is unavailable."""
+        # Arrange
+        mock_script.side_effect = ConnectionError
+
+        # Act
+        await rate_limiter.acquire(tokens=100, deadline=asyncio.get_running_loop().time() + 1)
+
+        # Assert
+        mock_script.assert_called_once()
@@ -0,0 +1,200 @@
+import asyncio
+import json
+import subprocess
+from collections.abc import AsyncIterator
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+import pytest_asyncio
+from aiohttp import web
+
+from src.core.config import BackendSettings
+from src.inference.client import RemoteCompletionClient, create_inference_client
+from src.inference.local import LocalCompletionClient, create_local_client
+
+MESSAGES = [{"role": "user", "content": "Hi"}]
+
+
+def make_chunk(content: str | None, finish_reason: str | None = None) -> bytes:
+    """Create server-sent completion chunk."""
+    chunk = {
+        "id": "completion",
+        "created": 0,
+        "model": "local",
+        "system_fingerprint": "",
+        "object": "chat.completion.chunk",
+        "choices": [
+            {
+                "index": 0,
+                "delta": {"role": "assistant", "content": content},
+                "finish_reason": finish_reason,
+            }
+        ],
+    }
+    return f"data: {json.dumps(chunk)}\n\n".encode()
+
+
+class StubServer:
+    """Stub llama.cpp server loading model for a few health checks and streaming tokens."""
+
+    def __init__(self, loading_checks: int) -> None:
+        self.loading_checks = loading_checks
+        self.health_checks = 0
+        self.release = asyncio.Event()
+        self.url = ""
+
+    async def health(self, request: web.Request) -> web.Response:
+        """Answer unavailable while model is loading."""
+        self.health_checks += 1
+        return web.Response(status=503 if self.health_checks <= self.loading_checks else 200)
+
+    async def completions(self, request: web.Request) -> web.StreamResponse:
+        """Stream first token at once and the rest once released."""
+        response = web.StreamResponse(headers={"Content-Type": "text/event-stream"})
+        await response.prepare(request)
+        await response.write(make_chunk("Hel"))
+        await self.release.wait()
+        await response.write(make_chunk("lo", finish_reason="stop"))
+        await response.write(b"data: [DONE]\n\n")
+        return response
+
+
+@pytest_asyncio.fixture
+async def stub_server() -> AsyncIterator[StubServer]:
+    """Run stub llama.cpp server."""
+    server = StubServer(loading_checks=2)
+    app = web.Application()
+    app.router.add_get("/health", server.health)
+    app.router.add_post("/v1/chat/completions", server.completions)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    server.url = f"http://127.0.0.1:{runner.addresses[0][1]}"
+
+    yield server
+
+    server.release.set()
+    await runner.cleanup()
+
+
+@pytest.fixture
+def mock_process() -> Any:
+    """Create mocked running server process."""
+    process = MagicMock(spec=subprocess.Popen)
+    process.poll.return_value = None
+    return process
+
+
+@pytest_asyncio.fixture
+async def local_client(
+    stub_server: StubServer, mock_process: Any
+) -> AsyncIterator[LocalCompletionClient]:
+    """Create local client of stub server."""
+    client = LocalCompletionClient(
+        process=mock_process,
+        client=RemoteCompletionClient(
+            create_inference_client(base_url=f"{stub_server.url}/v1", token="local")
+        ),
+        health_url=f"{stub_server.url}/health",
+        start_timeout=5,
+    )
+    with patch("src.inference.local.HEALTH_INTERVAL", 0.01):
+        yield client
+    await client.close()
+
+
+class TestLocalCompletionClient:
+    """Test LocalCompletionClient class."""
+
+    @pytest.mark.asyncio
+    async def test_waits_for_model_loaded(
+        self, local_client: LocalCompletionClient, stub_server: StubServer
+    ) -> None:
+        """Test requests are sent once server has loaded model."""
+        # Arrange
+        stub_server.release.set()
+
+        # Act
+        stream = await local_client.create(messages=MESSAGES, model="local", stream=True)
+        chunks = [chunk async for chunk in stream]
+
+        # Assert
+        assert stub_server.health_checks == 3
+        assert "".join(chunk.choices[0].delta.content for chunk in chunks) == "Hello"
+
+    @pytest.mark.asyncio
+    async def test_stream_yields_tokens_as_generated(
+        self, local_client: LocalCompletionClient, stub_server: StubServer
+    ) -> None:
+        """Test stream yields first token before generation has finished."""
+        # Act
+        stream = await local_client.create(messages=MESSAGES, model="local", stream=True)
+        first = await asyncio.wait_for(anext(stream), timeout=1)
+
+        # Assert
+        assert first.choices[0].delta.content == "Hel"
+        assert not stub_server.release.is_set()
+        stub_server.release.set()
+        assert [chunk.choices[0].delta.content async for chunk in stream] == ["lo"]
+
+    @pytest.mark.asyncio
+    async def test_exited_server_fails_request(
+        self, local_client: LocalCompletionClient, mock_process: Any
+    ) -> None:
+        """Test request fails at once when server process has exited."""
+        # Arrange
+        mock_process.poll.return_value = 1
+
+        # Act & Assert
+        with pytest.raises(RuntimeError, match="exited with code 1"):
+            await local_client.create(messages=MESSAGES, model="local")
+
+    @pytest.mark.asyncio
+    async def test_close_stops_server(
+        self, local_client: LocalCompletionClient, mock_process: Any
+    ) -> None:
+        """Test closing client terminates server process."""
+        # Act
+        await local_client.close()
+
+        # Assert
+        mock_process.terminate.assert_called_once()
+        mock_process.wait.assert_called_once()
+
+
+class TestCreateLocalClient:
+    """Test create_local_client function."""
+
+    @pytest.mark.asyncio
+    async def test_server_started_with_parallel_slots(self) -> None:
+        """Test server decodes parallel slots in continuous batch with context per slot."""
+        # Arrange
+        backend_settings = BackendSettings(
+            name="cpu", model="local", kind="local", model_path="model.gguf", parallel=8
+        )
+
+        # Act
+        with (
+            patch("src.inference.local.subprocess.Popen") as mock_popen,
+            patch("src.inference.local.settings") as mock_settings,
+        ):
+            mock_settings.assistant.context_budget = 2048
+            client = create_local_client(backend_settings)
+            await client.close()
+
+        # Assert
+        command = mock_popen.call_args.args[0]
+        assert command[command.index("--parallel") + 1] == "8"
+        assert command[command.index("--ctx-size") + 1] == str(2048 * 8)
+        assert "--cont-batching" in command
+
+    def test_model_path_required(self) -> None:
+        """Test local backend without model file is rejected."""
+        # Arrange
+        backend_settings = BackendSettings(name="cpu", model="local", kind="local")
+
+        # Act & Assert
+        with pytest.raises(ValueError, match="no model path"):
+            create_local_client(backend_settings)
@@ -0,0 +1,235 @@
+import asyncio
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from aiohttp import ClientResponseError
+
+from src.inference.resilience import LatencyTracker, ResilientCompletions, is_retryable
+from src.inference.router import Backend, CircuitState, InferenceRouter
+
+MESSAGES = [{"role": "user", "content": "Hi"}]
+
+
+def make_response(content: str) -> Any:
+    """Create completion response."""
+    return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+
+
+def make_status_error(status: int) -> ClientResponseError:
+    """Create HTTP error with status."""
+    return ClientResponseError(request_info=MagicMock(), history=(), status=status)
+
+
+def make_backend(name: str) -> Backend:
+    """Create backend with mocked inference client."""
+    client = MagicMock()
+    client.create = AsyncMock()
+    return Backend(name=name, model=name, client=client)
+
+
+def create_mock(backend: Backend) -> Any:
+    """Get mocked create method of backend client."""
+    return backend.client.create
+
+
+@pytest.fixture
+def primary() -> Backend:
+    """Create primary backend."""
+    return make_backend("primary")
+
+
+@pytest.fixture
+def secondary() -> Backend:
+    """Create secondary backend."""
+    return make_backend("secondary")
+
+
+def make_completions(
+    *backends: Backend, tracker: LatencyTracker | None = None, hedge: bool = False
+) -> ResilientCompletions:
+    """Create completions with short timeout and no backoff."""
+    return ResilientCompletions(
+        router=InferenceRouter(
+            backends=list(backends), ewma_alpha=0.5, failure_threshold=1, open_timeout=60
+        ),
+        tracker=tracker or LatencyTracker(window=10, min_samples=1),
+        attempt_timeout=0.2,
+        max_attempts=3,
+        backoff_base=0.0,
+        backoff_max=0.0,
+        hedge=hedge,
+    )
+
+
+class TestIsRetryable:
+    """Test is_retryable function."""
+
+    def test_errors(self) -> None:
+        """Test timeouts, throttling and server errors are retryable, bad requests not."""
+        # Assert
+        assert is_retryable(TimeoutError())
+        assert is_retryable(make_status_error(429))
+        assert is_retryable(make_status_error(503))
+        assert not is_retryable(make_status_error(400))
+        assert not is_retryable(ValueError())
+
+
+class TestResilientCompletions:
+    """Test ResilientCompletions class."""
+
+    @pytest.mark.asyncio
+    async def test_retries_retryable_errors(self, primary: Backend) -> None:
+        """Test retryable failures are retried until success."""
+        # Arrange
+        create_mock(primary).side_effect = [
+            make_status_error(503),
+            TimeoutError(),
+            make_response("Hello!"),
+        ]
+        completions = make_completions(primary)
+
+        # Act
+        result = await completions.create(messages=MESSAGES)
+
+        # Assert
+        assert result.choices[0].message.content == "Hello!"
+        assert create_mock(primary).call_count == 3
+        assert create_mock(primary).call_args.kwargs["model"] == "primary"
+
+    @pytest.mark.asyncio
+    async def test_retry_skips_failed_backend(self, primary: Backend, secondary: Backend) -> None:
+        """Test retry goes to another backend and failed one is ejected."""
+        # Arrange
+        primary.latency = 0.1
+        secondary.latency = 0.5
+        create_mock(primary).side_effect = make_status_error(503)
+        create_mock(secondary).return_value = make_response("Hello!")
+        completions = make_completions(primary, secondary)
+
+        # Act
+        result = await completions.create(messages=MESSAGES)
+
+        # Assert
+        assert result.choices[0].message.content == "Hello!"
+        create_mock(primary).assert_called_once()
+        assert primary.state == CircuitState.OPEN
+
+    @pytest.mark.asyncio
+    async def test_non_retryable_error_raised(self, primary: Backend) -> None:
+        """Test bad request is not retried and does not hurt backend health."""
+        # Arrange
+        create_mock(primary).side_effect = make_status_error(400)
+        completions = make_completions(primary)
+
+        # Act
+        with pytest.raises(ClientResponseError):
+            await completions.create(messages=MESSAGES)
+
+        # Assert
+        create_mock(primary).assert_called_once()
+        assert primary.state == CircuitState.CLOSED
+
+    @pytest.mark.asyncio
+    async def test_attempt_timeout(self, primary: Backend) -> None:
+        """Test stuck attempt is abandoned after deadline and retried."""
+        # Arrange
+        mock_create = create_mock(primary)
+
+        async def create(**kwargs: Any) -> Any:
+            if mock_create.call_count == 1:
+                await asyncio.sleep(10)
+            return make_response("Hello!")
+
+        mock_create.side_effect = create
+        completions = make_completions(primary)
+
+        # Act
+        result = await completions.create(messages=MESSAGES)
+
+        # Assert
+        assert result.choices[0].message.content == "Hello!"
+        assert mock_create.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_slow_request_hedged(self, primary: Backend, secondary: Backend) -> None:
+        """Test request slower than p90 is duplicated to next backend and loser cancelled."""
+        # Arrange
+        cancelled = asyncio.Event()
+
+        async def create_slow(**kwargs: Any) -> Any:
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+            return make_response("primary")
+
+        primary.latency = 0.01
+        secondary.latency = 0.02
+        create_mock(primary).side_effect = create_slow
+        create_mock(secondary).return_value = make_response("secondary")
+        tracker = LatencyTracker(window=10, min_samples=1)
+        tracker.record(0.01)
+        completions = make_completions(primary, secondary, tracker=tracker, hedge=True)
+
+        # Act
+        result = await completions.create(messages=MESSAGES)
+
+        # Assert
+        assert result.choices[0].message.content == "secondary"
+        assert cancelled.is_set()
+        assert completions.hedged == 1
+        assert completions.hedge_wins == 1
+
+    @pytest.mark.asyncio
+    async def test_not_hedged_without_latency_samples(
+        self, primary: Backend, secondary: Backend
+    ) -> None:
+        """Test hedging waits until p90 latency is observed."""
+        # Arrange
+        create_mock(primary).return_value = make_response("Hello!")
+        completions = make_completions(
+            primary, secondary, tracker=LatencyTracker(window=10, min_samples=5), hedge=True
+        )
+
+        # Act
+        await completions.create(messages=MESSAGES)
+
+        # Assert
+        create_mock(primary).assert_called_once()
+        create_mock(secondary).assert_not_called()
+        assert completions.hedged == 0
+
+    @pytest.mark.asyncio
+    async def test_stream_retried_until_opened(self, primary: Backend) -> None:
+        """Test stream is retried when it fails to open."""
+        # Arrange
+        stream = MagicMock()
+        create_mock(primary).side_effect = [make_status_error(429), stream]
+        completions = make_completions(primary)
+
+        # Act
+        result = await completions.create_stream(messages=MESSAGES)
+
+        # Assert
+        assert result is stream
+        assert create_mock(primary).call_args.kwargs["stream"] is True
+
+
+class TestLatencyTracker:
+    """Test LatencyTracker class."""
+
+    def test_percentile(self) -> None:
+        """Test percentile is computed over the latest window."""
+        # Arrange
+        tracker = LatencyTracker(window=10, min_samples=10)
+
+        # Act
+        for latency in range(20):
+            tracker.record(float(latency))
+
+        # Assert
+        assert tracker.percentile(0.9) == 19.0
+        assert tracker.percentile(0.5) == 15.0
@@ -0,0 +1,142 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.inference.router import Backend, CircuitState, InferenceRouter
+
+
+def make_backend(name: str, model: str = "model", latency: float | None = None) -> Backend:
+    """Create backend with mocked client and observed latency."""
+    backend = Backend(name=name, model=model, client=MagicMock())
+    backend.latency = latency
+    return backend
+
+
+def make_router(*backends: Backend, open_timeout: float = 30.0) -> InferenceRouter:
+    """Create router ejecting backends after two failures."""
+    return InferenceRouter(
+        backends=list(backends), ewma_alpha=0.5, failure_threshold=2, open_timeout=open_timeout
+    )
+
+
+class TestInferenceRouter:
+    """Test InferenceRouter class."""
+
+    def test_select_fastest(self) -> None:
+        """Test backend with the lowest latency is selected."""
+        # Arrange
+        slow = make_backend("slow", latency=2.0)
+        fast = make_backend("fast", latency=0.5)
+        router = make_router(slow, fast)
+
+        # Act
+        backend = router.select()
+
+        # Assert
+        assert backend is fast
+
+    def test_select_weight_and_model(self) -> None:
+        """Test weight scales latency and backends serving requested model are preferred."""
+        # Arrange
+        heavy = make_backend("heavy", latency=2.0)
+        heavy.weight = 8.0
+        light = make_backend("light", latency=0.5)
+        other = make_backend("other", model="other", latency=0.1)
+        router = make_router(heavy, light, other)
+
+        # Act
+        backend = router.select(model="model")
+
+        # Assert
+        assert backend is heavy
+        assert router.select(model="unknown") is other
+
+    def test_latency_ewma(self) -> None:
+        """Test latency is smoothed across calls."""
+        # Arrange
+        backend = make_backend("backend")
+        router = make_router(backend)
+
+        # Act
+        router.record_success(backend, 1.0)
+        router.record_success(backend, 3.0)
+
+        # Assert
+        assert backend.latency == 2.0
+
+    def test_failures_eject_backend(self) -> None:
+        """Test backend failing in a row is ejected and traffic moves on."""
+        # Arrange
+        flaky = make_backend("flaky", latency=0.1)
+        stable = make_backend("stable", latency=1.0)
+        router = make_router(flaky, stable)
+
+        # Act
+        router.record_failure(flaky)
+        first = router.select()
+        router.record_failure(flaky)
+        second = router.select()
+
+        # Assert
+        assert first is flaky
+        assert second is stable
+        assert flaky.state == CircuitState.OPEN
+
+    def test_probe_after_open_timeout(self) -> None:
+        """Test ejected backend gets one probe after timeout and recovers on success."""
+        # Arrange
+        flaky = make_backend("flaky", latency=0.1)
+        stable = make_backend("stable", latency=1.0)
+        router = make_router(flaky, stable, open_timeout=10.0)
+        with patch("src.inference.router.monotonic", return_value=100.0):
+            router.record_failure(flaky)
+            router.record_failure(flaky)
+
+        # Act
+        with patch("src.inference.router.monotonic", return_value=111.0):
+            probe = router.select()
+            during_probe = router.select()
+        router.record_success(flaky, 0.1)
+
+        # Assert
+        assert probe is flaky
+        assert during_probe is stable
+        assert flaky.state == CircuitState.CLOSED
+        assert router.select() is flaky
+
+    def test_failed_probe_ejects_again(self) -> None:
+        """Test failed probe opens the circuit right away."""
+        # Arrange
+        backend = make_backend("backend")
+        router = make_router(backend, open_timeout=0.0)
+        router.record_failure(backend)
+        router.record_failure(backend)
+        router.select()
+
+        # Act
+        router.record_failure(backend)
+
+        # Assert
+        assert backend.state == CircuitState.OPEN
+
+    def test_all_open_falls_back(self) -> None:
+        """Test least recently ejected backend is used when every circuit is open."""
+        # Arrange
+        first = make_backend("first")
+        second = make_backend("second")
+        router = make_router(first, second)
+        for backend in (first, second):
+            router.record_failure(backend)
+            router.record_failure(backend)
+
+        # Act
+        backend = router.select()
+
+        # Assert
+        assert backend is first
+
+    def test_no_backends(self) -> None:
+        """Test router requires at least one backend."""
+        # Act
+        with pytest.raises(ValueError):
+            InferenceRouter(backends=[], ewma_alpha=0.5, failure_threshold=2, open_timeout=30.0)
@@ -0,0 +1,67 @@
+import pytest
+
+from src.core.config import RouteSettings
+from src.inference.routes import RouteTable
+
+
+@pytest.fixture
+def route_table() -> RouteTable:
+    """Create route table with short beginner turns on small model."""
+    return RouteTable(
+        routes=[
+            RouteSettings(
+                name="beginner",
+                model="small",
+                max_tokens=64,
+                temperature=0.3,
+                cefr_levels={"a1", "a2"},
+                max_message_length=200,
+            ),
+            RouteSettings(
+                name="short", model="medium", max_tokens=128, temperature=0.5, max_message_length=50
+            ),
+        ],
+        default=RouteSettings(name="default", model="large", max_tokens=512, temperature=0.7),
+    )
+
+
+class TestRouteTable:
+    """Test RouteTable class."""
+
+    @pytest.mark.parametrize(
+        ("cefr_level", "message_length", "route_name"),
+        [
+            ("a1", 10, "beginner"),
+            ("A2", 200, "beginner"),
+            ("a2", 201, "default"),
+            ("c1", 20, "short"),
+            ("c1", 100, "default"),
+        ],
+    )
+    def test_select(
+        self, route_table: RouteTable, cefr_level: str, message_length: int, route_name: str
+    ) -> None:
+        """Test first route matching CEFR level and message length is selected."""
+        # Act
+        route = route_table.select(cefr_level, message_length)
+
+        # Assert
+        assert route.name == route_name
+
+    def test_record(self, route_table: RouteTable) -> None:
+        """Test latency and tokens are aggregated per route."""
+        # Arrange
+        route = route_table.routes[0]
+
+        # Act
+        route_table.record(route, latency=1.0, prompt_tokens=100, completion_tokens=10)
+        route_table.record(route, latency=3.0, prompt_tokens=100, completion_tokens=30)
+
+        # Assert
+        stats = route_table.get_stats(route)
+        assert stats.calls == 2
+        assert stats.average_latency == 2.0
+        assert stats.max_latency == 3.0
+        assert stats.prompt_tokens == 200
+        assert stats.average_completion_tokens == 20.0
+        assert route_table.get_stats(route_table.default).calls == 0
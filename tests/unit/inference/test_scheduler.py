@@ -0,0 +1,118 @@
+from unittest.mock import patch
+
+import pytest
+
+from src.inference.scheduler import FairScheduler, get_user_weight
+
+
+@pytest.fixture
+def scheduler() -> FairScheduler:
+    """Create FairScheduler crediting 100 tokens per round."""
+    return FairScheduler(quantum=100, stats_size=100)
+
+
+class TestFairScheduler:
+    """Test FairScheduler class."""
+
+    HEAVY_USER_TG_ID = 1
+    LIGHT_USER_TG_ID = 2
+    ADMIN_TG_ID = 3
+
+    @pytest.mark.asyncio
+    async def test_heavy_user_does_not_block_others(self, scheduler: FairScheduler) -> None:
+        """Test newcomer is served right after heavy user spends its credit."""
+        # Arrange
+        heavy_requests = [scheduler.push(self.HEAVY_USER_TG_ID, 1, 100) for _ in range(5)]
+        light_request = scheduler.push(self.LIGHT_USER_TG_ID, 1, 100)
+
+        # Act
+        served = [scheduler.pop() for _ in range(3)]
+
+        # Assert
+        assert served == [heavy_requests[0], light_request, heavy_requests[1]]
+        assert scheduler.depth(self.HEAVY_USER_TG_ID) == 3
+        assert scheduler.depth(self.LIGHT_USER_TG_ID) == 0
+        assert len(scheduler) == 3
+
+    @pytest.mark.asyncio
+    async def test_weight_sets_share(self, scheduler: FairScheduler) -> None:
+        """Test user with double weight is served twice as often."""
+        # Arrange
+        user_requests = [scheduler.push(self.LIGHT_USER_TG_ID, 1, 100) for _ in range(4)]
+        admin_requests = [scheduler.push(self.ADMIN_TG_ID, 2, 100) for _ in range(4)]
+
+        # Act
+        served = [scheduler.pop() for _ in range(6)]
+
+        # Assert
+        assert served.count(None) == 0
+        assert sum(request in admin_requests for request in served) == 4
+        assert sum(request in user_requests for request in served) == 2
+
+    @pytest.mark.asyncio
+    async def test_abandoned_requests_skipped(self, scheduler: FairScheduler) -> None:
+        """Test removed and cancelled requests are not served."""
+        # Arrange
+        removed = scheduler.push(self.LIGHT_USER_TG_ID, 1, 10)
+        cancelled = scheduler.push(self.HEAVY_USER_TG_ID, 1, 10)
+        waiting = scheduler.push(self.HEAVY_USER_TG_ID, 1, 10)
+        scheduler.remove(self.LIGHT_USER_TG_ID, removed)
+        cancelled.cancel()
+
+        # Act
+        served = [scheduler.pop(), scheduler.pop()]
+
+        # Assert
+        assert served == [waiting, None]
+        assert len(scheduler) == 0
+
+    def test_record_wait(self, scheduler: FairScheduler) -> None:
+        """Test wait statistics are aggregated per user."""
+        # Act
+        scheduler.record_wait(self.LIGHT_USER_TG_ID, 1.0)
+        scheduler.record_wait(self.LIGHT_USER_TG_ID, 3.0)
+
+        # Assert
+        stats = scheduler.get_stats(self.LIGHT_USER_TG_ID)
+        assert stats is not None
+        assert stats.served == 2
+        assert stats.average_wait == 2.0
+        assert stats.max_wait == 3.0
+
+    def test_record_wait_bounded(self) -> None:
+        """Test least recently served user is forgotten once stats are full."""
+        # Arrange
+        scheduler = FairScheduler(quantum=100, stats_size=2)
+        scheduler.record_wait(1, 1.0)
+        scheduler.record_wait(2, 1.0)
+        scheduler.record_wait(1, 1.0)
+
+        # Act
+        scheduler.record_wait(3, 1.0)
+
+        # Assert
+        assert scheduler.get_stats(2) is None
+        assert scheduler.get_stats(1) is not None
+        assert scheduler.get_stats(3) is not None
+
+
+class TestGetUserWeight:
+    """Test get_user_weight function."""
+
+    def test_weights(self) -> None:
+        """Test admins and premium users get configured weights."""
+        with patch("src.inference.scheduler.settings") as mock_settings:
+            mock_settings.gateway.admin_weight = 4
+            mock_settings.gateway.premium_weight = 2
+            mock_settings.gateway.default_weight = 1
+            mock_settings.gateway.premium_users = {2}
+
+            # Act
+            weights = [
+                get_user_weight(user_tg_id=1, is_admin=True),
+                get_user_weight(user_tg_id=2, is_admin=False),
+                get_user_weight(user_tg_id=3, is_admin=False),
+            ]
+
+        # Assert
+        assert weights == [4, 2, 1]
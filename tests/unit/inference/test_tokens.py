@@ -0,0 +1,46 @@
+from unittest.mock import MagicMock, patch
+
+from src.inference.tokens import TokenCounter, load_token_counter
+
+
+class TestTokenCounter:
+    """Test TokenCounter class."""
+
+    MODEL = "org/model"
+
+    def test_count_estimate(self) -> None:
+        """Test character-based estimate without tokenizer."""
+        # Arrange
+        counter = TokenCounter()
+
+        # Act & Assert
+        assert counter.count("") == 0
+        assert counter.count("abcde") == 2
+        assert counter.count_message("abcd") == 1 + TokenCounter.MESSAGE_OVERHEAD
+
+    def test_count_with_tokenizer(self) -> None:
+        """Test tokenizer is used when loaded."""
+        # Arrange
+        tokenizer = MagicMock()
+        tokenizer.encode.return_value.ids = [1, 2, 3]
+        counter = TokenCounter(tokenizer)
+
+        # Act
+        result = counter.count("Hello there")
+
+        # Assert
+        assert result == 3
+        tokenizer.encode.assert_called_once_with("Hello there", add_special_tokens=False)
+
+    def test_load_falls_back_to_estimate(self) -> None:
+        """Test estimate is used when tokenizer cannot be loaded."""
+        with patch("src.inference.tokens.Tokenizer") as mock_tokenizer_class:
+            # Arrange
+            mock_tokenizer_class.from_pretrained.side_effect = OSError("Not found")
+
+            # Act
+            counter = load_token_counter(self.MODEL)
+
+        # Assert
+        assert counter._tokenizer is None
+        mock_tokenizer_class.from_pretrained.assert_called_once_with(self.MODEL)
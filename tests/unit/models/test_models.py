@@ -1,4 +1,5 @@
 from src.models.base import Base
+from src.models.message import Message
 from src.models.user import User
 
 
@@ -42,6 +43,8 @@ class TestUserModel:
             "is_admin",
             "language",
             "cefr_level",
+            "reminder_time",
+            "timezone",
             "created_at",
             "updated_at",
         ]
@@ -65,3 +68,18 @@ class TestUserModel:
 
         assert user_with_false.is_admin is False
         assert user_with_true.is_admin is True
+
+
+class TestMessageModel:
+    """Test Message model."""
+
+    def test_message_model_table_name(self) -> None:
+        """Test Message model table name."""
+        assert Message.__tablename__ == "messages"
+
+    def test_message_model_partitioned_by_created_at(self) -> None:
+        """Test messages are partitioned by creation time included in primary key."""
+        table = Message.metadata.tables["messages"]
+
+        assert table.dialect_options["postgresql"]["partition_by"] == "RANGE (created_at)"
+        assert set(table.primary_key.columns.keys()) == {"id", "created_at"}
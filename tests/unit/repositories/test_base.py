@@ -3,12 +3,15 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 from sqlalchemy import select, update
+from sqlalchemy.dialects import postgresql
 from sqlalchemy.engine import Result
 
 from src.models.user import User
 from src.repositories.base import BaseRepository
 from src.schemas.user import UserSchema
 
+POSTGRESQL_DIALECT = postgresql.dialect()  # type: ignore[no-untyped-call]
+
 
 class TestBaseRepository:
     """Test BaseRepository class."""
@@ -19,11 +22,11 @@ class TestBaseRepository:
 
     @pytest.mark.asyncio
     async def test_find_one_or_none_found(
-        self, mock_session_factory: Any, mock_async_session: Any, user_model: User
+        self, mock_unit_of_work: Any, mock_async_session: Any, user_model: User
     ) -> None:
         """Test finding one object when exists."""
         # Arrange
-        repo = BaseRepository[User, UserSchema](mock_session_factory)
+        repo = BaseRepository[User, UserSchema](mock_unit_of_work)
         repo.model = User
 
         mock_result = MagicMock(spec=Result)
@@ -41,11 +44,11 @@ class TestBaseRepository:
 
     @pytest.mark.asyncio
     async def test_find_one_or_none_not_found(
-        self, mock_session_factory: Any, mock_async_session: Any
+        self, mock_unit_of_work: Any, mock_async_session: Any
     ) -> None:
         """Test finding one object when not exists."""
         # Arrange
-        repo = BaseRepository[User, UserSchema](mock_session_factory)
+        repo = BaseRepository[User, UserSchema](mock_unit_of_work)
         repo.model = User
 
         mock_result = MagicMock(spec=Result)
@@ -61,13 +64,13 @@ class TestBaseRepository:
     @pytest.mark.asyncio
     async def test_add_one_success(
         self,
-        mock_session_factory: Any,
+        mock_unit_of_work: Any,
         mock_async_session: Any,
         fake_user: UserSchema,
     ) -> None:
         """Test adding one object."""
         # Arrange
-        repo = BaseRepository[User, UserSchema](mock_session_factory)
+        repo = BaseRepository[User, UserSchema](mock_unit_of_work)
         repo.model = User
 
         with (
@@ -80,15 +83,63 @@ class TestBaseRepository:
         # Assert
         assert result == 1
         mock_async_session.add.assert_called_once()
-        mock_async_session.commit.assert_called_once()
+        mock_async_session.flush.assert_called_once()
+        mock_async_session.commit.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_upsert_one_do_nothing(
+        self, mock_unit_of_work: Any, mock_async_session: Any, fake_user: UserSchema
+    ) -> None:
+        """Test upserting one object ignoring conflicts."""
+        # Arrange
+        repo = BaseRepository[User, UserSchema](mock_unit_of_work)
+        repo.model = User
+
+        mock_result = MagicMock(spec=Result)
+        mock_result.scalar_one_or_none.return_value = None
+        mock_async_session.execute.return_value = mock_result
+
+        # Act
+        result = await repo.upsert_one(fake_user, index_elements=["tg_id"])
+
+        # Assert
+        assert result is None
+        query = str(mock_async_session.execute.call_args[0][0].compile(dialect=POSTGRESQL_DIALECT))
+        assert "ON CONFLICT (tg_id) DO NOTHING RETURNING users.id" in query
+        mock_async_session.commit.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_upsert_one_do_update(
+        self, mock_unit_of_work: Any, mock_async_session: Any, fake_user: UserSchema
+    ) -> None:
+        """Test upserting one object updating changed fields on conflict."""
+        # Arrange
+        repo = BaseRepository[User, UserSchema](mock_unit_of_work)
+        repo.model = User
+
+        mock_result = MagicMock(spec=Result)
+        mock_result.scalar_one_or_none.return_value = self.USER_ID
+        mock_async_session.execute.return_value = mock_result
+
+        # Act
+        result = await repo.upsert_one(
+            fake_user, index_elements=["tg_id"], update_fields=["username"]
+        )
+
+        # Assert
+        assert result == self.USER_ID
+        query = str(mock_async_session.execute.call_args[0][0].compile(dialect=POSTGRESQL_DIALECT))
+        assert "ON CONFLICT (tg_id) DO UPDATE SET username = excluded.username" in query
+        assert "WHERE users.username IS DISTINCT FROM excluded.username" in query
+        mock_async_session.commit.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_update_one_success(
-        self, mock_session_factory: Any, mock_async_session: Any
+        self, mock_unit_of_work: Any, mock_async_session: Any
     ) -> None:
         """Test updating one object."""
         # Arrange
-        repo = BaseRepository[User, UserSchema](mock_session_factory)
+        repo = BaseRepository[User, UserSchema](mock_unit_of_work)
         repo.model = User
 
         mock_result = MagicMock(spec=Result)
@@ -104,21 +155,64 @@ class TestBaseRepository:
             update(User).filter_by(tg_id=self.NONEXISTENT_USER_TG_ID).values(language=self.EN_LANG)
         )
         assert str(call_args) == str(expected_query)
-        mock_async_session.commit.assert_called_once()
+        mock_async_session.commit.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_count(self, mock_unit_of_work: Any, mock_async_session: Any) -> None:
+        """Test counting objects above id matching filter."""
+        # Arrange
+        repo = BaseRepository[User, UserSchema](mock_unit_of_work)
+        repo.model = User
+        mock_async_session.execute.return_value.scalar_one.return_value = 2
+
+        # Act
+        result = await repo.count(after_id=10, language=self.EN_LANG)
+
+        # Assert
+        assert result == 2
+        query = str(mock_async_session.execute.call_args[0][0].compile(dialect=POSTGRESQL_DIALECT))
+        assert "count(*)" in query
+        assert "users.language = " in query
+        assert "users.id > " in query
+
+    @pytest.mark.asyncio
+    async def test_find_fields_page(self, mock_unit_of_work: Any, mock_async_session: Any) -> None:
+        """Test page of objects above last seen id is read in id order."""
+        # Arrange
+        repo = BaseRepository[User, UserSchema](mock_unit_of_work)
+        repo.model = User
+        mock_async_session.execute.return_value = [
+            MagicMock(_mapping={"id": user_id, "tg_id": user_id * 100}) for user_id in (11, 12)
+        ]
+
+        # Act
+        result = await repo.find_fields_page(
+            ["tg_id"], limit=500, after_id=10, language=self.EN_LANG
+        )
+
+        # Assert
+        assert result == [{"id": 11, "tg_id": 1100}, {"id": 12, "tg_id": 1200}]
+        compiled_query = str(
+            mock_async_session.execute.call_args[0][0].compile(dialect=POSTGRESQL_DIALECT)
+        )
+        assert "WHERE users.language = " in compiled_query
+        assert "AND users.id > " in compiled_query
+        assert "ORDER BY users.id" in compiled_query
+        assert "LIMIT " in compiled_query
 
-    def test_get_model_success(self, mock_session_factory: Any) -> None:
+    def test_get_model_success(self, mock_unit_of_work: Any) -> None:
         """Test getting model when configured."""
         # Arrange
-        repo = BaseRepository[User, UserSchema](mock_session_factory)
+        repo = BaseRepository[User, UserSchema](mock_unit_of_work)
         repo.model = User
 
         # Act & Assert
         assert repo._get_model() == User
 
-    def test_get_model_not_configured(self, mock_session_factory: Any) -> None:
+    def test_get_model_not_configured(self, mock_unit_of_work: Any) -> None:
         """Test getting model when not configured."""
         # Arrange
-        repo = BaseRepository[User, UserSchema](mock_session_factory)
+        repo = BaseRepository[User, UserSchema](mock_unit_of_work)
         repo.model = None
 
         # Act & Assert
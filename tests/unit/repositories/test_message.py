@@ -0,0 +1,89 @@
+from datetime import UTC, date, datetime
+from typing import Any
+
+import pytest
+
+from src.models.message import Message
+from src.repositories.message import MessageRepository
+from src.schemas.message import MessageSchema
+
+
+@pytest.fixture
+def message_repository(mock_unit_of_work: Any) -> MessageRepository:
+    """Create MessageRepository with mocked unit of work."""
+    return MessageRepository(unit_of_work=mock_unit_of_work)
+
+
+class TestMessageRepository:
+    """Test MessageRepository class."""
+
+    @pytest.mark.asyncio
+    async def test_add_messages_in_one_insert(
+        self, message_repository: MessageRepository, mock_async_session: Any
+    ) -> None:
+        """Test messages are written with one multi-row insert."""
+        # Arrange
+        created_at = datetime(2026, 10, 18, tzinfo=UTC)
+        messages = [
+            MessageSchema(user_tg_id=1, role="user", content="Hi", tokens=5, created_at=created_at),
+            MessageSchema(user_tg_id=1, role="assistant", content="Hello!", created_at=created_at),
+        ]
+
+        # Act
+        await message_repository.add_messages(messages)
+
+        # Assert
+        mock_async_session.execute.assert_called_once()
+        query = mock_async_session.execute.call_args[0][0]
+        assert str(query).count("VALUES") == 1
+        assert "content_m1" in query.compile().params
+        mock_async_session.commit.assert_not_called()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("month", "name", "start", "end"),
+        [
+            (date(2026, 10, 1), "messages_2026_10", "2026-10-01", "2026-11-01"),
+            (date(2026, 12, 1), "messages_2026_12", "2026-12-01", "2027-01-01"),
+        ],
+    )
+    async def test_create_month_partition(
+        self,
+        message_repository: MessageRepository,
+        mock_async_session: Any,
+        month: date,
+        name: str,
+        start: str,
+        end: str,
+    ) -> None:
+        """Test partition covers the whole month in UTC."""
+        # Act
+        await message_repository.create_month_partition(month)
+
+        # Assert
+        statement = str(mock_async_session.execute.call_args[0][0])
+        assert f"CREATE TABLE IF NOT EXISTS {name} PARTITION OF messages" in statement
+        assert f"FROM ('{start} 00:00:00+00') TO ('{end} 00:00:00+00')" in statement
+
+    @pytest.mark.asyncio
+    async def test_get_last_messages(
+        self, message_repository: MessageRepository, mock_async_session: Any
+    ) -> None:
+        """Test latest messages are read newest first and returned oldest first."""
+        # Arrange
+        created_at = datetime(2026, 10, 18, tzinfo=UTC)
+        rows = [
+            Message(user_tg_id=1, role=role, content=content, tokens=None, created_at=created_at)
+            for role, content in (("assistant", "Hello!"), ("user", "Hi"))
+        ]
+        mock_async_session.execute.return_value.scalars.return_value.all.return_value = rows
+
+        # Act
+        messages = await message_repository.get_last_messages(user_tg_id=1, limit=20)
+
+        # Assert
+        assert [message.content for message in messages] == ["Hi", "Hello!"]
+        query = str(mock_async_session.execute.call_args[0][0])
+        assert "WHERE messages.user_tg_id = :user_tg_id_1" in query
+        assert "ORDER BY messages.created_at DESC, messages.id DESC" in query
+        assert "LIMIT :param_1" in query
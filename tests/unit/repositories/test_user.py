@@ -1,5 +1,6 @@
+from datetime import time
 from typing import Any
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from sqlalchemy import select, update
@@ -7,7 +8,7 @@ from sqlalchemy.engine import Result
 
 from src.models.user import User
 from src.repositories.user import UserRepository
-from src.schemas.user import UserSchema
+from src.schemas.user import UserProfileSchema, UserSchema
 
 
 class TestUserRepository:
@@ -109,7 +110,7 @@ class TestUserRepository:
             update(User).filter_by(tg_id=self.NONEXISTENT_USER_TG_ID).values(language=self.EN_LANG)
         )
         assert str(call_args) == str(expected_query)
-        mock_async_session.commit.assert_called_once()
+        mock_async_session.commit.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_get_user_cefr_level_found(
@@ -168,15 +169,147 @@ class TestUserRepository:
             .values(cefr_level=self.B1_CEFR_LEVEL)
         )
         assert str(call_args) == str(expected_query)
-        mock_async_session.commit.assert_called_once()
+        mock_async_session.commit.assert_not_called()
 
-    def test_user_repository_inheritance(self, mock_session_factory: Any) -> None:
+    @pytest.mark.asyncio
+    async def test_set_user_reminder(
+        self, mock_user_repository: UserRepository, mock_async_session: Any
+    ) -> None:
+        """Test setting user reminder time and timezone in one statement."""
+        # Arrange
+        mock_result = MagicMock(spec=Result)
+        mock_result.rowcount = 0
+        mock_async_session.execute.return_value = mock_result
+
+        # Act
+        updated = await mock_user_repository.set_user_reminder(
+            time(19, 30), "Europe/Moscow", self.NONEXISTENT_USER_TG_ID
+        )
+
+        # Assert
+        assert not updated
+        mock_async_session.execute.assert_called_once()
+        call_args = mock_async_session.execute.call_args[0][0]
+        expected_query = (
+            update(User)
+            .filter_by(tg_id=self.NONEXISTENT_USER_TG_ID)
+            .values(reminder_time=time(19, 30), timezone="Europe/Moscow")
+        )
+        assert str(call_args) == str(expected_query)
+        assert call_args.compile().params["timezone"] == "Europe/Moscow"
+
+    @pytest.mark.asyncio
+    async def test_get_user_reminders(
+        self, mock_user_repository: UserRepository, mock_async_session: Any
+    ) -> None:
+        """Test users with reminder are read by id page."""
+        # Arrange
+        row = MagicMock(id=1, tg_id=100, reminder_time=time(19, 30), timezone="Europe/Moscow")
+        mock_async_session.execute.return_value = [row]
+
+        # Act
+        reminders = await mock_user_repository.get_user_reminders(after_id=0, limit=100)
+
+        # Assert
+        assert reminders == [(1, 100, time(19, 30), "Europe/Moscow")]
+        call_args = mock_async_session.execute.call_args[0][0]
+        expected_query = (
+            select(User.id, User.tg_id, User.reminder_time, User.timezone)
+            .where(User.id > 0, User.reminder_time.is_not(None))
+            .order_by(User.id)
+            .limit(100)
+        )
+        assert str(call_args) == str(expected_query)
+
+    @pytest.mark.asyncio
+    async def test_get_user_profile_found(
+        self, mock_user_repository: UserRepository, mock_async_session: Any, user_model: User
+    ) -> None:
+        """Test getting user profile with one projected query."""
+        # Arrange
+        mock_result = MagicMock(spec=Result)
+        mock_result.one_or_none.return_value._mapping = {
+            "language": user_model.language,
+            "cefr_level": user_model.cefr_level,
+            "is_admin": None,
+        }
+        mock_async_session.execute.return_value = mock_result
+
+        # Act
+        result = await mock_user_repository.get_user_profile(user_model.tg_id)
+
+        # Assert
+        assert result == UserProfileSchema(
+            language=user_model.language, cefr_level=user_model.cefr_level
+        )
+        mock_async_session.execute.assert_called_once()
+        call_args = mock_async_session.execute.call_args[0][0]
+        expected_query = select(User.language, User.cefr_level, User.is_admin).filter_by(
+            tg_id=user_model.tg_id
+        )
+        assert str(call_args) == str(expected_query)
+
+    @pytest.mark.asyncio
+    async def test_get_user_profile_not_found(
+        self, mock_user_repository: UserRepository, mock_async_session: Any
+    ) -> None:
+        """Test getting user profile when user not exists."""
+        # Arrange
+        mock_result = MagicMock(spec=Result)
+        mock_result.one_or_none.return_value = None
+        mock_async_session.execute.return_value = mock_result
+
+        # Act
+        result = await mock_user_repository.get_user_profile(self.NONEXISTENT_USER_TG_ID)
+
+        # Assert
+        assert result is None
+        mock_async_session.execute.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_upsert_user(
+        self, mock_user_repository: UserRepository, mock_async_session: Any, fake_user: UserSchema
+    ) -> None:
+        """Test upserting user in one statement."""
+        # Arrange
+        mock_result = MagicMock(spec=Result)
+        mock_result.scalar_one_or_none.return_value = 1
+        mock_async_session.execute.return_value = mock_result
+
+        # Act
+        result = await mock_user_repository.upsert_user(fake_user)
+
+        # Assert
+        assert result == 1
+        mock_async_session.execute.assert_called_once()
+        mock_async_session.commit.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_get_user_tg_ids(self, mock_user_repository: UserRepository) -> None:
+        """Test page of user ids is read with only set filters."""
+        # Act
+        with patch.object(
+            mock_user_repository,
+            "find_fields_page",
+            AsyncMock(return_value=[{"id": 1, "tg_id": 100}]),
+        ) as mock_find_fields_page:
+            result = await mock_user_repository.get_user_tg_ids(
+                limit=500, after_id=0, cefr_level=self.B1_CEFR_LEVEL
+            )
+
+        # Assert
+        assert result == [(1, 100)]
+        mock_find_fields_page.assert_called_once_with(
+            ["tg_id"], 500, 0, cefr_level=self.B1_CEFR_LEVEL
+        )
+
+    def test_user_repository_inheritance(self, mock_unit_of_work: Any) -> None:
         """Test that UserRepository correctly inherits from BaseRepository."""
         # Act
-        repo = UserRepository(session_factory=mock_session_factory)
+        repo = UserRepository(unit_of_work=mock_unit_of_work)
 
         # Assert
         assert isinstance(repo, UserRepository)
         assert hasattr(repo, "model")
         assert repo.model == User
-        assert hasattr(repo, "session_factory")
+        assert hasattr(repo, "unit_of_work")
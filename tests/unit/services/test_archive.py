@@ -0,0 +1,180 @@
+import asyncio
+from datetime import UTC, date, datetime
+from typing import Any
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from src.schemas.message import MessageSchema
+from src.services import MessageArchive
+from src.services.history import ChatMessage
+
+TURN: list[ChatMessage] = [
+    {"role": "user", "content": "Hi", "tokens": 5},
+    {"role": "assistant", "content": "Hello!", "tokens": 6},
+]
+
+
+@pytest.fixture
+def mock_repository() -> Any:
+    """Patch message repository created for every write."""
+    with patch("src.services.archive.MessageRepository") as repository_class:
+        repository = AsyncMock()
+        repository_class.return_value = repository
+        yield repository
+
+
+def make_archive(batch_size: int = 4, max_buffer_size: int = 100) -> MessageArchive:
+    """Create archive with mocked session factory and long flush interval."""
+    return MessageArchive(
+        session_factory=AsyncMock(),
+        batch_size=batch_size,
+        flush_interval=60,
+        max_buffer_size=max_buffer_size,
+    )
+
+
+class TestMessageArchive:
+    """Test MessageArchive class."""
+
+    @pytest.mark.asyncio
+    async def test_flush_writes_batches(self, mock_repository: Any) -> None:
+        """Test buffered messages are written in batches with partition created once."""
+        # Arrange
+        archive = make_archive(batch_size=3)
+        for user_tg_id in range(3):
+            archive.add(user_tg_id, *TURN)
+
+        # Act
+        await archive.flush()
+
+        # Assert
+        batches = [call.args[0] for call in mock_repository.add_messages.call_args_list]
+        assert [len(batch) for batch in batches] == [3, 3]
+        assert [message.user_tg_id for message in batches[0]] == [0, 0, 1]
+        mock_repository.create_month_partition.assert_called_once()
+        assert mock_repository.create_month_partition.call_args.args[0].day == 1
+        assert archive.written == 6
+
+    @pytest.mark.asyncio
+    async def test_full_batch_written_in_background(self, mock_repository: Any) -> None:
+        """Test writer flushes as soon as a batch fills up without waiting for interval."""
+        # Arrange
+        archive = make_archive(batch_size=2)
+        archive.start()
+
+        # Act
+        archive.add(1, *TURN)
+        await asyncio.sleep(0.01)
+
+        # Assert
+        mock_repository.add_messages.assert_called_once()
+        await archive.close()
+
+    @pytest.mark.asyncio
+    async def test_close_writes_pending(self, mock_repository: Any) -> None:
+        """Test messages of partial batch are written on close."""
+        # Arrange
+        archive = make_archive()
+        archive.start()
+        archive.add(1, *TURN)
+
+        # Act
+        await archive.close()
+
+        # Assert
+        mock_repository.add_messages.assert_called_once()
+        assert archive.written == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_kept_in_order(self, mock_repository: Any) -> None:
+        """Test failed batch goes back to buffer and is written by next flush."""
+        # Arrange
+        archive = make_archive(batch_size=2)
+        archive.add(1, *TURN)
+        archive.add(2, *TURN)
+        mock_repository.add_messages.side_effect = [ConnectionError("Database down"), None, None]
+
+        # Act
+        await archive.flush()
+        written_after_failure = archive.written
+        await archive.flush()
+
+        # Assert
+        assert written_after_failure == 0
+        batches = [call.args[0] for call in mock_repository.add_messages.call_args_list]
+        assert [message.user_tg_id for message in batches[1] + batches[2]] == [1, 1, 2, 2]
+        assert archive.written == 4
+
+    @pytest.mark.asyncio
+    async def test_partition_retried_after_failure(self, mock_repository: Any) -> None:
+        """Test partition is not remembered when its transaction failed."""
+        # Arrange
+        archive = make_archive()
+        archive.add(1, *TURN)
+        mock_repository.add_messages.side_effect = [ConnectionError("Database down"), None]
+
+        # Act
+        await archive.flush()
+        await archive.flush()
+
+        # Assert
+        months = [call.args[0] for call in mock_repository.create_month_partition.call_args_list]
+        assert len(months) == 2
+        assert all(isinstance(month, date) for month in months)
+
+    def test_oldest_dropped_when_buffer_full(self) -> None:
+        """Test buffer keeps newest messages while database is down."""
+        # Arrange
+        archive = make_archive(max_buffer_size=3)
+
+        # Act
+        archive.add(1, *TURN)
+        archive.add(2, *TURN)
+
+        # Assert
+        assert archive.dropped == 1
+
+
+class TestLoadHistory:
+    """Test MessageArchive history loading."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_loads_share_query(self, mock_repository: Any) -> None:
+        """Test concurrent loads of one user run one query and get separate lists."""
+        # Arrange
+        archive = make_archive()
+        messages = [
+            MessageSchema(user_tg_id=1, created_at=datetime.now(UTC), **message) for message in TURN
+        ]
+
+        async def get_last_messages(**kwargs: Any) -> Any:
+            await asyncio.sleep(0.01)
+            return messages
+
+        mock_repository.get_last_messages.side_effect = get_last_messages
+
+        # Act
+        first, second = await asyncio.gather(
+            archive.load_history(1, limit=20), archive.load_history(1, limit=20)
+        )
+
+        # Assert
+        mock_repository.get_last_messages.assert_called_once_with(user_tg_id=1, limit=20)
+        assert first == second == TURN
+        assert first is not second
+
+    @pytest.mark.asyncio
+    async def test_load_fails_open(self, mock_repository: Any) -> None:
+        """Test unavailable database gives empty history and next load queries again."""
+        # Arrange
+        archive = make_archive()
+        mock_repository.get_last_messages.side_effect = [ConnectionError("Database down"), []]
+
+        # Act
+        first = await archive.load_history(1, limit=20)
+        second = await archive.load_history(1, limit=20)
+
+        # Assert
+        assert first == second == []
+        assert mock_repository.get_last_messages.call_count == 2
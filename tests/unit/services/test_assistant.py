@@ -0,0 +1,356 @@
+from collections.abc import AsyncIterator
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.core.config import RouteSettings
+from src.inference.routes import RouteTable
+from src.inference.tokens import TokenCounter
+from src.services import AssistantService
+
+
+def make_chunk(content: str | None) -> Any:
+    """Create stream chunk with delta content."""
+    return SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=content))])
+
+
+async def make_stream(*contents: str | None) -> AsyncIterator[Any]:
+    """Create completion stream."""
+    for content in contents:
+        yield make_chunk(content)
+
+
+@pytest.fixture
+def mock_completions() -> Any:
+    """Create mocked chat completions."""
+    return AsyncMock()
+
+
+@pytest.fixture
+def mock_history_service() -> Any:
+    """Create mocked history service."""
+    service = AsyncMock()
+    service.get_history.return_value = []
+    return service
+
+
+@pytest.fixture
+def mock_summary_service() -> Any:
+    """Create mocked summary service with summarization disabled."""
+    service = MagicMock()
+    service.enabled = False
+    return service
+
+
+@pytest.fixture
+def mock_response_cache() -> Any:
+    """Create mocked response cache not caching any turn."""
+    cache = AsyncMock()
+    cache.get_key = MagicMock(return_value=None)
+    return cache
+
+
+@pytest.fixture
+def mock_gateway() -> Any:
+    """Create mocked inference gateway granting every slot."""
+    gateway = MagicMock()
+    gateway.slot.return_value = AsyncMock()
+    return gateway
+
+
+@pytest.fixture
+def route_table() -> RouteTable:
+    """Create route table sending beginners to small model."""
+    return RouteTable(
+        routes=[
+            RouteSettings(
+                name="beginner",
+                model="small",
+                max_tokens=50,
+                temperature=0.2,
+                cefr_levels={"a1", "a2"},
+            )
+        ],
+        default=RouteSettings(name="default", model="large", max_tokens=100, temperature=0.7),
+    )
+
+
+@pytest.fixture
+def mock_archive() -> Any:
+    """Create mocked message archive."""
+    return MagicMock()
+
+
+@pytest.fixture
+def assistant_service(
+    mock_completions: Any,
+    mock_history_service: Any,
+    mock_summary_service: Any,
+    mock_response_cache: Any,
+    mock_gateway: Any,
+    route_table: RouteTable,
+    mock_archive: Any,
+) -> AssistantService:
+    """Create AssistantService with mocked dependencies and estimating token counter."""
+    return AssistantService(
+        completions=mock_completions,
+        history_service=mock_history_service,
+        token_counter=TokenCounter(),
+        summary_service=mock_summary_service,
+        response_cache=mock_response_cache,
+        gateway=mock_gateway,
+        route_table=route_table,
+        archive=mock_archive,
+    )
+
+
+class TestAssistantService:
+    """Test AssistantService class."""
+
+    USER_TG_ID = 123456789
+    EN_LANG = "english"
+    B1_CEFR_LEVEL = "b1"
+
+    @pytest.mark.asyncio
+    async def test_chat_saves_history(
+        self,
+        assistant_service: AssistantService,
+        mock_completions: Any,
+        mock_history_service: Any,
+        mock_gateway: Any,
+        mock_archive: Any,
+    ) -> None:
+        """Test chat returns response and saves history and archive."""
+        # Arrange
+        mock_completions.create.return_value = SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content="Hello!"))]
+        )
+
+        # Act
+        result = await assistant_service.chat(
+            self.USER_TG_ID, "Hi", self.EN_LANG, self.B1_CEFR_LEVEL
+        )
+
+        # Assert
+        assert result == "Hello!"
+        mock_gateway.slot.assert_called_once()
+        mock_history_service.add_messages.assert_called_once_with(
+            self.USER_TG_ID,
+            {"role": "user", "content": "Hi", "tokens": 5},
+            {"role": "assistant", "content": "Hello!", "tokens": 6},
+        )
+        mock_archive.add.assert_called_once_with(
+            self.USER_TG_ID,
+            {"role": "user", "content": "Hi", "tokens": 5},
+            {"role": "assistant", "content": "Hello!", "tokens": 6},
+        )
+
+    @pytest.mark.asyncio
+    async def test_chat_routed_by_cefr_level(
+        self,
+        assistant_service: AssistantService,
+        mock_completions: Any,
+        mock_gateway: Any,
+        route_table: RouteTable,
+    ) -> None:
+        """Test beginner turn uses route model and limits and is recorded in route stats."""
+        # Arrange
+        mock_completions.create.return_value = SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content="Hello!"))]
+        )
+
+        # Act
+        await assistant_service.chat(self.USER_TG_ID, "Hi", self.EN_LANG, "a1")
+
+        # Assert
+        kwargs = mock_completions.create.call_args.kwargs
+        assert (kwargs["model"], kwargs["max_tokens"], kwargs["temperature"]) == ("small", 50, 0.2)
+        stats = route_table.get_stats(route_table.routes[0])
+        assert stats.calls == 1
+        assert stats.completion_tokens == 2
+        assert mock_gateway.slot.call_args.args[0] == 50 + stats.prompt_tokens
+
+    @pytest.mark.asyncio
+    async def test_stream_chat_saves_history_when_complete(
+        self,
+        assistant_service: AssistantService,
+        mock_completions: Any,
+        mock_history_service: Any,
+    ) -> None:
+        """Test streamed chat yields chunks and saves history after the last one."""
+        # Arrange
+        mock_completions.create_stream.return_value = make_stream("Hel", None, "lo!")
+
+        # Act
+        chunks = []
+        async for chunk in assistant_service.stream_chat(
+            self.USER_TG_ID, "Hi", self.EN_LANG, self.B1_CEFR_LEVEL
+        ):
+            chunks.append(chunk)
+            mock_history_service.add_messages.assert_not_called()
+
+        # Assert
+        assert chunks == ["Hel", "lo!"]
+        mock_history_service.add_messages.assert_called_once_with(
+            self.USER_TG_ID,
+            {"role": "user", "content": "Hi", "tokens": 5},
+            {"role": "assistant", "content": "Hello!", "tokens": 6},
+        )
+
+    @pytest.mark.asyncio
+    async def test_stream_chat_empty_response(
+        self,
+        assistant_service: AssistantService,
+        mock_completions: Any,
+        mock_history_service: Any,
+    ) -> None:
+        """Test empty stream does not save history."""
+        # Arrange
+        mock_completions.create_stream.return_value = make_stream(None)
+
+        # Act
+        chunks = [
+            chunk
+            async for chunk in assistant_service.stream_chat(
+                self.USER_TG_ID, "Hi", self.EN_LANG, self.B1_CEFR_LEVEL
+            )
+        ]
+
+        # Assert
+        assert chunks == []
+        mock_history_service.add_messages.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_history_trimmed_by_token_budget(
+        self,
+        assistant_service: AssistantService,
+        mock_completions: Any,
+        mock_history_service: Any,
+    ) -> None:
+        """Test oldest messages not fitting token budget are not sent."""
+        # Arrange
+        mock_history_service.get_history.return_value = [
+            {"role": "user", "content": "a" * 4000, "tokens": 1004},
+            {"role": "assistant", "content": "Short", "tokens": 6},
+        ]
+        mock_completions.create_stream.return_value = make_stream("Ok")
+
+        with patch("src.services.assistant.settings") as mock_settings:
+            mock_settings.assistant.context_budget = 1000
+
+            # Act
+            async for _ in assistant_service.stream_chat(
+                self.USER_TG_ID, "Hi", self.EN_LANG, self.B1_CEFR_LEVEL
+            ):
+                pass
+
+        # Assert
+        messages = mock_completions.create_stream.call_args.kwargs["messages"]
+        assert [message["role"] for message in messages] == ["system", "assistant", "user"]
+        assert all("tokens" not in message for message in messages)
+
+    @pytest.mark.asyncio
+    async def test_latest_message_sent_over_budget(
+        self,
+        assistant_service: AssistantService,
+        mock_completions: Any,
+    ) -> None:
+        """Test latest user message is sent even when it exceeds the budget."""
+        # Arrange
+        mock_completions.create_stream.return_value = make_stream("Ok")
+
+        with patch("src.services.assistant.settings") as mock_settings:
+            mock_settings.assistant.context_budget = 10
+
+            # Act
+            async for _ in assistant_service.stream_chat(
+                self.USER_TG_ID, "Hi", self.EN_LANG, self.B1_CEFR_LEVEL
+            ):
+                pass
+
+        # Assert
+        messages = mock_completions.create_stream.call_args.kwargs["messages"]
+        assert messages[-1] == {"role": "user", "content": "Hi"}
+
+    @pytest.mark.asyncio
+    async def test_summary_injected_after_system_prompt(
+        self,
+        assistant_service: AssistantService,
+        mock_completions: Any,
+        mock_history_service: Any,
+        mock_summary_service: Any,
+    ) -> None:
+        """Test history summary follows system prompt and summarization is scheduled."""
+        # Arrange
+        mock_summary_service.enabled = True
+        mock_history_service.get_summary.return_value = "Confuses past tenses"
+        mock_history_service.get_history.return_value = [
+            {"role": "user", "content": "Hello", "tokens": 6},
+            {"role": "assistant", "content": "Hi!", "tokens": 5},
+        ]
+        mock_completions.create.return_value = SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content="Hello!"))]
+        )
+
+        # Act
+        await assistant_service.chat(self.USER_TG_ID, "Hi", self.EN_LANG, self.B1_CEFR_LEVEL)
+
+        # Assert
+        messages = mock_completions.create.call_args.kwargs["messages"]
+        assert [message["role"] for message in messages] == [
+            "system",
+            "system",
+            "user",
+            "assistant",
+            "user",
+        ]
+        assert "Confuses past tenses" in messages[1]["content"]
+        mock_summary_service.schedule.assert_called_once_with(self.USER_TG_ID, self.EN_LANG, 4)
+
+    @pytest.mark.asyncio
+    async def test_chat_served_from_response_cache(
+        self,
+        assistant_service: AssistantService,
+        mock_completions: Any,
+        mock_history_service: Any,
+        mock_response_cache: Any,
+    ) -> None:
+        """Test cached response skips inference and is saved to history."""
+        # Arrange
+        mock_response_cache.get_key.return_value = "response_cache:key"
+        mock_response_cache.get.return_value = "Hello!"
+
+        # Act
+        result = await assistant_service.chat(
+            self.USER_TG_ID, "Hi", self.EN_LANG, self.B1_CEFR_LEVEL
+        )
+
+        # Assert
+        assert result == "Hello!"
+        mock_completions.create.assert_not_called()
+        mock_response_cache.set.assert_not_called()
+        mock_history_service.add_messages.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_stream_chat_caches_response(
+        self,
+        assistant_service: AssistantService,
+        mock_completions: Any,
+        mock_response_cache: Any,
+    ) -> None:
+        """Test complete streamed response is cached on miss."""
+        # Arrange
+        mock_response_cache.get_key.return_value = "response_cache:key"
+        mock_response_cache.get.return_value = None
+        mock_completions.create_stream.return_value = make_stream("Hel", "lo!")
+
+        # Act
+        async for _ in assistant_service.stream_chat(
+            self.USER_TG_ID, "Hi", self.EN_LANG, self.B1_CEFR_LEVEL
+        ):
+            pass
+
+        # Assert
+        mock_response_cache.set.assert_called_once_with("response_cache:key", "Hello!")
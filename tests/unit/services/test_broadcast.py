@@ -0,0 +1,302 @@
+import asyncio
+from collections.abc import Iterator
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from aiogram.exceptions import TelegramForbiddenError, TelegramNetworkError
+from aiogram.methods import SendMessage
+from redis.exceptions import LockError
+
+from src.schemas.broadcast import BroadcastSchema
+from src.services import BroadcastService
+from src.services.broadcast import BroadcastProgress
+
+USERS = [(1, 100), (2, 200), (3, 300)]
+METHOD = SendMessage(chat_id=100, text="News")
+
+
+@pytest.fixture(autouse=True)
+def mock_settings() -> Iterator[Any]:
+    """Patch broadcast settings with small batches and no pacing delay."""
+    with patch("src.services.broadcast.settings") as mock_settings:
+        mock_settings.broadcast.rate = 10000
+        mock_settings.broadcast.batch_size = 2
+        mock_settings.broadcast.report_interval = 60
+        mock_settings.broadcast.lock_timeout = 60
+        mock_settings.broadcast.max_attempts = 3
+        mock_settings.broadcast.retry_delay = 0
+        yield mock_settings
+
+
+@pytest.fixture
+def mock_lock() -> Any:
+    """Create mocked redis lock acquired without waiting."""
+    lock = MagicMock()
+    lock.acquire = AsyncMock(return_value=True)
+    lock.reacquire = AsyncMock()
+    lock.release = AsyncMock()
+    return lock
+
+
+@pytest.fixture
+def mock_redis_client(mock_lock: Any) -> Any:
+    """Create mocked redis client with saved broadcast."""
+    client = AsyncMock()
+    client.lock = MagicMock(return_value=mock_lock)
+    client.get.return_value = BroadcastSchema(text="News", language="english").model_dump_json()
+    client.set.return_value = True
+    return client
+
+
+@pytest.fixture
+def mock_repository() -> Iterator[Any]:
+    """Patch user repository created by broadcast to page users above requested id."""
+    repository = MagicMock()
+    repository.count_users = AsyncMock(
+        side_effect=lambda after_id, *args: sum(user_id > after_id for user_id, _ in USERS)
+    )
+    repository.get_user_tg_ids = AsyncMock(
+        side_effect=lambda limit, after_id, *args: [user for user in USERS if user[0] > after_id][
+            :limit
+        ]
+    )
+    with patch("src.services.broadcast.UserRepository", return_value=repository):
+        yield repository
+
+
+@pytest.fixture
+def broadcast_service(mock_repository: Any, mock_redis_client: Any) -> BroadcastService:
+    """Create BroadcastService with mocked repository and redis."""
+    return BroadcastService(session_factory=AsyncMock(), client=mock_redis_client)
+
+
+async def slow_send(user_tg_id: int, text: str) -> None:
+    """Send taking longer than the test waits."""
+    await asyncio.sleep(1)
+
+
+async def run_broadcast(service: BroadcastService, send: AsyncMock, finish: AsyncMock) -> bool:
+    """Start broadcast and wait for it to end, return whether it started."""
+    started = await service.start(send=send, report=AsyncMock(), finish=finish)
+    await asyncio.gather(*service._tasks, return_exceptions=True)
+    return started
+
+
+class TestBroadcastService:
+    """Test BroadcastService class."""
+
+    @pytest.mark.asyncio
+    async def test_run_sends_and_checkpoints(
+        self, broadcast_service: BroadcastService, mock_redis_client: Any, mock_repository: Any
+    ) -> None:
+        """Test every user is sent to, blocked users counted and batches checkpointed."""
+        # Arrange
+        send = AsyncMock(
+            side_effect=[None, TelegramForbiddenError(method=METHOD, message="Blocked"), None]
+        )
+        finish = AsyncMock()
+
+        # Act
+        started = await run_broadcast(broadcast_service, send, finish)
+
+        # Assert
+        assert started
+        progress, stopped = finish.call_args.args
+        assert not stopped
+        assert (progress.total, progress.sent, progress.failed) == (3, 2, 1)
+        assert [call.args for call in send.call_args_list] == [
+            (100, "News"),
+            (200, "News"),
+            (300, "News"),
+        ]
+        assert [call.args for call in mock_repository.get_user_tg_ids.call_args_list] == [
+            (2, 0, "english", None),
+            (2, 2, "english", None),
+            (2, 3, "english", None),
+        ]
+        checkpoints = [
+            BroadcastSchema.model_validate_json(call.args[1])
+            for call in mock_redis_client.set.call_args_list
+        ]
+        assert [checkpoint.last_id for checkpoint in checkpoints] == [2, 3]
+        assert checkpoints[0].failed == 1
+        mock_redis_client.delete.assert_called_once_with(BroadcastService.KEY)
+
+    @pytest.mark.asyncio
+    async def test_transient_error_retried(self, broadcast_service: BroadcastService) -> None:
+        """Test network error is retried instead of skipping the user."""
+        # Arrange
+        send = AsyncMock(
+            side_effect=[TelegramNetworkError(method=METHOD, message="Timeout"), None, None, None]
+        )
+        finish = AsyncMock()
+
+        # Act
+        await run_broadcast(broadcast_service, send, finish)
+
+        # Assert
+        progress, stopped = finish.call_args.args
+        assert not stopped
+        assert (progress.sent, progress.failed) == (3, 0)
+        assert send.call_args_list[0] == send.call_args_list[1]
+
+    @pytest.mark.asyncio
+    async def test_persistent_error_stops_before_checkpoint(
+        self, broadcast_service: BroadcastService, mock_redis_client: Any, mock_lock: Any
+    ) -> None:
+        """Test batch is not checkpointed when retries run out, so resume sends it again."""
+        # Arrange
+        error = TelegramNetworkError(method=METHOD, message="Timeout")
+        send = AsyncMock(side_effect=[None, error, error, error])
+        finish = AsyncMock()
+
+        # Act
+        await run_broadcast(broadcast_service, send, finish)
+
+        # Assert
+        progress, stopped = finish.call_args.args
+        assert stopped
+        assert (progress.sent, progress.failed) == (1, 0)
+        mock_redis_client.set.assert_not_called()
+        mock_redis_client.delete.assert_not_called()
+        mock_lock.release.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_run_resumes_from_checkpoint(
+        self, broadcast_service: BroadcastService, mock_redis_client: Any
+    ) -> None:
+        """Test resumed broadcast skips users before checkpoint and keeps counts."""
+        # Arrange
+        mock_redis_client.get.return_value = BroadcastSchema(
+            text="News", last_id=2, sent=2
+        ).model_dump_json()
+        send = AsyncMock()
+        finish = AsyncMock()
+
+        # Act
+        await run_broadcast(broadcast_service, send, finish)
+
+        # Assert
+        progress, _ = finish.call_args.args
+        assert (progress.total, progress.sent) == (3, 3)
+        send.assert_called_once_with(300, "News")
+
+    @pytest.mark.asyncio
+    async def test_cancelled_broadcast_stops(
+        self, broadcast_service: BroadcastService, mock_redis_client: Any
+    ) -> None:
+        """Test broadcast removed by admin stops after current batch."""
+        # Arrange
+        mock_redis_client.set.return_value = None
+        send = AsyncMock()
+
+        # Act
+        await run_broadcast(broadcast_service, send, AsyncMock())
+
+        # Assert
+        assert send.call_count == 2
+        mock_redis_client.delete.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_running_broadcast_not_started_twice(
+        self, broadcast_service: BroadcastService, mock_lock: Any
+    ) -> None:
+        """Test start returns false while another worker holds broadcast lock."""
+        # Arrange
+        mock_lock.acquire.return_value = False
+        send = AsyncMock()
+
+        # Act
+        started = await run_broadcast(broadcast_service, send, AsyncMock())
+
+        # Assert
+        assert not started
+        send.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_missing_broadcast_not_started(
+        self, broadcast_service: BroadcastService, mock_redis_client: Any, mock_lock: Any
+    ) -> None:
+        """Test start releases lock when there is nothing to deliver."""
+        # Arrange
+        mock_redis_client.get.return_value = None
+
+        # Act
+        started = await run_broadcast(broadcast_service, AsyncMock(), AsyncMock())
+
+        # Assert
+        assert not started
+        mock_lock.release.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_lost_lock_stops_broadcast(
+        self, broadcast_service: BroadcastService, mock_settings: Any, mock_lock: Any
+    ) -> None:
+        """Test broadcast renewing its lock in background stops once lock is lost."""
+        # Arrange
+        mock_settings.broadcast.lock_timeout = 0.03
+        mock_lock.reacquire.side_effect = LockError
+        send = AsyncMock(side_effect=slow_send)
+        finish = AsyncMock()
+
+        # Act
+        await asyncio.wait_for(run_broadcast(broadcast_service, send, finish), timeout=1)
+
+        # Assert
+        mock_lock.reacquire.assert_called_once()
+        mock_lock.release.assert_called_once()
+        finish.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_close_stops_running_broadcast(
+        self, broadcast_service: BroadcastService, mock_redis_client: Any, mock_lock: Any
+    ) -> None:
+        """Test shutdown stops broadcast without dropping its checkpoint."""
+        # Arrange
+        send = AsyncMock(side_effect=slow_send)
+        await broadcast_service.start(send=send, report=AsyncMock(), finish=AsyncMock())
+        await asyncio.sleep(0.01)
+
+        # Act
+        await broadcast_service.close()
+
+        # Assert
+        assert not broadcast_service._tasks
+        mock_redis_client.delete.assert_not_called()
+        mock_lock.release.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_create_only_without_unfinished(
+        self, broadcast_service: BroadcastService, mock_redis_client: Any
+    ) -> None:
+        """Test new broadcast is saved only if none is unfinished."""
+        # Arrange
+        mock_redis_client.set.return_value = None
+
+        # Act
+        created = await broadcast_service.create(BroadcastSchema(text="News"))
+
+        # Assert
+        assert not created
+        assert mock_redis_client.set.call_args.kwargs == {"nx": True}
+
+
+class TestBroadcastProgress:
+    """Test BroadcastProgress class."""
+
+    def test_rate_and_eta(self) -> None:
+        """Test rate counts users processed since start and eta the rest at that rate."""
+        # Arrange
+        with patch("src.services.broadcast.monotonic", return_value=100.0):
+            progress = BroadcastProgress(total=100, sent=10, failed=0)
+
+        # Act
+        progress.sent += 15
+        progress.failed += 5
+        with patch("src.services.broadcast.monotonic", return_value=110.0):
+            rate, eta = progress.rate, progress.eta
+
+        # Assert
+        assert rate == 2.0
+        assert eta == 35.0
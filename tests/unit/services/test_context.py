@@ -1,4 +1,5 @@
-from unittest.mock import AsyncMock, patch
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -6,14 +7,15 @@ from src.services import ContextService
 
 
 @pytest.fixture
-def context_service() -> ContextService:
+def mock_redis_client() -> Any:
+    """Create mocked redis client."""
+    return AsyncMock()
+
+
+@pytest.fixture
+def context_service(mock_redis_client: Any) -> ContextService:
     """Create ContextService with mocked redis."""
-    with patch("src.services.context.redis") as mock_redis_class:
-        mock_client = AsyncMock()
-        mock_redis_class.from_url.return_value = mock_client
-        service = ContextService()
-        service._client = mock_client
-        return service
+    return ContextService(client=mock_redis_client)
 
 
 class TestContextService:
@@ -21,15 +23,16 @@ class TestContextService:
 
     USER_TG_ID = 123456789
     EN_LANG = "EN"
-    REDIS_URL = "redis://localhost:6379"
     REDIS_TTL = 3600
 
     @pytest.mark.asyncio
-    async def test_set_user_language_success(self, context_service: ContextService) -> None:
+    async def test_set_user_language_success(
+        self, context_service: ContextService, mock_redis_client: Any
+    ) -> None:
         """Test successful language setting."""
         # Arrange
         PREFIX = "user_language"
-        context_service._client.setex = AsyncMock()
+        mock_redis_client.setex = AsyncMock()
 
         # Act
         await context_service.set_context(
@@ -38,59 +41,96 @@ class TestContextService:
 
         # Assert
         expected_key = f"{PREFIX}:{self.USER_TG_ID}"
-        context_service._client.setex.assert_called_once_with(
+        mock_redis_client.setex.assert_called_once_with(
             name=expected_key, time=context_service._ttl, value=self.EN_LANG
         )
 
     @pytest.mark.asyncio
-    async def test_get_user_language_success(self, context_service: ContextService) -> None:
+    async def test_get_user_language_success(
+        self, context_service: ContextService, mock_redis_client: Any
+    ) -> None:
         """Test successful language retrieval."""
         # Arrange
         PREFIX = "user_language"
-        context_service._client.get = AsyncMock(return_value=self.EN_LANG)
+        mock_redis_client.get = AsyncMock(return_value=self.EN_LANG)
 
         # Act
         result = await context_service.get_context(prefix=PREFIX, user_tg_id=self.USER_TG_ID)
 
         # Assert
         expected_key = f"{PREFIX}:{self.USER_TG_ID}"
-        context_service._client.get.assert_called_once_with(expected_key)
+        mock_redis_client.get.assert_called_once_with(expected_key)
         assert result == self.EN_LANG
 
     @pytest.mark.asyncio
-    async def test_get_user_language_not_found(self, context_service: ContextService) -> None:
+    async def test_get_user_language_not_found(
+        self, context_service: ContextService, mock_redis_client: Any
+    ) -> None:
         """Test language retrieval when not found."""
         # Arrange
         PREFIX = "user_language"
-        context_service._client.get = AsyncMock(return_value=None)
+        mock_redis_client.get = AsyncMock(return_value=None)
 
         # Act
         result = await context_service.get_context(prefix=PREFIX, user_tg_id=self.USER_TG_ID)
 
         # Assert
         expected_key = f"user_language:{self.USER_TG_ID}"
-        context_service._client.get.assert_called_once_with(expected_key)
+        mock_redis_client.get.assert_called_once_with(expected_key)
         assert result is None
 
+    @pytest.mark.asyncio
+    async def test_get_contexts(
+        self, context_service: ContextService, mock_redis_client: Any
+    ) -> None:
+        """Test several prefixes are read with one MGET."""
+        # Arrange
+        mock_redis_client.mget = AsyncMock(return_value=[self.EN_LANG, None])
+
+        # Act
+        result = await context_service.get_contexts(
+            prefixes=["user_language", "user_cefr_level"], user_tg_id=self.USER_TG_ID
+        )
+
+        # Assert
+        assert result == [self.EN_LANG, None]
+        mock_redis_client.mget.assert_called_once_with(
+            [f"user_language:{self.USER_TG_ID}", f"user_cefr_level:{self.USER_TG_ID}"]
+        )
+
+    @pytest.mark.asyncio
+    async def test_set_contexts(
+        self, context_service: ContextService, mock_redis_client: Any
+    ) -> None:
+        """Test several prefixes are written in one pipeline."""
+        # Arrange
+        mock_pipeline = MagicMock()
+        mock_pipeline.execute = AsyncMock()
+        mock_redis_client.pipeline = MagicMock()
+        mock_redis_client.pipeline.return_value.__aenter__.return_value = mock_pipeline
+
+        # Act
+        await context_service.set_contexts(
+            user_tg_id=self.USER_TG_ID, data={"user_language": self.EN_LANG}
+        )
+
+        # Assert
+        mock_pipeline.setex.assert_called_once_with(
+            name=f"user_language:{self.USER_TG_ID}", time=context_service._ttl, value=self.EN_LANG
+        )
+        mock_pipeline.execute.assert_called_once()
+
     @pytest.mark.asyncio
     async def test_service_initialization(self) -> None:
         """Test service initialization with settings."""
-        with (
-            patch("src.services.context.settings") as mock_settings,
-            patch("src.services.context.redis") as mock_redis_class,
-        ):
+        with patch("src.services.context.settings") as mock_settings:
             # Arrange
-            mock_settings.context.url = self.REDIS_URL
             mock_settings.context.ttl = self.REDIS_TTL
             mock_client = AsyncMock()
-            mock_redis_class.from_url.return_value = mock_client
 
             # Act
-            service = ContextService()
+            service = ContextService(client=mock_client)
 
             # Assert
-            assert service._url == self.REDIS_URL
+            assert service._client is mock_client
             assert service._ttl == self.REDIS_TTL
-            mock_redis_class.from_url.assert_called_once_with(
-                url=self.REDIS_URL, decode_responses=True
-            )
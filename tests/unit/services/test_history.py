@@ -0,0 +1,264 @@
+import json
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, call
+
+import pytest
+from redis.exceptions import WatchError
+
+from src.core.config import settings
+from src.services import HistoryService
+from src.services.history import ChatMessage
+
+
+@pytest.fixture
+def mock_pipeline() -> Any:
+    """Create mocked redis pipeline."""
+    pipeline = MagicMock()
+    pipeline.execute = AsyncMock()
+    pipeline.watch = AsyncMock()
+    pipeline.get = AsyncMock()
+    pipeline.lrange = AsyncMock()
+    return pipeline
+
+
+@pytest.fixture
+def mock_redis_client(mock_pipeline: Any) -> Any:
+    """Create mocked redis client."""
+    client = AsyncMock()
+    client.pipeline = MagicMock()
+    client.pipeline.return_value.__aenter__.return_value = mock_pipeline
+    client.register_script = MagicMock(return_value=AsyncMock())
+    return client
+
+
+@pytest.fixture
+def history_service(mock_redis_client: Any) -> HistoryService:
+    """Create HistoryService with mocked redis."""
+    return HistoryService(client=mock_redis_client)
+
+
+@pytest.fixture
+def mock_archive() -> Any:
+    """Create mocked message archive."""
+    return AsyncMock()
+
+
+class TestHistoryService:
+    """Test HistoryService class."""
+
+    USER_TG_ID = 123456789
+    KEY = f"history:{USER_TG_ID}"
+    LEGACY_KEY = f"chat:{USER_TG_ID}"
+    SUMMARY_KEY = f"history_summary:{USER_TG_ID}"
+    USER_MESSAGE: ChatMessage = {"role": "user", "content": "Hi", "tokens": 5}
+    ASSISTANT_MESSAGE: ChatMessage = {"role": "assistant", "content": "Hello!", "tokens": 6}
+
+    @pytest.mark.asyncio
+    async def test_get_history_from_list(
+        self, history_service: HistoryService, mock_redis_client: Any
+    ) -> None:
+        """Test history is read from list with LRANGE."""
+        # Arrange
+        mock_redis_client.lrange.return_value = [
+            json.dumps(self.USER_MESSAGE),
+            json.dumps(self.ASSISTANT_MESSAGE),
+        ]
+
+        # Act
+        result = await history_service.get_history(self.USER_TG_ID)
+
+        # Assert
+        assert result == [self.USER_MESSAGE, self.ASSISTANT_MESSAGE]
+        mock_redis_client.lrange.assert_called_once_with(self.KEY, 0, -1)
+        mock_redis_client.get.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_get_history_empty(
+        self, history_service: HistoryService, mock_redis_client: Any
+    ) -> None:
+        """Test empty history when neither list nor legacy key exists."""
+        # Arrange
+        mock_redis_client.lrange.return_value = []
+        mock_redis_client.get.return_value = None
+
+        # Act
+        result = await history_service.get_history(self.USER_TG_ID)
+
+        # Assert
+        assert result == []
+        mock_redis_client.get.assert_called_once_with(self.LEGACY_KEY)
+
+    @pytest.mark.asyncio
+    async def test_get_history_migrates_legacy_key(
+        self, history_service: HistoryService, mock_redis_client: Any, mock_pipeline: Any
+    ) -> None:
+        """Test legacy JSON string history is moved into the list."""
+        # Arrange
+        mock_redis_client.lrange.return_value = []
+        mock_redis_client.get.return_value = json.dumps([self.USER_MESSAGE, self.ASSISTANT_MESSAGE])
+
+        # Act
+        result = await history_service.get_history(self.USER_TG_ID)
+
+        # Assert
+        assert result == [self.USER_MESSAGE, self.ASSISTANT_MESSAGE]
+        mock_pipeline.lpush.assert_called_once_with(
+            self.KEY, json.dumps(self.ASSISTANT_MESSAGE), json.dumps(self.USER_MESSAGE)
+        )
+        mock_pipeline.delete.assert_called_once_with(self.LEGACY_KEY)
+        mock_pipeline.execute.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_get_history_loaded_from_archive(
+        self, mock_redis_client: Any, mock_archive: Any
+    ) -> None:
+        """Test expired history is loaded from archive and written back to redis."""
+        # Arrange
+        mock_redis_client.lrange.return_value = []
+        mock_redis_client.get.return_value = None
+        mock_archive.load_history.return_value = [self.USER_MESSAGE, self.ASSISTANT_MESSAGE]
+        history_service = HistoryService(client=mock_redis_client, archive=mock_archive)
+
+        # Act
+        result = await history_service.get_history(self.USER_TG_ID)
+
+        # Assert
+        assert result == [self.USER_MESSAGE, self.ASSISTANT_MESSAGE]
+        mock_archive.load_history.assert_called_once_with(
+            self.USER_TG_ID, settings.context.max_history_length
+        )
+        rehydrate = mock_redis_client.register_script.return_value
+        rehydrate.assert_called_once_with(
+            keys=[self.KEY],
+            args=[
+                settings.context.ttl,
+                json.dumps(self.USER_MESSAGE),
+                json.dumps(self.ASSISTANT_MESSAGE),
+            ],
+        )
+
+    @pytest.mark.asyncio
+    async def test_get_history_new_user_not_written_back(
+        self, mock_redis_client: Any, mock_archive: Any
+    ) -> None:
+        """Test nothing is written to redis when archive has no messages of user."""
+        # Arrange
+        mock_redis_client.lrange.return_value = []
+        mock_redis_client.get.return_value = None
+        mock_archive.load_history.return_value = []
+        history_service = HistoryService(client=mock_redis_client, archive=mock_archive)
+
+        # Act
+        result = await history_service.get_history(self.USER_TG_ID)
+
+        # Assert
+        assert result == []
+        mock_redis_client.register_script.return_value.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_add_messages(
+        self, history_service: HistoryService, mock_redis_client: Any, mock_pipeline: Any
+    ) -> None:
+        """Test messages are appended, trimmed and expired in one transaction."""
+        # Act
+        await history_service.add_messages(
+            self.USER_TG_ID, self.USER_MESSAGE, self.ASSISTANT_MESSAGE
+        )
+
+        # Assert
+        mock_redis_client.pipeline.assert_called_once_with(transaction=True)
+        mock_pipeline.rpush.assert_called_once_with(
+            self.KEY, json.dumps(self.USER_MESSAGE), json.dumps(self.ASSISTANT_MESSAGE)
+        )
+        mock_pipeline.ltrim.assert_called_once_with(
+            self.KEY, -history_service._max_history_length, -1
+        )
+        mock_pipeline.expire.assert_has_calls(
+            [call(self.KEY, history_service._ttl), call(self.SUMMARY_KEY, history_service._ttl)]
+        )
+        mock_pipeline.execute.assert_called_once()
+
+    FOLDED: list[ChatMessage] = [
+        {"role": "user", "content": "Hello"},
+        {"role": "assistant", "content": "Hi!", "tokens": 3},
+    ]
+
+    @pytest.mark.asyncio
+    async def test_fold_history(self, history_service: HistoryService, mock_pipeline: Any) -> None:
+        """Test summary is saved and oldest messages are trimmed in one transaction."""
+        # Arrange
+        mock_pipeline.get.return_value = "Old summary"
+        mock_pipeline.lrange.return_value = [json.dumps(message) for message in self.FOLDED]
+
+        # Act
+        result = await history_service.fold_history(
+            self.USER_TG_ID, "New summary", self.FOLDED, "Old summary"
+        )
+
+        # Assert
+        assert result is True
+        mock_pipeline.watch.assert_called_once_with(self.SUMMARY_KEY, self.KEY)
+        mock_pipeline.lrange.assert_called_once_with(self.KEY, 0, 1)
+        mock_pipeline.set.assert_called_once_with(
+            self.SUMMARY_KEY, "New summary", ex=history_service._ttl
+        )
+        mock_pipeline.ltrim.assert_called_once_with(self.KEY, 2, -1)
+        mock_pipeline.execute.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_fold_history_skips_changed_summary(
+        self, history_service: HistoryService, mock_pipeline: Any
+    ) -> None:
+        """Test history is not folded twice when summary was updated concurrently."""
+        # Arrange
+        mock_pipeline.get.return_value = "Concurrent summary"
+
+        # Act
+        result = await history_service.fold_history(
+            self.USER_TG_ID, "New summary", self.FOLDED, None
+        )
+
+        # Assert
+        assert result is False
+        mock_pipeline.ltrim.assert_not_called()
+        mock_pipeline.execute.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_fold_history_skips_trimmed_history(
+        self, history_service: HistoryService, mock_pipeline: Any
+    ) -> None:
+        """Test unsummarized messages are kept when a full list was trimmed meanwhile."""
+        # Arrange
+        mock_pipeline.get.return_value = None
+        mock_pipeline.lrange.return_value = [
+            json.dumps(self.FOLDED[1]),
+            json.dumps({"role": "user", "content": "Unsummarized"}),
+        ]
+
+        # Act
+        result = await history_service.fold_history(
+            self.USER_TG_ID, "New summary", self.FOLDED, None
+        )
+
+        # Assert
+        assert result is False
+        mock_pipeline.ltrim.assert_not_called()
+        mock_pipeline.execute.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_fold_history_watch_error(
+        self, history_service: HistoryService, mock_pipeline: Any
+    ) -> None:
+        """Test fold is dropped when summary changes before transaction executes."""
+        # Arrange
+        mock_pipeline.get.return_value = None
+        mock_pipeline.lrange.return_value = [json.dumps(message) for message in self.FOLDED]
+        mock_pipeline.execute.side_effect = WatchError
+
+        # Act
+        result = await history_service.fold_history(
+            self.USER_TG_ID, "New summary", self.FOLDED, None
+        )
+
+        # Assert
+        assert result is False
@@ -0,0 +1,164 @@
+from typing import Any
+
+import pytest
+
+from src.core.cache import LocalCache
+from src.schemas.user import UserProfileSchema
+from src.services import ProfileService
+
+
+class TestProfileService:
+    """Test ProfileService class."""
+
+    USER_TG_ID = 123456789
+    EN_LANG = "english"
+    B1_CEFR_LEVEL = "b1"
+
+    @pytest.mark.asyncio
+    async def test_get_user_profile_from_context(
+        self,
+        profile_service: ProfileService,
+        mock_user_repository_protocol: Any,
+        mock_context_service: Any,
+    ) -> None:
+        """Test profile is served from context with one round trip."""
+        # Arrange
+        mock_context_service.get_contexts.return_value = [self.EN_LANG, self.B1_CEFR_LEVEL, "0"]
+
+        # Act
+        result = await profile_service.get_user_profile(self.USER_TG_ID)
+
+        # Assert
+        assert result == UserProfileSchema(language=self.EN_LANG, cefr_level=self.B1_CEFR_LEVEL)
+        mock_context_service.get_contexts.assert_called_once_with(
+            prefixes=ProfileService.PREFIXES, user_tg_id=self.USER_TG_ID
+        )
+        mock_user_repository_protocol.get_user_profile.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_get_user_profile_from_database(
+        self,
+        profile_service: ProfileService,
+        mock_user_repository_protocol: Any,
+        mock_context_service: Any,
+    ) -> None:
+        """Test profile falls back to database and repopulates context."""
+        # Arrange
+        mock_context_service.get_contexts.return_value = [self.EN_LANG, None, None]
+        mock_user_repository_protocol.get_user_profile.return_value = UserProfileSchema(
+            language=self.EN_LANG, cefr_level=self.B1_CEFR_LEVEL
+        )
+
+        # Act
+        result = await profile_service.get_user_profile(self.USER_TG_ID)
+
+        # Assert
+        assert result == UserProfileSchema(language=self.EN_LANG, cefr_level=self.B1_CEFR_LEVEL)
+        mock_user_repository_protocol.get_user_profile.assert_called_once_with(
+            user_tg_id=self.USER_TG_ID
+        )
+        mock_context_service.set_contexts.assert_called_once_with(
+            user_tg_id=self.USER_TG_ID,
+            data={
+                "user_language": self.EN_LANG,
+                "user_cefr_level": self.B1_CEFR_LEVEL,
+                "user_is_admin": "0",
+            },
+        )
+
+    @pytest.mark.asyncio
+    async def test_get_user_profile_without_cefr_level(
+        self,
+        profile_service: ProfileService,
+        mock_user_repository_protocol: Any,
+        mock_context_service: Any,
+    ) -> None:
+        """Test only known values are written back to context."""
+        # Arrange
+        mock_context_service.get_contexts.return_value = [None, None, None]
+        mock_user_repository_protocol.get_user_profile.return_value = UserProfileSchema(
+            language=self.EN_LANG
+        )
+
+        # Act
+        result = await profile_service.get_user_profile(self.USER_TG_ID)
+
+        # Assert
+        assert result == UserProfileSchema(language=self.EN_LANG)
+        mock_context_service.set_contexts.assert_called_once_with(
+            user_tg_id=self.USER_TG_ID, data={"user_language": self.EN_LANG, "user_is_admin": "0"}
+        )
+
+    @pytest.mark.asyncio
+    async def test_get_user_profile_admin_from_context(
+        self, profile_service: ProfileService, mock_context_service: Any
+    ) -> None:
+        """Test admin role is read from context."""
+        # Arrange
+        mock_context_service.get_contexts.return_value = [self.EN_LANG, self.B1_CEFR_LEVEL, "1"]
+
+        # Act
+        result = await profile_service.get_user_profile(self.USER_TG_ID)
+
+        # Assert
+        assert result is not None
+        assert result.is_admin is True
+
+    @pytest.mark.asyncio
+    async def test_get_user_profile_user_not_found(
+        self,
+        profile_service: ProfileService,
+        mock_user_repository_protocol: Any,
+        mock_context_service: Any,
+    ) -> None:
+        """Test profile is none when user not found."""
+        # Arrange
+        mock_context_service.get_contexts.return_value = [None, None, None]
+        mock_user_repository_protocol.get_user_profile.return_value = None
+
+        # Act
+        result = await profile_service.get_user_profile(self.USER_TG_ID)
+
+        # Assert
+        assert result is None
+        mock_context_service.set_contexts.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_get_user_profile_from_cache(
+        self,
+        profile_service: ProfileService,
+        mock_context_service: Any,
+        profile_cache: LocalCache[int, UserProfileSchema],
+    ) -> None:
+        """Test cached profile skips context and database."""
+        # Arrange
+        mock_context_service.get_contexts.return_value = [self.EN_LANG, self.B1_CEFR_LEVEL, "0"]
+        await profile_service.get_user_profile(self.USER_TG_ID)
+
+        # Act
+        result = await profile_service.get_user_profile(self.USER_TG_ID)
+
+        # Assert
+        assert result == UserProfileSchema(language=self.EN_LANG, cefr_level=self.B1_CEFR_LEVEL)
+        mock_context_service.get_contexts.assert_called_once()
+        assert profile_cache.hits == 1
+
+    @pytest.mark.asyncio
+    async def test_invalidate_user_profile(
+        self,
+        profile_service: ProfileService,
+        mock_context_service: Any,
+        profile_cache: LocalCache[int, UserProfileSchema],
+    ) -> None:
+        """Test invalidation drops local entry and broadcasts it."""
+        # Arrange
+        profile_cache.set(self.USER_TG_ID, UserProfileSchema(language=self.EN_LANG))
+
+        # Act
+        await profile_service.invalidate_user_profile(self.USER_TG_ID)
+
+        # Assert
+        assert profile_cache.get(self.USER_TG_ID) is None
+        mock_context_service.publish.assert_called_once_with(
+            channel="cache_invalidation", message=str(self.USER_TG_ID)
+        )
@@ -0,0 +1,299 @@
+from datetime import UTC, datetime, time
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.core.database import UnitOfWork
+from src.services import ReminderScheduler, ReminderService
+from src.services.reminder import get_next_due, restore_reminders
+
+NOW = datetime(2026, 3, 28, 12, 0, tzinfo=UTC).timestamp()
+
+
+@pytest.fixture
+def mock_claim() -> Any:
+    """Create mocked claim script returning three due users."""
+    return AsyncMock(return_value=["1", "2", "3"])
+
+
+@pytest.fixture
+def mock_pipeline() -> Any:
+    """Create mocked redis pipeline."""
+    pipe = MagicMock()
+    pipe.execute = AsyncMock()
+    return pipe
+
+
+@pytest.fixture
+def mock_redis_client(mock_claim: Any, mock_pipeline: Any) -> Any:
+    """Create mocked redis client with schedules of claimed users."""
+    client = AsyncMock()
+    client.register_script = MagicMock(return_value=mock_claim)
+    client.pipeline = MagicMock()
+    client.pipeline.return_value.__aenter__.return_value = mock_pipeline
+    client.hmget.return_value = ["19:30 Europe/Moscow", "08:00 UTC", "08:00 UTC"]
+    client.mget.return_value = [None, None, "1"]
+    return client
+
+
+@pytest.fixture
+def scheduler(mock_redis_client: Any) -> ReminderScheduler:
+    """Create ReminderScheduler with mocked redis."""
+    return ReminderScheduler(
+        client=mock_redis_client, batch_size=3, poll_interval=1, lease=300, inactivity=72000
+    )
+
+
+class TestGetNextDue:
+    """Test get_next_due function."""
+
+    def test_later_today(self) -> None:
+        """Test reminder time not passed yet is due today in user timezone."""
+        # Act
+        due = get_next_due(time(19, 30), "Europe/Moscow", NOW)
+
+        # Assert
+        assert due == datetime(2026, 3, 28, 16, 30, tzinfo=UTC).timestamp()
+
+    def test_passed_today(self) -> None:
+        """Test passed reminder time is due tomorrow across daylight saving change."""
+        # Act
+        due = get_next_due(time(8, 0), "Europe/Berlin", NOW)
+
+        # Assert
+        assert due == datetime(2026, 3, 29, 6, 0, tzinfo=UTC).timestamp()
+
+
+class TestReminderScheduler:
+    """Test ReminderScheduler class."""
+
+    @pytest.mark.asyncio
+    async def test_schedule(self, scheduler: ReminderScheduler, mock_pipeline: Any) -> None:
+        """Test schedule is saved and reminder added by due time."""
+        # Act
+        with patch("src.services.reminder.now", return_value=NOW):
+            due = await scheduler.schedule(42, time(19, 30), "Europe/Moscow")
+
+        # Assert
+        mock_pipeline.hset.assert_called_once_with(
+            ReminderScheduler.SCHEDULES_KEY, "42", "19:30 Europe/Moscow"
+        )
+        mock_pipeline.zadd.assert_called_once_with(ReminderScheduler.KEY, {"42": due})
+        mock_pipeline.execute.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_process_due_sends_to_inactive_and_reschedules(
+        self, scheduler: ReminderScheduler, mock_redis_client: Any, mock_claim: Any
+    ) -> None:
+        """Test inactive users are reminded and every claimed reminder moves to next day."""
+        # Arrange
+        send = AsyncMock(return_value=True)
+
+        # Act
+        with patch("src.services.reminder.now", return_value=NOW):
+            claimed = await scheduler.process_due(send)
+
+        # Assert
+        assert claimed == 3
+        assert mock_claim.call_args.kwargs["args"] == [NOW, 3, NOW + 300]
+        assert [call.args for call in send.call_args_list] == [(1,), (2,)]
+        assert (scheduler.sent, scheduler.skipped) == (2, 1)
+        mock_redis_client.zadd.assert_called_once_with(
+            ReminderScheduler.KEY,
+            {
+                "1": datetime(2026, 3, 28, 16, 30, tzinfo=UTC).timestamp(),
+                "2": datetime(2026, 3, 29, 8, 0, tzinfo=UTC).timestamp(),
+                "3": datetime(2026, 3, 29, 8, 0, tzinfo=UTC).timestamp(),
+            },
+        )
+
+    @pytest.mark.asyncio
+    async def test_process_due_drops_blocked_and_removed(
+        self, scheduler: ReminderScheduler, mock_redis_client: Any, mock_pipeline: Any
+    ) -> None:
+        """Test reminders of users who blocked bot or removed schedule are dropped."""
+        # Arrange
+        mock_redis_client.hmget.return_value = ["19:30 Europe/Moscow", None, "08:00 UTC"]
+        send = AsyncMock(return_value=False)
+
+        # Act
+        await scheduler.process_due(send)
+
+        # Assert
+        mock_pipeline.zrem.assert_called_once_with(ReminderScheduler.KEY, "1", "2")
+        assert list(mock_redis_client.zadd.call_args.args[1]) == ["3"]
+
+    @pytest.mark.asyncio
+    async def test_failed_send_stays_scheduled(
+        self, scheduler: ReminderScheduler, mock_redis_client: Any, mock_pipeline: Any
+    ) -> None:
+        """Test reminder failing with unexpected error is kept for next day."""
+        # Arrange
+        send = AsyncMock(side_effect=RuntimeError("Network error"))
+
+        # Act
+        await scheduler.process_due(send)
+
+        # Assert
+        mock_pipeline.zrem.assert_not_called()
+        assert list(mock_redis_client.zadd.call_args.args[1]) == ["1", "2", "3"]
+
+    @pytest.mark.asyncio
+    async def test_process_due_nothing_due(
+        self, scheduler: ReminderScheduler, mock_redis_client: Any, mock_claim: Any
+    ) -> None:
+        """Test nothing is read or sent when no reminder is due."""
+        # Arrange
+        mock_claim.return_value = []
+        send = AsyncMock()
+
+        # Act
+        claimed = await scheduler.process_due(send)
+
+        # Assert
+        assert claimed == 0
+        send.assert_not_called()
+        mock_redis_client.hmget.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_restore_keeps_newer_schedules(
+        self, scheduler: ReminderScheduler, mock_pipeline: Any
+    ) -> None:
+        """Test restored reminders never overwrite ones scheduled meanwhile."""
+        # Act
+        with patch("src.services.reminder.now", return_value=NOW):
+            await scheduler.restore({42: (time(19, 30), "Europe/Moscow")})
+
+        # Assert
+        mock_pipeline.hsetnx.assert_called_once_with(
+            ReminderScheduler.SCHEDULES_KEY, "42", "19:30 Europe/Moscow"
+        )
+        mock_pipeline.zadd.assert_called_once_with(
+            ReminderScheduler.KEY,
+            {"42": datetime(2026, 3, 28, 16, 30, tzinfo=UTC).timestamp()},
+            nx=True,
+        )
+
+
+class TestRestoreReminders:
+    """Test restore_reminders function."""
+
+    @pytest.mark.asyncio
+    async def test_existing_schedule_not_restored(self) -> None:
+        """Test users table is not scanned while redis holds reminders."""
+        # Arrange
+        scheduler = AsyncMock()
+        scheduler.is_empty.return_value = False
+
+        # Act
+        with patch("src.services.reminder.UserRepository") as repository_class:
+            restored = await restore_reminders(scheduler, AsyncMock(), batch_size=2)
+
+        # Assert
+        assert restored == 0
+        repository_class.assert_not_called()
+        scheduler.restore.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_lost_schedule_restored_page_by_page(self) -> None:
+        """Test reminders are restored by id pages, missing timezone gets the default."""
+        # Arrange
+        scheduler = AsyncMock()
+        scheduler.is_empty.return_value = True
+        repository = AsyncMock()
+        repository.get_user_reminders.side_effect = [
+            [(1, 100, time(8, 0), "UTC"), (2, 200, time(9, 0), None)],
+            [(5, 500, time(19, 30), "Europe/Berlin")],
+            [],
+        ]
+
+        # Act
+        with (
+            patch("src.services.reminder.UserRepository", return_value=repository),
+            patch("src.services.reminder.settings") as mock_settings,
+        ):
+            mock_settings.reminders.default_timezone = "Europe/Moscow"
+            restored = await restore_reminders(scheduler, AsyncMock(), batch_size=2)
+
+        # Assert
+        assert restored == 3
+        assert [call.args for call in repository.get_user_reminders.call_args_list] == [
+            (0, 2),
+            (2, 2),
+            (5, 2),
+        ]
+        assert [call.args[0] for call in scheduler.restore.call_args_list] == [
+            {100: (time(8, 0), "UTC"), 200: (time(9, 0), "Europe/Moscow")},
+            {500: (time(19, 30), "Europe/Berlin")},
+        ]
+
+
+class TestReminderService:
+    """Test ReminderService class."""
+
+    @pytest.mark.asyncio
+    async def test_set_and_disable_reminder(self) -> None:
+        """Test reminder is saved in database, then scheduled and removed once committed."""
+        # Arrange
+        repository = AsyncMock()
+        repository.set_user_reminder.return_value = True
+        scheduler = AsyncMock()
+        unit_of_work = UnitOfWork(MagicMock())
+        service = ReminderService(
+            user_repository=repository, scheduler=scheduler, unit_of_work=unit_of_work
+        )
+
+        # Act
+        assert await service.set_reminder(42, time(19, 30), "Europe/Moscow")
+        await service.disable_reminder(42)
+        scheduler.schedule.assert_not_called()
+        await unit_of_work.commit()
+
+        # Assert
+        assert [call.kwargs for call in repository.set_user_reminder.call_args_list] == [
+            {"reminder_time": time(19, 30), "timezone": "Europe/Moscow", "user_tg_id": 42},
+            {"reminder_time": None, "timezone": None, "user_tg_id": 42},
+        ]
+        scheduler.schedule.assert_called_once_with(42, time(19, 30), "Europe/Moscow")
+        scheduler.unschedule.assert_called_once_with(42)
+
+    @pytest.mark.asyncio
+    async def test_unknown_user_not_scheduled(self) -> None:
+        """Test reminder of user missing in database is not scheduled."""
+        # Arrange
+        repository = AsyncMock()
+        repository.set_user_reminder.return_value = False
+        scheduler = AsyncMock()
+        unit_of_work = UnitOfWork(MagicMock())
+        service = ReminderService(
+            user_repository=repository, scheduler=scheduler, unit_of_work=unit_of_work
+        )
+
+        # Act
+        result = await service.set_reminder(42, time(19, 30), "Europe/Moscow")
+        await unit_of_work.commit()
+
+        # Assert
+        assert not result
+        scheduler.schedule.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_rolled_back_reminder_not_scheduled(self) -> None:
+        """Test schedule is unchanged when the reminder update is rolled back."""
+        # Arrange
+        repository = AsyncMock()
+        repository.set_user_reminder.return_value = True
+        scheduler = AsyncMock()
+        unit_of_work = UnitOfWork(MagicMock())
+        service = ReminderService(
+            user_repository=repository, scheduler=scheduler, unit_of_work=unit_of_work
+        )
+
+        # Act
+        await service.set_reminder(42, time(19, 30), "Europe/Moscow")
+        await unit_of_work.rollback()
+        await unit_of_work.commit()
+
+        # Assert
+        scheduler.schedule.assert_not_called()
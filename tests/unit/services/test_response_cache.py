@@ -0,0 +1,121 @@
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.services import ResponseCacheService
+
+
+@pytest.fixture
+def mock_pipeline() -> Any:
+    """Create mocked redis pipeline."""
+    pipeline = MagicMock()
+    pipeline.execute = AsyncMock()
+    return pipeline
+
+
+@pytest.fixture
+def mock_redis_client(mock_pipeline: Any) -> Any:
+    """Create mocked redis client."""
+    client = AsyncMock()
+    client.pipeline = MagicMock()
+    client.pipeline.return_value.__aenter__.return_value = mock_pipeline
+    return client
+
+
+@pytest.fixture
+def response_cache(mock_redis_client: Any) -> ResponseCacheService:
+    """Create enabled ResponseCacheService with mocked redis."""
+    with patch("src.services.response_cache.settings") as mock_settings:
+        mock_settings.response_cache.enabled = True
+        mock_settings.response_cache.ttl = 3600
+        mock_settings.response_cache.max_entries = 2
+        mock_settings.response_cache.max_temperature = 0.3
+        mock_settings.response_cache.max_history_length = 1
+        return ResponseCacheService(client=mock_redis_client)
+
+
+class TestResponseCacheService:
+    """Test ResponseCacheService class."""
+
+    MODEL = "model"
+    SYSTEM_MESSAGE = {"role": "system", "content": "You are a teacher."}
+
+    def test_get_key_normalizes_history(self, response_cache: ResponseCacheService) -> None:
+        """Test messages differing in case and whitespace share cache key."""
+        # Act
+        key = response_cache.get_key(
+            self.MODEL, 0.0, [self.SYSTEM_MESSAGE, {"role": "user", "content": " Hi  there"}]
+        )
+        same_key = response_cache.get_key(
+            self.MODEL, 0.0, [self.SYSTEM_MESSAGE, {"role": "user", "content": "hi there"}]
+        )
+        other_key = response_cache.get_key(
+            self.MODEL, 0.2, [self.SYSTEM_MESSAGE, {"role": "user", "content": "hi there"}]
+        )
+
+        # Assert
+        assert key is not None
+        assert key.startswith("response_cache:")
+        assert key == same_key
+        assert key != other_key
+
+    def test_get_key_skips_hot_temperature(self, response_cache: ResponseCacheService) -> None:
+        """Test responses sampled above temperature threshold are not cached."""
+        # Act
+        result = response_cache.get_key(
+            self.MODEL, 0.7, [self.SYSTEM_MESSAGE, {"role": "user", "content": "Hi"}]
+        )
+
+        # Assert
+        assert result is None
+
+    def test_get_key_skips_long_history(self, response_cache: ResponseCacheService) -> None:
+        """Test turns with history beyond the window are not cached."""
+        # Act
+        result = response_cache.get_key(
+            self.MODEL,
+            0.0,
+            [
+                self.SYSTEM_MESSAGE,
+                {"role": "assistant", "content": "Hello!"},
+                {"role": "user", "content": "Hi"},
+            ],
+        )
+
+        # Assert
+        assert result is None
+
+    @pytest.mark.asyncio
+    async def test_get_counts_hits_and_misses(
+        self, response_cache: ResponseCacheService, mock_redis_client: Any
+    ) -> None:
+        """Test lookups update hit rate."""
+        # Arrange
+        mock_redis_client.get.side_effect = ["Hello!", None]
+
+        # Act
+        hit = await response_cache.get("response_cache:hit")
+        miss = await response_cache.get("response_cache:miss")
+
+        # Assert
+        assert hit == "Hello!"
+        assert miss is None
+        assert response_cache.hit_rate == 0.5
+
+    @pytest.mark.asyncio
+    async def test_set_evicts_oldest_entries(
+        self, response_cache: ResponseCacheService, mock_redis_client: Any, mock_pipeline: Any
+    ) -> None:
+        """Test oldest entries are evicted above size limit."""
+        # Arrange
+        mock_pipeline.execute.return_value = [True, 1, 0, 3]
+        mock_redis_client.zpopmin.return_value = [("response_cache:old", 1.0)]
+
+        # Act
+        await response_cache.set("response_cache:new", "Hello!")
+
+        # Assert
+        mock_pipeline.set.assert_called_once_with("response_cache:new", "Hello!", ex=3600)
+        mock_redis_client.zpopmin.assert_called_once_with(ResponseCacheService.INDEX_KEY, 1)
+        mock_redis_client.delete.assert_called_once_with("response_cache:old")
@@ -1,4 +1,5 @@
 from typing import Any
+from unittest.mock import patch
 
 import pytest
 
@@ -13,87 +14,134 @@ class TestStartService:
 
     @pytest.mark.asyncio
     async def test_register_new_user(
-        self, start_service: StartService, mock_user_repository_protocol: Any, fake_user: UserSchema
+        self,
+        start_service: StartService,
+        mock_user_repository_protocol: Any,
+        mock_context_service: Any,
+        mock_unit_of_work: Any,
+        fake_user: UserSchema,
     ) -> None:
-        """Test registering new user."""
+        """Test registering new user marks it known only after commit."""
         # Arrange
-        mock_user_repository_protocol.find_by_user_tg_id.return_value = None
-        mock_user_repository_protocol.add_new_user.return_value = self.USER_ID
+        mock_context_service.is_member.return_value = False
+        mock_user_repository_protocol.upsert_user.return_value = self.USER_ID
 
         # Act
         user_id = await start_service.register_user(fake_user)
 
         # Assert
         assert user_id == self.USER_ID
-        mock_user_repository_protocol.find_by_user_tg_id.assert_called_once_with(fake_user.tg_id)
-        mock_user_repository_protocol.add_new_user.assert_called_once_with(fake_user)
+        mock_user_repository_protocol.upsert_user.assert_called_once_with(fake_user)
+        mock_context_service.add_member.assert_not_called()
+        callback = mock_unit_of_work.after_commit.call_args.args[0]
+        await callback()
+        mock_context_service.add_member.assert_called_once_with(
+            key=StartService.KNOWN_USERS_KEY, member=str(fake_user.tg_id)
+        )
 
     @pytest.mark.asyncio
     async def test_register_existing_user(
-        self, start_service: StartService, mock_user_repository_protocol: Any, fake_user: UserSchema
+        self,
+        start_service: StartService,
+        mock_user_repository_protocol: Any,
+        mock_context_service: Any,
+        mock_unit_of_work: Any,
+        fake_user: UserSchema,
     ) -> None:
-        """Test registering existing user."""
+        """Test registering existing user missing from known users."""
         # Arrange
-        mock_user_repository_protocol.find_by_user_tg_id.return_value = fake_user
+        mock_context_service.is_member.return_value = False
+        mock_user_repository_protocol.upsert_user.return_value = None
 
         # Act
         user_tg_id = await start_service.register_user(fake_user)
 
         # Assert
         assert user_tg_id == fake_user.tg_id
-        mock_user_repository_protocol.find_by_user_tg_id.assert_called_once_with(fake_user.tg_id)
-        mock_user_repository_protocol.add_new_user.assert_not_called()
+        mock_user_repository_protocol.upsert_user.assert_called_once_with(fake_user)
+        mock_unit_of_work.after_commit.assert_called_once()
 
     @pytest.mark.asyncio
-    async def test_register_user_without_optional_fields(
+    async def test_register_known_user_skips_database(
         self,
         start_service: StartService,
         mock_user_repository_protocol: Any,
-        fake_user_without_optional: UserSchema,
+        mock_context_service: Any,
+        fake_user: UserSchema,
     ) -> None:
-        """Test registering user without optional fields."""
+        """Test known user is not written to database again."""
         # Arrange
-        mock_user_repository_protocol.find_by_user_tg_id.return_value = None
-        mock_user_repository_protocol.add_new_user.return_value = self.USER_ID
+        mock_context_service.is_member.return_value = True
 
         # Act
-        user_id = await start_service.register_user(fake_user_without_optional)
+        user_tg_id = await start_service.register_user(fake_user)
 
         # Assert
-        assert user_id == self.USER_ID
-        mock_user_repository_protocol.find_by_user_tg_id.assert_called_once_with(
-            fake_user_without_optional.tg_id
-        )
-        mock_user_repository_protocol.add_new_user.assert_called_once_with(
-            fake_user_without_optional
+        assert user_tg_id == fake_user.tg_id
+        mock_context_service.is_member.assert_called_once_with(
+            key=StartService.KNOWN_USERS_KEY, member=str(fake_user.tg_id)
         )
+        mock_user_repository_protocol.upsert_user.assert_not_called()
 
     @pytest.mark.asyncio
-    async def test_register_when_find_returns_user_without_optional_fields(
+    async def test_register_user_with_filter_disabled(
         self,
         start_service: StartService,
         mock_user_repository_protocol: Any,
+        mock_context_service: Any,
+        mock_unit_of_work: Any,
+        fake_user: UserSchema,
+    ) -> None:
+        """Test registration always upserts when known users filter is disabled."""
+        # Arrange
+        mock_user_repository_protocol.upsert_user.return_value = self.USER_ID
+
+        with patch("src.services.start.settings") as mock_settings:
+            mock_settings.context.known_users_filter = False
+
+            # Act
+            user_id = await start_service.register_user(fake_user)
+
+        # Assert
+        assert user_id == self.USER_ID
+        mock_context_service.is_member.assert_not_called()
+        mock_unit_of_work.after_commit.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_register_user_without_optional_fields(
+        self,
+        start_service: StartService,
+        mock_user_repository_protocol: Any,
+        mock_context_service: Any,
         fake_user_without_optional: UserSchema,
     ) -> None:
-        """Test registration when find returns user without optional fields."""
+        """Test registering user without optional fields."""
         # Arrange
-        mock_user_repository_protocol.find_by_user_tg_id.return_value = fake_user_without_optional
+        mock_context_service.is_member.return_value = False
+        mock_user_repository_protocol.upsert_user.return_value = self.USER_ID
 
         # Act
-        user_tg_id = await start_service.register_user(fake_user_without_optional)
+        user_id = await start_service.register_user(fake_user_without_optional)
 
         # Assert
-        assert user_tg_id == fake_user_without_optional.tg_id
-        mock_user_repository_protocol.find_by_user_tg_id.assert_called_once_with(
-            fake_user_without_optional.tg_id
+        assert user_id == self.USER_ID
+        mock_user_repository_protocol.upsert_user.assert_called_once_with(
+            fake_user_without_optional
         )
-        mock_user_repository_protocol.add_new_user.assert_not_called()
 
     @pytest.mark.asyncio
-    async def test_service_initialization(self, mock_user_repository_protocol: Any) -> None:
+    async def test_service_initialization(
+        self, mock_user_repository_protocol: Any, mock_context_service: Any, mock_unit_of_work: Any
+    ) -> None:
         """Test that service initializes correctly."""
         # Act
-        service = StartService(user_repository=mock_user_repository_protocol)
+        service = StartService(
+            user_repository=mock_user_repository_protocol,
+            context_service=mock_context_service,
+            unit_of_work=mock_unit_of_work,
+        )
 
         # Assert
         assert service._user_repository == mock_user_repository_protocol
+        assert service._context_service == mock_context_service
+        assert service._unit_of_work == mock_unit_of_work
@@ -0,0 +1,140 @@
+import asyncio
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.services import SummaryService
+from src.services.history import ChatMessage
+
+
+@pytest.fixture
+def mock_completions() -> Any:
+    """Create mocked chat completions returning summary."""
+    completions = AsyncMock()
+    completions.create.return_value = SimpleNamespace(
+        choices=[SimpleNamespace(message=SimpleNamespace(content=" New summary "))]
+    )
+    return completions
+
+
+@pytest.fixture
+def mock_history_service() -> Any:
+    """Create mocked history service."""
+    return AsyncMock()
+
+
+@pytest.fixture
+def mock_gateway() -> Any:
+    """Create mocked inference gateway granting every slot."""
+    gateway = MagicMock()
+    gateway.slot.return_value = AsyncMock()
+    return gateway
+
+
+@pytest.fixture
+def summary_service(
+    mock_completions: Any, mock_history_service: Any, mock_gateway: Any
+) -> SummaryService:
+    """Create SummaryService folding history over four messages and keeping two."""
+    with patch("src.services.summary.settings") as mock_settings:
+        mock_settings.assistant.summary_threshold = 4
+        mock_settings.assistant.summary_keep = 2
+        return SummaryService(
+            completions=mock_completions,
+            history_service=mock_history_service,
+            gateway=mock_gateway,
+        )
+
+
+class TestSummaryService:
+    """Test SummaryService class."""
+
+    USER_TG_ID = 123456789
+    EN_LANG = "english"
+    HISTORY: list[ChatMessage] = [
+        {"role": "user", "content": "I goed home", "tokens": 7},
+        {"role": "assistant", "content": "I went home!", "tokens": 7},
+        {"role": "user", "content": "I like football", "tokens": 8},
+        {"role": "assistant", "content": "Great!", "tokens": 6},
+        {"role": "user", "content": "Yes", "tokens": 5},
+    ]
+
+    @pytest.mark.asyncio
+    async def test_summarize_folds_oldest_messages(
+        self,
+        summary_service: SummaryService,
+        mock_completions: Any,
+        mock_history_service: Any,
+    ) -> None:
+        """Test oldest messages are summarized with previous summary and folded."""
+        # Arrange
+        mock_history_service.get_history.return_value = self.HISTORY
+        mock_history_service.get_summary.return_value = "Old summary"
+
+        # Act
+        await summary_service.summarize(self.USER_TG_ID, self.EN_LANG)
+
+        # Assert
+        prompt = mock_completions.create.call_args.kwargs["messages"][1]
+        assert "Old summary" in prompt["content"]
+        assert "Student: I goed home" in prompt["content"]
+        assert "Student: Yes" not in prompt["content"]
+        mock_history_service.fold_history.assert_called_once_with(
+            self.USER_TG_ID, "New summary", self.HISTORY[:3], "Old summary"
+        )
+
+    @pytest.mark.asyncio
+    async def test_summarize_skips_short_history(
+        self,
+        summary_service: SummaryService,
+        mock_completions: Any,
+        mock_history_service: Any,
+    ) -> None:
+        """Test history within threshold is not summarized."""
+        # Arrange
+        mock_history_service.get_history.return_value = self.HISTORY[:4]
+
+        # Act
+        await summary_service.summarize(self.USER_TG_ID, self.EN_LANG)
+
+        # Assert
+        mock_completions.create.assert_not_called()
+        mock_history_service.fold_history.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_summarize_keeps_history_on_error(
+        self,
+        summary_service: SummaryService,
+        mock_completions: Any,
+        mock_history_service: Any,
+    ) -> None:
+        """Test failed summarization is logged and leaves history untouched."""
+        # Arrange
+        mock_history_service.get_history.return_value = self.HISTORY
+        mock_completions.create.side_effect = RuntimeError
+
+        # Act
+        await summary_service.summarize(self.USER_TG_ID, self.EN_LANG)
+
+        # Assert
+        mock_history_service.fold_history.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_schedule_runs_once_per_user(
+        self, summary_service: SummaryService, mock_history_service: Any
+    ) -> None:
+        """Test summarization is started in background once per user at a time."""
+        # Arrange
+        mock_history_service.get_history.return_value = self.HISTORY
+
+        # Act
+        summary_service.schedule(self.USER_TG_ID, self.EN_LANG, 5)
+        summary_service.schedule(self.USER_TG_ID, self.EN_LANG, 5)
+        summary_service.schedule(self.USER_TG_ID + 1, self.EN_LANG, 4)
+        await asyncio.sleep(0)
+        await summary_service.close()
+
+        # Assert
+        mock_history_service.fold_history.assert_called_once()
@@ -0,0 +1,148 @@
+from collections.abc import Iterator
+from typing import Any
+from unittest.mock import MagicMock, call, patch
+
+import pytest
+from pydantic import SecretStr
+
+from src import main
+from src.core.config import WebhookSettings
+
+
+@pytest.fixture
+def webhook_settings() -> WebhookSettings:
+    """Create webhook settings."""
+    return WebhookSettings(url="https://bot.example.com", secret_token=SecretStr("secret"))
+
+
+@pytest.fixture
+def mock_app_setup() -> Iterator[dict[str, Any]]:
+    """Patch bot, dispatcher and aiohttp server used by webhook worker."""
+    with (
+        patch("src.main.setup_logging"),
+        patch("src.main.create_bot") as create_bot,
+        patch("src.main.create_dispatcher") as create_dispatcher,
+        patch("src.main.SimpleRequestHandler") as handler,
+        patch("src.main.setup_application"),
+        patch("src.main.web.run_app") as run_app,
+    ):
+        yield {
+            "bot": create_bot.return_value,
+            "dp": create_dispatcher.return_value,
+            "handler": handler,
+            "run_app": run_app,
+        }
+
+
+class TestMain:
+    """Test main function."""
+
+    def test_polling_mode(self) -> None:
+        """Test polling mode runs long polling."""
+        # Arrange
+        with (
+            patch("src.main.setup_logging"),
+            patch("src.main.settings") as mock_settings,
+            patch("src.main.run_polling", MagicMock()) as run_polling,
+            patch("src.main.asyncio.run") as run,
+            patch("src.main.run_webhook") as run_webhook,
+        ):
+            mock_settings.bot.mode = "polling"
+
+            # Act
+            main.main()
+
+        # Assert
+        run.assert_called_once_with(run_polling.return_value)
+        run_webhook.assert_not_called()
+
+    def test_webhook_mode(self, webhook_settings: WebhookSettings) -> None:
+        """Test webhook mode runs webhook server with webhook settings."""
+        # Arrange
+        with (
+            patch("src.main.setup_logging"),
+            patch("src.main.settings") as mock_settings,
+            patch("src.main.asyncio.run") as run,
+            patch("src.main.run_webhook") as run_webhook,
+        ):
+            mock_settings.bot.mode = "webhook"
+            mock_settings.bot.webhook = webhook_settings
+
+            # Act
+            main.main()
+
+        # Assert
+        run_webhook.assert_called_once_with(webhook_settings)
+        run.assert_not_called()
+
+
+class TestRunWebhook:
+    """Test run_webhook function."""
+
+    def test_single_worker_runs_in_process(self, webhook_settings: WebhookSettings) -> None:
+        """Test one worker runs in current process and registers webhook."""
+        # Arrange
+        with (
+            patch("src.main.run_webhook_worker") as run_webhook_worker,
+            patch("src.main.get_context") as get_context,
+        ):
+            # Act
+            main.run_webhook(webhook_settings)
+
+        # Assert
+        run_webhook_worker.assert_called_once_with(webhook_settings, register_webhook=True)
+        get_context.assert_not_called()
+
+    def test_workers_spawned(self, webhook_settings: WebhookSettings) -> None:
+        """Test worker processes are spawned, only first registers webhook."""
+        # Arrange
+        webhook_settings.workers = 3
+
+        with patch("src.main.get_context") as get_context:
+            process = get_context.return_value.Process
+
+            # Act
+            main.run_webhook(webhook_settings)
+
+        # Assert
+        get_context.assert_called_once_with("spawn")
+        assert process.call_args_list == [
+            call(target=main.run_webhook_worker, args=(webhook_settings, True)),
+            call(target=main.run_webhook_worker, args=(webhook_settings, False)),
+            call(target=main.run_webhook_worker, args=(webhook_settings, False)),
+        ]
+        assert process.return_value.start.call_count == 3
+        assert process.return_value.join.call_count == 3
+
+
+class TestRunWebhookWorker:
+    """Test run_webhook_worker function."""
+
+    def test_single_worker_does_not_reuse_port(
+        self, webhook_settings: WebhookSettings, mock_app_setup: dict[str, Any]
+    ) -> None:
+        """Test single worker serves webhook path and registers webhook on startup."""
+        # Act
+        main.run_webhook_worker(webhook_settings, register_webhook=True)
+
+        # Assert
+        mock_app_setup["dp"].startup.register.assert_called_once()
+        assert mock_app_setup["handler"].call_args.kwargs["secret_token"] == "secret"
+        mock_app_setup["handler"].return_value.register.assert_called_once()
+        assert mock_app_setup["run_app"].call_args.kwargs["reuse_port"] is False
+
+    def test_workers_reuse_port(
+        self, webhook_settings: WebhookSettings, mock_app_setup: dict[str, Any]
+    ) -> None:
+        """Test worker of several shares port and leaves webhook registration to first."""
+        # Arrange
+        webhook_settings.workers = 2
+
+        # Act
+        main.run_webhook_worker(webhook_settings, register_webhook=False)
+
+        # Assert
+        mock_app_setup["dp"].startup.register.assert_not_called()
+        run_app = mock_app_setup["run_app"]
+        assert run_app.call_args.kwargs["port"] == webhook_settings.port
+        assert run_app.call_args.kwargs["reuse_port"] is True